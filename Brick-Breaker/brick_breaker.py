@@ -1,71 +1,37 @@
 import pygame
 import sys
+import argparse
 import random
+import math
+import heapq
+from array import array
 from datetime import datetime
 from pygame import mixer
-import json
 import os
-import platform
 
-# Initialize pygame early for sound/mixer
-pygame.init()
-pygame.mixer.init()
+# Shared arcade runtime lives alongside the game folders
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from retro_arcade.audio import AudioManager
+from retro_arcade.credits import run_credits
+from retro_arcade.display import open_window
+from retro_arcade.fonts import get_font
+from retro_arcade.leaderboard import LeaderboardStore
+from retro_arcade.levels import LevelPack
+from retro_arcade.logos import LogoScreen
+from retro_arcade.overlays import dim
+from retro_arcade.paths import data_path, writable_path
+from retro_arcade.prewarm import wait_for_launch
+from retro_arcade.scene import Scene, SceneStack, run_scene
 
 # Determine the correct paths for data files
 def get_data_path(filename):
-    # If we're running as a PyInstaller bundle
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    
-    return os.path.join(base_path, filename)
+    return data_path(__file__, filename)
 
 def get_writable_path(filename):
-    # Get appropriate writable location based on OS
-    if platform.system() == "Windows":
-        appdata = os.getenv('APPDATA')
-        save_dir = os.path.join(appdata, 'BrickBreaker')
-    else:  # Linux/Mac
-        home = os.path.expanduser("~")
-        save_dir = os.path.join(home, '.brickbreaker')
-    
-    os.makedirs(save_dir, exist_ok=True)
-    return os.path.join(save_dir, filename)
-
-# Sound files
-try:
-    bounce_sound = pygame.mixer.Sound(get_data_path("bounce.wav"))
-    explosion_sound = pygame.mixer.Sound(get_data_path("explosion.wav"))
-    powerup_sound = pygame.mixer.Sound(get_data_path("powerup.wav"))
-    intro_sound = pygame.mixer.Sound(get_data_path("intro_music.wav"))
-    bgm_sound = pygame.mixer.Sound(get_data_path("brick_breaker_bgm.wav"))
-except:
-    # Fallback if sound files aren't found
-    class DummySound:
-        def play(self): pass
-        def stop(self): pass
-        def set_volume(self, vol): pass
-    
-    bounce_sound = DummySound()
-    explosion_sound = DummySound()
-    powerup_sound = DummySound()
-    intro_sound = DummySound()
-    bgm_sound = DummySound()
-
-# Leaderboard file path
-LEADERBOARD_FILE = get_writable_path("brick_breaker_leaderboard.json")
-
-# Initialize Pygame with a maximized window
-info = pygame.display.Info()
-SCREEN_WIDTH, SCREEN_HEIGHT = info.current_w, info.current_h
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE | pygame.SCALED)
-# On Windows, you can use this to maximize:
-if sys.platform == 'win32':
-    import ctypes
-    hwnd = pygame.display.get_wm_info()['window']
-    ctypes.windll.user32.ShowWindow(hwnd, 3)  # SW_MAXIMIZE = 3
-pygame.display.set_caption('Brick Breaker')
+    return writable_path('BrickBreaker', filename)
+
+# Fade between the menu and gameplay tracks
+MUSIC_FADE_MS = 600
 
 # Colors
 BLACK = (0, 0, 0)
@@ -83,97 +49,93 @@ LIGHT_GRAY = (200, 200, 200)
 
 # Game settings
 FPS = 60
-clock = pygame.time.Clock()
+MULTIBALL_LIMIT = 500  # Most balls in play at once, the main ball included
+
+# A frame's input from one player, as bits so netplay can send it in a byte
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_LAUNCH = 4
+
+# Network games are played at one logical size so both sides simulate the same field
+NETPLAY_SIZE = (1920, 1080)
+NETPLAY_PORT = 50507
+
+# Set up by create_app(); importing this module has no side effects
+audio = None
+screen = None
+SCREEN_WIDTH, SCREEN_HEIGHT = 0, 0
+LEADERBOARD_FILE = None
+LEVELS = None
+
+def create_app(size=None):
+    """Initialize pygame, load the sounds and open the window (once).
+
+    The window fills the display unless a logical size is given.
+    """
+    global audio, screen, SCREEN_WIDTH, SCREEN_HEIGHT, LEADERBOARD_FILE, LEVELS
+    if screen is not None:
+        return screen
+
+    pygame.init()
+    pygame.mixer.init()
+
+    # Sound banks (missing files simply stay silent)
+    audio = AudioManager({"sfx": 6})
+    audio.load("bounce", get_data_path("bounce.wav"), min_interval=30)
+    audio.load("explosion", get_data_path("explosion.wav"), min_interval=30)
+    audio.load("powerup", get_data_path("powerup.wav"))
+    # Music is streamed from disk (an .ogg beside the .wav is preferred)
+    audio.stream("intro", get_data_path("intro_music.wav"))
+    audio.stream("bgm", get_data_path("brick_breaker_bgm.wav"))
+    audio.stream("outro", get_data_path("outro_music.wav"), volume=0.7)
+
+    # Leaderboard file path
+    LEADERBOARD_FILE = get_writable_path("brick_breaker_leaderboard.json")
 
-class LeaderBoard:
+    # Level layouts, compiled once into a cache that later runs just map
+    LEVELS = LevelPack(get_data_path("levels.json"), get_writable_path("levels.cache"))
+
+    # When pre-warmed by the launcher, wait here until the player picks this game
+    wait_for_launch()
+
+    # Initialize Pygame with a maximized window
+    info = pygame.display.Info()
+    SCREEN_WIDTH, SCREEN_HEIGHT = size or (info.current_w, info.current_h)
+    screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # On Windows, you can use this to maximize:
+    if sys.platform == 'win32':
+        import ctypes
+        hwnd = pygame.display.get_wm_info()['window']
+        ctypes.windll.user32.ShowWindow(hwnd, 3)  # SW_MAXIMIZE = 3
+    pygame.display.set_caption('Brick Breaker')
+    return screen
+
+class LeaderBoard(LeaderboardStore):
     def __init__(self):
-        self.scores = []
-        self.load_scores()
-    
-    def load_scores(self):
-        try:
-            if os.path.exists(LEADERBOARD_FILE):
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    # Load scores and remove duplicates
-                    loaded_scores = json.load(f)
-                    
-                    # Create a set to track unique scores
-                    seen_scores = set()
-                    unique_scores = []
-                    
-                    for score in loaded_scores:
-                        # Create a tuple of the score data that should be unique
-                        score_key = (score['score'], score['level'], score['date'])
-                        
-                        if score_key not in seen_scores:
-                            seen_scores.add(score_key)
-                            unique_scores.append(score)
-                    
-                    # Sort and keep top 10
-                    unique_scores.sort(key=lambda x: x['score'], reverse=True)
-                    self.scores = unique_scores[:10]
-            else:
-                # Create file if it doesn't exist
-                self.save_scores()
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading leaderboard: {e}")
-            self.scores = []
-    
-    def save_scores(self):
-        try:
-            with open(LEADERBOARD_FILE, 'w') as f:
-                json.dump(self.scores, f, indent=4)
-        except IOError as e:
-            print(f"Error saving leaderboard: {e}")
-    
+        # Duplicate entries are dropped on load and on every new score
+        super().__init__(LEADERBOARD_FILE, unique=True, indent=4)
+
     def add_score(self, score, level):
         if score > 0:
-            new_entry = {
+            self.add({
                 'score': score,
                 'level': level,
                 'date': datetime.now().strftime("%Y-%m-%d %H:%M")
-            }
-            
-            # Add the new score to the list
-            self.scores.append(new_entry)
-            
-            # Remove duplicates
-            seen_scores = set()
-            unique_scores = []
-            
-            for score_entry in self.scores:
-                score_key = (score_entry['score'], score_entry['level'], score_entry['date'])
-                if score_key not in seen_scores:
-                    seen_scores.add(score_key)
-                    unique_scores.append(score_entry)
-            
-            # Sort by score in descending order
-            unique_scores.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Keep only top 10 scores
-            self.scores = unique_scores[:10]
-            
-            # Save to file
-            self.save_scores()
-    
-    def get_top_scores(self, limit=10):
-        return self.scores[:limit]
-    
-    def get_high_score(self):
-        return self.scores[0]['score'] if self.scores else 0
-    
-    def reset_scores(self):
-        self.scores = []
-        self.save_scores()
+            })
 
-class OptionsMenu:
-    def __init__(self):
+class OptionsMenu(Scene):
+    opaque = False  # Drawn over a dimmed, frozen snapshot of the screen beneath
+    dim = 200
+
+    def __init__(self, game):
+        self.game = game
         self.selected_option = 0
         self.options = ["Back"]
         self.option_rects = []
-        self.bgm_volume = 0.5  # Default volume
-        self.sfx_volume = 0.5  # Default volume
-        self.muted = False
+        # Start from the game's current settings
+        self.bgm_volume = game.bgm_volume
+        self.sfx_volume = game.sfx_volume
+        self.muted = game.muted
         self.slider_width = 200
         self.slider_height = 10
         self.handle_width = 20
@@ -316,24 +278,31 @@ class OptionsMenu:
     
     def toggle_mute(self):
         self.muted = not self.muted
-        if self.muted:
-            pygame.mixer.music.set_volume(0)
-            bounce_sound.set_volume(0)
-            explosion_sound.set_volume(0)
-            powerup_sound.set_volume(0)
-        else:
-            pygame.mixer.music.set_volume(self.bgm_volume)
-            bounce_sound.set_volume(self.sfx_volume)
-            explosion_sound.set_volume(self.sfx_volume)
-            powerup_sound.set_volume(self.sfx_volume)
+        audio.set_muted(self.muted)
         return "update_volume"
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.QUIT:
+            return game.handle_event(event)
+
+        action = self.handle_input(event)
+        if action == "back":
+            self.stack.pop()
+        elif action == "reset_scores":
+            game.leaderboard.scores = []
+            game.leaderboard.save_scores()
+            self.reset_confirmation()
+            self.stack.pop()
+        elif action == "update_volume":
+            # Apply volume changes immediately
+            game.bgm_volume = self.bgm_volume
+            game.sfx_volume = self.sfx_volume
+            game.muted = self.muted
+            game.apply_volumes()
+        return None
     
     def draw(self, surface):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        surface.blit(overlay, (0, 0))
-        
         menu_width = 400
         menu_height = 400
         menu_x = (SCREEN_WIDTH - menu_width) // 2
@@ -343,13 +312,13 @@ class OptionsMenu:
         pygame.draw.rect(surface, DARK_GRAY, menu_rect)
         pygame.draw.rect(surface, WHITE, menu_rect, 3)
         
-        title_font = pygame.font.Font(None, 48)
+        title_font = get_font(48)
         title_text = title_font.render("OPTIONS", True, YELLOW)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, menu_y + 40))
         surface.blit(title_text, title_rect)
         
         # Draw volume controls
-        option_font = pygame.font.Font(None, 36)
+        option_font = get_font(36)
         
         # BGM Volume
         bgm_text = option_font.render("BGM Volume:", True, WHITE)
@@ -457,7 +426,7 @@ class OptionsMenu:
         self.option_rects = [back_rect]
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = get_font(24)
         instructions = [
             "Drag sliders to adjust volume",
             "Press M to toggle mute",
@@ -469,14 +438,16 @@ class OptionsMenu:
             surface.blit(text, text_rect)
 
 class Paddle:
-    def __init__(self):
+    def __init__(self, center=None, color=WHITE):
         self.width = 100
         self.height = 15
-        self.x = (SCREEN_WIDTH - self.width) // 2
+        if center is None:
+            center = SCREEN_WIDTH // 2
+        self.x = center - self.width // 2
         self.y = SCREEN_HEIGHT - 50
         self.base_speed = 10  # Store base speed
         self.speed = self.base_speed  # Current speed
-        self.color = WHITE
+        self.color = color
     
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, (self.x, self.y, self.width, self.height))
@@ -505,7 +476,7 @@ class Ball:
     def reset(self):
         self.x = SCREEN_WIDTH // 2
         self.y = SCREEN_HEIGHT // 2
-        self.dx = random.choice([-4, -3, 3, 4])
+        self.dx = self.game.rng.choice([-4, -3, 3, 4])
         self.dy = -4
         self.active = False
         self.manual_control = False  # Reset manual control
@@ -554,11 +525,11 @@ class Ball:
             # Wall collisions with sound
             if self.x <= self.radius or self.x >= SCREEN_WIDTH - self.radius:
                 self.dx *= -1
-                bounce_sound.play()
+                audio.play("bounce")
                 
             if self.y <= self.radius:
                 self.dy *= -1
-                bounce_sound.play()
+                audio.play("bounce")
                 
         # Check if ball fell below paddle
         if self.y >= SCREEN_HEIGHT + self.radius:
@@ -578,65 +549,289 @@ class Ball:
             return True
         return False
     
-    def collide_brick(self, brick):
-        if not brick.active:
-            return False
-            
-        if (self.x + self.radius >= brick.x and 
-            self.x - self.radius <= brick.x + brick.width and
-            self.y + self.radius >= brick.y and 
-            self.y - self.radius <= brick.y + brick.height):
-            
-            # Determine side of collision
-            if (self.x < brick.x or self.x > brick.x + brick.width):
-                self.dx *= -1
-            else:
-                self.dy *= -1
-            
-            brick.active = False
-            explosion_sound.play()
+    def collide_bricks(self, bricks):
+        """Bounce off the first live brick the ball overlaps; return its index or None."""
+        index = bricks.find(self.x, self.y, self.radius)
+        if index is None:
+            return None
+        brick_x, brick_y, brick_width, brick_height = bricks.rect(index)
+
+        # Determine side of collision
+        if (self.x < brick_x or self.x > brick_x + brick_width):
+            self.dx *= -1
+        else:
+            self.dy *= -1
 
-            # Increase speed when hitting a brick
+        if bricks.hit(index):
+            # Increase speed when breaking a brick
             self.increase_speed()
+            self.game.break_brick(index)
+        return index
 
-            # Set respawn timer for levels 7-10 (only during first minute)
-            if 7 <= self.game.level <= 10:
-                current_time = pygame.time.get_ticks()
-                level_elapsed = current_time - self.game.level_start_time
-                
-                if level_elapsed <= 60000:  # Only if in first minute
-                    respawn_time = {
-                        7: 50000,  
-                        8: 30000,  
-                        9: 20000,  
-                        10: 15000  
-                    }[self.game.level]
-                    self.game.brick_respawn_timers[id(brick)] = current_time + respawn_time
-            
-            # 20% chance to spawn power-up
-            if random.random() < 0.2:
-                powerup_type = random.randint(1, 3)
-                self.game.powerups.append(
-                    PowerUp(brick.x + brick.width//2 - 15, brick.y, powerup_type)
-                )
-    
-            return True
-        return False
+class BallBatch:
+    """The extra balls of a multiball, stored as parallel arrays of floats.
+
+    Ball i lives in slot i of x/y/dx/dy and a lost ball is replaced by the
+    last one, so the arrays stay dense. Velocities are per frame with any
+    speed-up already applied. Each ball resolves its own brick hit against
+    the shared BrickField and they are all drawn from one cached sprite.
+    """
+
+    def __init__(self, radius=8):
+        self.radius = radius
+        self.x = array("d")
+        self.y = array("d")
+        self.dx = array("d")
+        self.dy = array("d")
+        self.sprite = None
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, x, y, dx, dy):
+        self.x.append(x)
+        self.y.append(y)
+        self.dx.append(dx)
+        self.dy.append(dy)
+
+    def pop(self):
+        return self.x.pop(), self.y.pop(), self.dx.pop(), self.dy.pop()
+
+    def clear(self):
+        for values in (self.x, self.y, self.dx, self.dy):
+            del values[:]
+
+    def scale(self, factor, limit):
+        """Scale every velocity, clamping each axis to +/-limit."""
+        for values in (self.dx, self.dy):
+            for i in range(len(values)):
+                values[i] = max(-limit, min(limit, values[i] * factor))
+
+    def update(self, game):
+        """Move every ball one frame and resolve its wall, paddle and brick hits."""
+        xs, ys, dxs, dys = self.x, self.y, self.dx, self.dy
+        radius = self.radius
+        right = SCREEN_WIDTH - radius
+        bottom = SCREEN_HEIGHT + radius
+        # Every paddle shares one row, so only balls inside it look at the paddles
+        paddle = game.paddles[0]
+        paddle_top = paddle.y - radius
+        paddle_bottom = paddle.y + paddle.height + radius
+        paddles = [(paddle.x - radius, paddle.x + paddle.width + radius,
+                    paddle.x + paddle.width / 2, paddle.width / 2) for paddle in game.paddles]
+        paddle_speed = 5 * game.ball.speed_increase_factor
+        bricks = game.bricks
+        find, hit = bricks.find, bricks.hit
+        bounced = False
+
+        i = 0
+        while i < len(xs):
+            dx, dy = dxs[i], dys[i]
+            x, y = xs[i] + dx, ys[i] + dy
+
+            if y >= bottom:
+                # Lost: the last ball takes over this slot
+                last = xs.pop(), ys.pop(), dxs.pop(), dys.pop()
+                if i < len(xs):
+                    xs[i], ys[i], dxs[i], dys[i] = last
+                continue
+
+            if x <= radius or x >= right:
+                dx = -dx
+                bounced = True
+            if y <= radius:
+                dy = -dy
+                bounced = True
+
+            if paddle_top <= y <= paddle_bottom:
+                for paddle_left, paddle_right, paddle_center, half_width in paddles:
+                    if paddle_left <= x <= paddle_right:
+                        dx = (x - paddle_center) / half_width * paddle_speed
+                        dy = -abs(dy)
+                        bounced = True
+                        break
+
+            index = find(x, y, radius)
+            if index is not None:
+                brick_x, brick_y, brick_width, brick_height = bricks.rect(index)
+                if x < brick_x or x > brick_x + brick_width:
+                    dx = -dx
+                else:
+                    dy = -dy
+                if hit(index):
+                    game.break_brick(index)
+
+            xs[i], ys[i], dxs[i], dys[i] = x, y, dx, dy
+            i += 1
+
+        if bounced:
+            audio.play("bounce")
 
-class Brick:
-    def __init__(self, x, y, width, height, color, points):
+    def draw(self, surface):
+        if not self.x:
+            return
+        if self.sprite is None:
+            size = self.radius * 2 + 2
+            self.sprite = pygame.Surface((size, size))
+            self.sprite.set_colorkey(BLACK)
+            center = (size // 2, size // 2)
+            pygame.draw.circle(self.sprite, WHITE, center, self.radius)
+            pygame.draw.circle(self.sprite, CYAN, center, self.radius, 1)
+        offset = self.radius + 1
+        sprite = self.sprite
+        surface.blits([(sprite, (x - offset, y - offset)) for x, y in zip(self.x, self.y)], False)
+
+class BrickField:
+    """The level's bricks as a grid of flat arrays instead of one object each.
+
+    Brick i sits at row i // cols, column i % cols, and its geometry comes
+    from the grid, so a ball only has to look at the few cells under it.
+    `remaining` counts the live bricks, which makes the level-complete check
+    O(1), and the bricks are painted once into a cached image that is only
+    touched when one of them breaks or respawns.
+    """
+
+    KEY = (255, 0, 255)  # Transparent colour of the cached image
+
+    def __init__(self, rows, cols, x, y, brick_width, brick_height, col_gap=0, row_gap=0, palette=()):
+        self.rows = rows
+        self.cols = cols
         self.x = x
         self.y = y
-        self.width = width
-        self.height = height
-        self.color = color
-        self.points = points
-        self.active = True
-    
+        self.brick_width = brick_width
+        self.brick_height = brick_height
+        self.pitch_x = brick_width + col_gap
+        self.pitch_y = brick_height + row_gap
+        self.palette = list(palette)
+
+        count = rows * cols
+        self.active = bytearray(count)
+        self.hits = bytearray(count)  # Hits left before the brick breaks
+        self.colors = bytearray(count)  # Index into palette
+        self.points = array("I", bytes(4 * count))
+        self.remaining = 0
+        self.image = None
+
+    @classmethod
+    def from_level(cls, level, screen_width, palette):
+        """A field for a compiled level (see retro_arcade.levels), centred horizontally."""
+        field = cls(level.rows, level.cols, (screen_width - level.width) // 2, level.top,
+                    level.brick_width, level.brick_height, level.col_gap, level.row_gap, palette)
+        field.active[:] = level.active
+        field.hits[:] = level.hits
+        field.colors[:] = level.colors
+        field.points = level.points
+        field.remaining = field.active.count(1)
+        return field
+
+    def __len__(self):
+        return len(self.active)
+
+    def fill_row(self, row, color_index, points, hits=1):
+        """Put a full row of identical bricks in place."""
+        start, end = row * self.cols, (row + 1) * self.cols
+        self.remaining += self.cols - self.active[start:end].count(1)
+        self.active[start:end] = b"\x01" * self.cols
+        self.hits[start:end] = bytes((hits,)) * self.cols
+        self.colors[start:end] = bytes((color_index,)) * self.cols
+        self.points[start:end] = array("I", (points,)) * self.cols
+        self.image = None
+
+    def rect(self, index):
+        row, col = divmod(index, self.cols)
+        return (self.x + col * self.pitch_x, self.y + row * self.pitch_y,
+                self.brick_width, self.brick_height)
+
+    def find(self, x, y, radius):
+        """Index of the first live brick touching the ball's bounding box, or None."""
+        # Cell c spans [x + c * pitch, x + c * pitch + width]; solve for the cells in range
+        col_lo = max(0, -((self.x + self.brick_width - x + radius) // self.pitch_x))
+        col_hi = min(self.cols - 1, int((x + radius - self.x) // self.pitch_x))
+        row_lo = max(0, -((self.y + self.brick_height - y + radius) // self.pitch_y))
+        row_hi = min(self.rows - 1, int((y + radius - self.y) // self.pitch_y))
+        active = self.active
+        for row in range(int(row_lo), row_hi + 1):
+            base = row * self.cols
+            for col in range(int(col_lo), col_hi + 1):
+                if active[base + col]:
+                    return base + col
+        return None
+
+    def hit(self, index):
+        """Knock a hit off the brick; returns True when that breaks it."""
+        if not self.active[index]:
+            return False
+        self.hits[index] -= 1
+        if self.hits[index]:
+            return False
+        self.active[index] = 0
+        self.remaining -= 1
+        self.paint(index)
+        return True
+
+    def restore(self, index, hits=1):
+        if not self.active[index]:
+            self.active[index] = 1
+            self.remaining += 1
+        self.hits[index] = hits
+        self.paint(index)
+
+    def paint(self, index):
+        """Bring the cached image up to date for one brick."""
+        if self.image is None:
+            return
+        x, y, width, height = self.rect(index)
+        rect = (x - self.x, y - self.y, width, height)
+        if self.active[index]:
+            self.image.fill(self.palette[self.colors[index]], rect)
+            pygame.draw.rect(self.image, BLACK, rect, 2)
+        else:
+            self.image.fill(self.KEY, rect)
+
     def draw(self, surface):
-        if self.active:
-            pygame.draw.rect(surface, self.color, (self.x, self.y, self.width, self.height))
-            pygame.draw.rect(surface, BLACK, (self.x, self.y, self.width, self.height), 2)
+        if self.image is None:
+            width = (self.cols - 1) * self.pitch_x + self.brick_width
+            height = (self.rows - 1) * self.pitch_y + self.brick_height
+            self.image = pygame.Surface((max(1, width), max(1, height)))
+            self.image.fill(self.KEY)
+            self.image.set_colorkey(self.KEY)
+            for index in range(len(self.active)):
+                if self.active[index]:
+                    self.paint(index)
+        surface.blit(self.image, (self.x, self.y))
+
+class RespawnScheduler:
+    """Destroyed bricks waiting to come back, ordered by when they are due.
+
+    A min-heap of (respawn_tick, brick_index): a frame only pops the bricks
+    that are due instead of scanning every timer and searching the brick
+    list for each one.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.pending = {}  # brick_index -> tick of its live heap entry
+
+    def schedule(self, index, tick):
+        # Rescheduling leaves the old entry in the heap; due() skips it
+        self.pending[index] = tick
+        heapq.heappush(self.heap, (tick, index))
+
+    def due(self, now):
+        """Pop and yield the index of every brick due at or before now."""
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            tick, index = heapq.heappop(heap)
+            if self.pending.get(index) == tick:
+                del self.pending[index]
+                yield index
+
+    def clear(self):
+        self.heap.clear()
+        self.pending.clear()
+
+    def __len__(self):
+        return len(self.pending)
 
 class PowerUp:
     def __init__(self, x, y, type):
@@ -644,7 +839,7 @@ class PowerUp:
         self.y = y
         self.width = 30
         self.height = 15
-        self.type = type  # 1: extra life, 2: paddle expand, 3: ball speed down
+        self.type = type  # 1: extra life, 2: paddle expand, 3: ball speed down, 4: multiball
         self.speed = 3
         self.active = True
         
@@ -652,8 +847,10 @@ class PowerUp:
             self.color = GREEN
         elif self.type == 2:
             self.color = YELLOW
-        else:
+        elif self.type == 3:
             self.color = BLUE
+        else:
+            self.color = WHITE
     
     def update(self):
         self.y += self.speed
@@ -686,27 +883,132 @@ class PowerUp:
                     (self.x + 5, self.y + self.height//2 + 4),
                     (self.x, self.y + self.height//2)
                 ])
-            else:  # Minus for ball speed down
+            elif self.type == 3:  # Minus for ball speed down
                 pygame.draw.rect(surface, BLACK, (self.x + 5, self.y + self.height//2 - 1, self.width - 10, 2))
+            else:  # Three balls for multiball
+                for offset in (-8, 0, 8):
+                    pygame.draw.circle(surface, BLACK, (self.x + self.width//2 + offset, self.y + self.height//2), 3)
 
-class PauseMenu:
-    def __init__(self):
+class PauseMenu(Scene):
+    opaque = False  # Drawn over a dimmed, frozen snapshot of the game
+    dim = 200
+
+    def __init__(self, game):
+        self.game = game
         self.selected_option = 0
         self.options = ["Resume", "Leaderboard", "Options", "Restart", "Exit"]  # Added Options
         self.option_rects = []
-        self.showing_leaderboard = False
-        self.showing_options = False  # Added for options menu
         self.cheat_buffer = []
         self.cheat_code = "cheat"
         self.cheat_activated = False
-        self.options_menu = OptionsMenu()  # Create options menu instance
 
-    def draw_leaderboard(self, surface, leaderboard):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        surface.blit(overlay, (0, 0))
+    def handle_input(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP or event.key == pygame.K_w:
+                self.selected_option = (self.selected_option - 1) % len(self.options)
+            elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
+                self.selected_option = (self.selected_option + 1) % len(self.options)
+            elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                return self.options[self.selected_option].lower()
+            elif event.key == pygame.K_ESCAPE:
+                return "resume"
+
+            # Cheat code detection
+            if event.unicode:
+                self.cheat_buffer.append(event.unicode.lower())
+                if len(self.cheat_buffer) > len(self.cheat_code):
+                    self.cheat_buffer.pop(0)
+
+                if "".join(self.cheat_buffer) == self.cheat_code:
+                    self.cheat_activated = True
+                    return "cheat"
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                for i, rect in enumerate(self.option_rects):
+                    if rect.collidepoint(event.pos):
+                        return self.options[i].lower()
+        return None
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.QUIT:
+            return game.handle_event(event)
+
+        menu_action = self.handle_input(event)
+        if menu_action == "resume":
+            self.stack.pop()
+        elif menu_action == "leaderboard":
+            self.stack.push(LeaderboardView(game))
+        elif menu_action == "options":
+            self.stack.push(OptionsMenu(game))
+        elif menu_action == "restart":
+            game.__init__()  # Reset the game
+            self.stack.pop()
+        elif menu_action == "exit":
+            show_exit_credits()  # Show credits before quitting
+            return "quit"
+        elif menu_action == "cheat":
+            game.ball.manual_control = True
+        return None
+
+    def draw(self, surface):
+        self.draw_main_menu(surface)
+
+    def draw_main_menu(self, surface):
+        menu_width = 300
+        menu_height = 300  # Increased height for additional option
+        menu_x = (SCREEN_WIDTH - menu_width) // 2
+        menu_y = (SCREEN_HEIGHT - menu_height) // 2
+        
+        menu_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
+        pygame.draw.rect(surface, DARK_GRAY, menu_rect)
+        pygame.draw.rect(surface, WHITE, menu_rect, 3)
+        
+        title_font = get_font(48)
+        title_text = title_font.render("PAUSED", True, YELLOW)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, menu_y + 40))
+        surface.blit(title_text, title_rect)
         
+        option_font = get_font(36)
+        self.option_rects = []
+        for i, option in enumerate(self.options):
+            color = YELLOW if i == self.selected_option else WHITE
+            option_text = option_font.render(option, True, color)
+            option_y = menu_y + 80 + (i * 40)
+            option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, option_y))
+            surface.blit(option_text, option_rect)
+            self.option_rects.append(pygame.Rect(
+                option_rect.x - 10, option_rect.y - 5,
+                option_rect.width + 20, option_rect.height + 10
+            ))
+            
+            if i == self.selected_option:
+                pygame.draw.rect(surface, YELLOW, self.option_rects[i], 2)
+        
+        instruction_font = get_font(24)
+        instructions = ["↑↓ or Click to Select", "Enter/Space to Confirm", "ESC to Close"]
+        for i, instruction in enumerate(instructions):
+            text = instruction_font.render(instruction, True, LIGHT_GRAY)
+            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 80 + (i * 20)))
+            surface.blit(text, text_rect)
+
+class LeaderboardView(Scene):
+    opaque = False
+    dim = 200
+
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return self.game.handle_event(event)
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
+            self.stack.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.stack.pop()
+        return None
+
+    def draw(self, surface):
         menu_width = 600
         menu_height = 500
         menu_x = (SCREEN_WIDTH - menu_width) // 2
@@ -716,13 +1018,13 @@ class PauseMenu:
         pygame.draw.rect(surface, DARK_GRAY, menu_rect)
         pygame.draw.rect(surface, WHITE, menu_rect, 3)
         
-        title_font = pygame.font.Font(None, 48)
+        title_font = get_font(48)
         title_text = title_font.render("LEADERBOARD", True, YELLOW)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, menu_y + 40))
         surface.blit(title_text, title_rect)
         
-        header_font = pygame.font.Font(None, 36)
-        score_font = pygame.font.Font(None, 32)
+        header_font = get_font(36)
+        score_font = get_font(32)
         
         # Column headers
         headers = ["Rank", "Score", "Level", "Date"]
@@ -734,7 +1036,7 @@ class PauseMenu:
             surface.blit(header_text, (col_positions[i], header_y))
         
         # Draw scores
-        top_scores = leaderboard.get_top_scores()
+        top_scores = self.game.leaderboard.get_top_scores()
         if not top_scores:
             no_scores = header_font.render("No scores yet!", True, WHITE)
             surface.blit(no_scores, no_scores.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)))
@@ -759,290 +1061,47 @@ class PauseMenu:
                 surface.blit(date_text, (col_positions[3], y_pos))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = get_font(24)
         instructions = ["ESC or Backspace to go back"]
         for i, instruction in enumerate(instructions):
             text = instruction_font.render(instruction, True, LIGHT_GRAY)
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
             surface.blit(text, text_rect)
-    
-    def handle_input(self, event, game=None):
-        if self.showing_options:
-            action = self.options_menu.handle_input(event)
-            if action == "back":
-                self.showing_options = False
-            elif action == "reset_scores":
-                # Handle score reset
-                self.showing_options = False
-                return "reset_scores"
-            elif action == "update_volume": 
-                # Update volumes in game
-                if game:  # Only update if game instance was provided
-                    game.bgm_volume = self.options_menu.bgm_volume
-                    game.sfx_volume = self.options_menu.sfx_volume
-                    game.muted = self.options_menu.muted
-                    
-                    # Apply volume changes immediately
-                    if game.bgm:
-                        game.bgm.set_volume(0 if game.muted else game.bgm_volume)
-                
-                # Update SFX volumes regardless of game instance
-                bounce_sound.set_volume(0 if self.options_menu.muted else self.options_menu.sfx_volume)
-                explosion_sound.set_volume(0 if self.options_menu.muted else self.options_menu.sfx_volume)
-                return "update_volume"
-            return None
-        
+
+class PauseOverlay(Scene):
+    """The quick pause on P: the game is frozen under a banner."""
+    opaque = False
+    dim = 180
+
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return self.game.handle_event(event)
         if event.type == pygame.KEYDOWN:
-            if not self.showing_leaderboard:
-                if event.key == pygame.K_UP or event.key == pygame.K_w:
-                    self.selected_option = (self.selected_option - 1) % len(self.options)
-                elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                    self.selected_option = (self.selected_option + 1) % len(self.options)
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if self.options[self.selected_option] == "Options":
-                        self.showing_options = True
-                        return None
-                    return self.options[self.selected_option].lower()
-                
-                # Cheat code detection
-                if event.unicode:
-                    self.cheat_buffer.append(event.unicode.lower())
-                    if len(self.cheat_buffer) > len(self.cheat_code):
-                        self.cheat_buffer.pop(0)
-                    
-                    if "".join(self.cheat_buffer) == self.cheat_code:
-                        self.cheat_activated = True
-                        return "cheat"
-            else:
-                if event.key == pygame.K_ESCAPE or event.key == pygame.K_BACKSPACE:
-                    self.showing_leaderboard = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                if not self.showing_leaderboard and not self.showing_options:
-                    for i, rect in enumerate(self.option_rects):
-                        if rect.collidepoint(event.pos):
-                            if self.options[i] == "Options":
-                                self.showing_options = True
-                                return None
-                            return self.options[i].lower()
-                elif self.showing_leaderboard:
-                    self.showing_leaderboard = False
+            if event.key == pygame.K_p:
+                self.stack.pop()
+            elif event.key == pygame.K_ESCAPE:
+                self.stack.replace(PauseMenu(self.game))
         return None
-    
-    def draw(self, surface, leaderboard, game=None):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        surface.blit(overlay, (0, 0))
-        
-        if self.showing_options:
-            self.options_menu.draw(surface)
-            if game:
-                # Update game volumes if provided
-                game.bgm_volume = self.options_menu.bgm_volume
-                game.sfx_volume = self.options_menu.sfx_volume
-                game.muted = self.options_menu.muted
-        elif self.showing_leaderboard:
-            self.draw_leaderboard(surface, leaderboard)
-        else:
-            self.draw_main_menu(surface)
-    
-    def draw_main_menu(self, surface):
-        menu_width = 300
-        menu_height = 300  # Increased height for additional option
-        menu_x = (SCREEN_WIDTH - menu_width) // 2
-        menu_y = (SCREEN_HEIGHT - menu_height) // 2
-        
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
-        pygame.draw.rect(surface, DARK_GRAY, menu_rect)
-        pygame.draw.rect(surface, WHITE, menu_rect, 3)
-        
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("PAUSED", True, YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, menu_y + 40))
-        surface.blit(title_text, title_rect)
-        
-        option_font = pygame.font.Font(None, 36)
-        self.option_rects = []
-        for i, option in enumerate(self.options):
-            color = YELLOW if i == self.selected_option else WHITE
-            option_text = option_font.render(option, True, color)
-            option_y = menu_y + 80 + (i * 40)
-            option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, option_y))
-            surface.blit(option_text, option_rect)
-            self.option_rects.append(pygame.Rect(
-                option_rect.x - 10, option_rect.y - 5,
-                option_rect.width + 20, option_rect.height + 10
-            ))
-            
-            if i == self.selected_option:
-                pygame.draw.rect(surface, YELLOW, self.option_rects[i], 2)
-        
-        instruction_font = pygame.font.Font(None, 24)
-        instructions = ["↑↓ or Click to Select", "Enter/Space to Confirm", "ESC to Close"]
-        for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, LIGHT_GRAY)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 80 + (i * 20)))
-            surface.blit(text, text_rect)
 
-class LogoScreen:
-    def __init__(self):
-        self.logos = []
-        self.current_logo = 0
-        self.logo_duration = 4000  # 4 seconds per logo set
-        self.fade_duration = 1000  # 1 second fade in/out
-        self.start_time = pygame.time.get_ticks()
-        self.load_logos()
-        self.fade_state = "in"  # "in", "hold", or "out"
-        self.next_logo_time = self.start_time + self.fade_duration
-        self.paired_logos = []  # Store pairs of logos to display together
-
-        # Keys that should trigger skipping the logos
-        self.skip_keys = {
-            pygame.K_TAB, pygame.K_SPACE, pygame.K_RETURN, pygame.K_ESCAPE
-        }
-        # Add all alphabet and number keys
-        self.skip_keys.update(range(pygame.K_a, pygame.K_z + 1))  # a-z
-        self.skip_keys.update(range(pygame.K_0, pygame.K_9 + 1))  # 0-9
+    def draw(self, surface):
+        big_font = get_font(72)
+        small_font = get_font(36)
 
-    def load_logos(self):
-        # Try to load multiple logo images
-        logo_paths = [
-            get_data_path("DD Lab1.png"),
-            (get_data_path("logo1.png"), get_data_path("logo2.jpg")),
-            get_data_path("brick_breaker.jpg")
-        ]
-        
-        for item in logo_paths:
-            try:
-                # Handle single logos
-                if isinstance(item, str):
-                    logo = pygame.image.load(item)
-                    # Scale logo if needed
-                    max_width = SCREEN_WIDTH * 0.9
-                    max_height = SCREEN_HEIGHT * 0.8
-                    logo_width, logo_height = logo.get_size()
-                    scale = min(max_width / logo_width, max_height / logo_height)
-                    if scale < 1:
-                        logo = pygame.transform.scale(
-                            logo, 
-                            (int(logo_width * scale), int(logo_height * scale)))
-                    self.logos.append([logo])  # Store as single-item list
-                
-                # Handle logo pairs
-                elif isinstance(item, tuple) and len(item) == 2:
-                    logo_pair = []
-                    for path in item:
-                        logo = pygame.image.load(path)
-                        # Scale each logo to fit half the screen
-                        max_width = SCREEN_WIDTH * 0.45
-                        max_height = SCREEN_HEIGHT * 0.8
-                        logo_width, logo_height = logo.get_size()
-                        scale = min(max_width / logo_width, max_height / logo_height)
-                        if scale < 1:
-                            logo = pygame.transform.scale(
-                                logo, 
-                                (int(logo_width * scale), int(logo_height * scale)))
-                        logo_pair.append(logo)
-                    self.logos.append(logo_pair)
-            
-            except Exception as e:
-                pass
-        
-        # If no logos loaded, create text-based ones
-        if not self.logos:
-            font = pygame.font.Font(None, 72)
-            for i in range(3):
-                surf = pygame.Surface((400, 200), pygame.SRCALPHA)
-                text = font.render(f"Desk Devil Labs", True, WHITE)
-                text_rect = text.get_rect(center=(200, 100))
-                surf.blit(text, text_rect)
-                pygame.draw.rect(surf, WHITE, (0, 0, 400, 200), 2)
-                self.logos.append([surf])
-    
-    def update(self):
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - self.start_time
+        pause_text = big_font.render('PAUSED', True, YELLOW)
+        resume_text = small_font.render('Press P to resume or ESC for menu', True, WHITE)
 
-        # Check for key presses to skip
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in self.skip_keys:
-                    return True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                return True
-        
-        # Update fade state
-        if self.fade_state == "in" and current_time >= self.next_logo_time:
-            self.fade_state = "hold"
-            self.next_logo_time = current_time + (self.logo_duration - 2 * self.fade_duration)
-        elif self.fade_state == "hold" and current_time >= self.next_logo_time:
-            self.fade_state = "out"
-            self.next_logo_time = current_time + self.fade_duration
-        elif self.fade_state == "out" and current_time >= self.next_logo_time:
-            self.current_logo += 1
-            if self.current_logo >= len(self.logos):
-                return True
-            self.start_time = current_time
-            self.fade_state = "in"
-            self.next_logo_time = current_time + self.fade_duration
-        
-        return False
-    
-    def draw(self, surface):
-        surface.fill(BLACK)
-        
-        if self.current_logo < len(self.logos):
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.start_time
-            
-            # Calculate alpha based on fade state
-            if self.fade_state == "in":
-                alpha = min(255, int(255 * (elapsed / self.fade_duration)))
-            elif self.fade_state == "out":
-                alpha = max(0, 255 - int(255 * ((current_time - (self.next_logo_time - self.fade_duration)) / self.fade_duration)))
-            else:  # hold
-                alpha = 255
-            
-            # Get current logo(s) - could be single or pair
-            current_logos = self.logos[self.current_logo]
-            
-            # Create a composite surface if multiple logos
-            if len(current_logos) > 1:
-                # Calculate total width and max height
-                total_width = sum(logo.get_width() for logo in current_logos) + 20 * (len(current_logos) - 1)
-                max_height = max(logo.get_height() for logo in current_logos)
-                
-                # Create a temporary surface for the composite
-                composite = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
-                x_offset = 0
-                for logo in current_logos:
-                    composite.blit(logo, (x_offset, (max_height - logo.get_height()) // 2))
-                    x_offset += logo.get_width() + 20
-                
-                # Apply alpha to the composite
-                composite.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                composite_rect = composite.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(composite, composite_rect)
-            
-            else:  # Single logo
-                logo = current_logos[0]
-                temp_surface = pygame.Surface((logo.get_width(), logo.get_height()), pygame.SRCALPHA)
-                temp_surface.blit(logo, (0, 0))
-                temp_surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                logo_rect = temp_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(temp_surface, logo_rect)
-
-class TitleScreen:
+        surface.blit(pause_text, pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40)))
+        surface.blit(resume_text, resume_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20)))
+
+class TitleScreen(Scene):
     def __init__(self, leaderboard):
-        self.show_title = True
+        self.rng = random.Random()
         self.ball = Ball(self) 
-        self.title_font = pygame.font.Font(None, 72)
-        self.instruction_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(72)
+        self.instruction_font = get_font(36)
         self.leaderboard = leaderboard
         self.start_button = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT*2//3, 200, 50)
         self.exit_button = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT*2//3 + 70, 200, 50)
@@ -1062,16 +1121,13 @@ class TitleScreen:
         
         
         # Create demo bricks
-        self.bricks = []
-        self.brick_respawn_timers = {}  # Dictionary to track respawn timers
+        self.bricks = None
+        self.respawns = RespawnScheduler()
         self.setup_bricks()
 
-        # otr
-        self.sfx_volume = 0.2 
-    def set_sound_volumes(self):
-        """Set reduced volumes for title screen sounds"""
-        bounce_sound.set_volume(self.sfx_volume)
-        explosion_sound.set_volume(self.sfx_volume)
+        # Reduced volume for title screen sounds
+        self.sfx_volume = 0.2
+        audio.set_volume("sfx", self.sfx_volume)
 
     def get_hardcoded_high_score(self):
         return {
@@ -1081,7 +1137,6 @@ class TitleScreen:
         }
         
     def setup_bricks(self):
-        self.bricks = []
         brick_colors = [RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE]
         brick_points = [10, 20, 30, 40, 50, 60]
         
@@ -1095,29 +1150,14 @@ class TitleScreen:
         total_width = cols * brick_width + (cols - 1) * gap
         start_x = (SCREEN_WIDTH - total_width) // 2
         
+        self.bricks = BrickField(3, cols, start_x, 50, brick_width, brick_height, gap, gap, brick_colors)
         for row in range(3):
-            for col in range(cols):
-                brick_x = start_x + col * (brick_width + gap)
-                brick_y = 50 + row * (brick_height + gap)
-                self.bricks.append(
-                    Brick(brick_x, brick_y, brick_width, brick_height, brick_colors[row], brick_points[row]))
+            self.bricks.fill_row(row, row, brick_points[row])
     
     def update(self):
-        # Update brick respawn timers
-        self.set_sound_volumes()
-        current_time = pygame.time.get_ticks()
-        bricks_to_respawn = []
-        
-        for brick_id, respawn_time in list(self.brick_respawn_timers.items()):
-            if current_time >= respawn_time:
-                bricks_to_respawn.append(brick_id)
-        
-        for brick_id in bricks_to_respawn:
-            del self.brick_respawn_timers[brick_id]
-            for brick in self.bricks:
-                if id(brick) == brick_id:
-                    brick.active = True
-                    break
+        # Bring back the bricks whose respawn time has come
+        for index in self.respawns.due(pygame.time.get_ticks()):
+            self.bricks.restore(index)
         
         # Update ball position
         self.ball.x += self.ball.dx
@@ -1126,11 +1166,11 @@ class TitleScreen:
         # Wall collisions with bouncing
         if self.ball.x <= self.ball.radius or self.ball.x >= SCREEN_WIDTH - self.ball.radius:
             self.ball.dx *= -1
-            bounce_sound.play()
+            audio.play("bounce")
             
         if self.ball.y <= self.ball.radius or self.ball.y >= SCREEN_HEIGHT - self.ball.radius:
             self.ball.dy *= -1
-            bounce_sound.play()
+            audio.play("bounce")
         
         # Paddle collision
         if (self.ball.y + self.ball.radius >= self.paddle.y and 
@@ -1142,26 +1182,23 @@ class TitleScreen:
             relative_x = (self.ball.x - (self.paddle.x + self.paddle.width / 2)) / (self.paddle.width / 2)
             self.ball.dx = relative_x * 30  # Max horizontal speed
             self.ball.dy *= -1
-            bounce_sound.play()
-        
-        # Brick collisions
-        for brick in self.bricks:
-            if brick.active and (self.ball.x + self.ball.radius >= brick.x and 
-                self.ball.x - self.ball.radius <= brick.x + brick.width and
-                self.ball.y + self.ball.radius >= brick.y and 
-                self.ball.y - self.ball.radius <= brick.y + brick.height):
-                
-                # Determine side of collision
-                if (self.ball.x < brick.x or self.ball.x > brick.x + brick.width):
-                    self.ball.dx *= -1
-                else:
-                    self.ball.dy *= -1
-                
-                explosion_sound.play()
-                brick.active = False
-                # Set respawn timer (3 seconds from now)
-                self.brick_respawn_timers[id(brick)] = pygame.time.get_ticks() + 10000
-                break  # Only collide with one brick per frame
+            audio.play("bounce")
+        
+        # Brick collisions (only one brick per frame)
+        index = self.bricks.find(self.ball.x, self.ball.y, self.ball.radius)
+        if index is not None:
+            brick_x, brick_y, brick_width, brick_height = self.bricks.rect(index)
+            
+            # Determine side of collision
+            if (self.ball.x < brick_x or self.ball.x > brick_x + brick_width):
+                self.ball.dx *= -1
+            else:
+                self.ball.dy *= -1
+            
+            audio.play("explosion")
+            self.bricks.hit(index)
+            # Set respawn timer (3 seconds from now)
+            self.respawns.schedule(index, pygame.time.get_ticks() + 10000)
         
         # Paddle follows ball's x-position directly
         target_x = self.ball.x - self.paddle.width // 2  # Center paddle under ball
@@ -1186,8 +1223,7 @@ class TitleScreen:
         self.ball.draw(surface)
         
         # Draw bricks
-        for brick in self.bricks:
-            brick.draw(surface)
+        self.bricks.draw(surface)
         
         title_text = self.title_font.render("BRICK BREAKER", True, WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
@@ -1235,45 +1271,58 @@ class TitleScreen:
             text = self.instruction_font.render(control, True, LIGHT_GRAY)
             surface.blit(text, (50, SCREEN_HEIGHT - 200 + i * 30))
     
-    def handle_events(self, event):
-        self.set_sound_volumes()
+    def handle_event(self, event):
         if event.type == pygame.QUIT:
             show_exit_credits()  # Show credits before quitting
-            return False
+            return "quit"
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.show_title = False
-                return True
+                return "start"
             elif event.key == pygame.K_ESCAPE:
-                return False
+                return "quit"
             elif event.key == pygame.K_o:  # Shortcut for options
                 self.showing_options = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 if self.start_button.collidepoint(event.pos):
-                    self.show_title = False
-                    return True
+                    return "start"
                 elif self.exit_button.collidepoint(event.pos):
                     show_exit_credits()  # Show credits before quitting
-                    return False
+                    return "quit"
         return None        
 
-class Game:
-    def __init__(self):
-        self.paddle = Paddle()
+class Game(Scene):
+    """A game of one player, or two sharing the field in co-op.
+
+    The simulation is deterministic: step() advances it by one frame from
+    nothing but the players' inputs, game time is counted in frames, and all
+    chance comes from the game's own seeded rng. With save_state() and
+    load_state() that is everything rollback netplay needs.
+    """
+
+    def __init__(self, players=1, seed=None):
+        self.players = players
+        self.rng = random.Random(seed)
+        if players == 1:
+            self.paddles = [Paddle()]
+        else:
+            # Player 1 starts on the left third, player 2 on the right
+            self.paddles = [Paddle(SCREEN_WIDTH // 3), Paddle(SCREEN_WIDTH * 2 // 3, ORANGE)]
+        self.paddle = self.paddles[0]
+        self.frame = 0
+        # Launching takes a fresh press, not a key still held from the menu
+        self.last_inputs = (INPUT_LAUNCH,) * players
         self.ball = Ball(self)
-        self.bricks = []
+        self.extra_balls = BallBatch(self.ball.radius)
+        self.bricks = None
         self.powerups = []
         self.score = 0
         self.lives = 5
         self.level = 1
         self.game_over = False
         self.level_complete = False
-        self.paused = False
-        self.show_pause_menu = False
         self.leaderboard = LeaderBoard()
-        self.pause_menu = PauseMenu()
-        self.brick_respawn_timers = {}
+        self.respawns = RespawnScheduler()
         self.level_start_time = 0 
         
         # Audio settings
@@ -1282,7 +1331,6 @@ class Game:
         self.muted = False
         
         # Initialize BGM-related attributes first
-        self.bgm = None
         self.bgm_playing = False
         self.setup_audio()
         self.start_bgm()
@@ -1296,44 +1344,67 @@ class Game:
         self.cheat_message_end_time = 60
 
     def update(self):
-        if pygame.time.get_ticks() % 1000 == 0:  # Every second
+        # Menus sit above the game on the scene stack, so this only runs while playing
+        keys = pygame.key.get_pressed()
+        self.update_cheat(keys)
+        self.step((self.read_input(keys),))
+
+    def read_input(self, keys):
+        """This frame's INPUT_* bits from the keys pygame.key.get_pressed() returned."""
+        bits = 0
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            bits |= INPUT_LEFT
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            bits |= INPUT_RIGHT
+        if keys[pygame.K_SPACE]:
+            bits |= INPUT_LAUNCH
+        return bits
+
+    def game_time(self):
+        """Milliseconds of play so far, counted in frames so every machine agrees."""
+        return self.frame * 1000 // FPS
+
+    def step(self, inputs):
+        """Advance one frame; inputs holds each player's INPUT_* bits."""
+        self.frame += 1
+        held = pressed = 0
+        for paddle, bits, last in zip(self.paddles, inputs, self.last_inputs):
+            if bits & INPUT_LEFT:
+                paddle.move("left")
+            if bits & INPUT_RIGHT:
+                paddle.move("right")
+            held |= bits
+            pressed |= bits & ~last
+        self.last_inputs = inputs
+
+        # Either player can launch the ball or move on to the next level
+        if self.level_complete and held & INPUT_LAUNCH:
+            self.next_level()
+        elif pressed & INPUT_LAUNCH and not self.game_over:
+            self.ball.active = True
+
+        if self.frame % 1000 == 0:  # Every 1000 frames
             self.ball.increase_speed()
-        # Skip update if game is paused
-        if self.paused or self.show_pause_menu:
-            return
         
         # Only respawn bricks during first minute of levels 7-10
         if 7 <= self.level <= 10:
-            current_time = pygame.time.get_ticks()
+            current_time = self.game_time()
             level_elapsed = current_time - self.level_start_time
             
             # Only respawn if we're in the first minute (60000 ms)
             if level_elapsed <= 60000:
-                bricks_to_respawn = []
-                
-                for brick_id, respawn_time in list(self.brick_respawn_timers.items()):
-                    if current_time >= respawn_time:
-                        bricks_to_respawn.append(brick_id)
-                
-                for brick_id in bricks_to_respawn:
-                    del self.brick_respawn_timers[brick_id]
-                    for brick in self.bricks:
-                        if id(brick) == brick_id:
-                            brick.active = True
-                            break
+                for index in self.respawns.due(current_time):
+                    self.bricks.restore(index)
         
         # Update power-ups
         for powerup in self.powerups[:]:
             powerup.update()
             
-            # Check if powerup hit paddle
-            if (powerup.y + powerup.height >= self.paddle.y and
-                powerup.x + powerup.width >= self.paddle.x and
-                powerup.x <= self.paddle.x + self.paddle.width):
-                
-                self.apply_powerup(powerup.type)
+            # Check if powerup hit a paddle
+            catcher = self.catching_paddle(powerup)
+            if catcher is not None:
+                self.apply_powerup(powerup.type, catcher)
                 self.powerups.remove(powerup)
-                powerup_sound.play()
                 
             # Remove if off screen
             elif powerup.y > SCREEN_HEIGHT:
@@ -1342,66 +1413,178 @@ class Game:
         # Update ball movement if active
         if self.ball.active:
             ball_lost = self.ball.move(self)  # Pass self (the game instance) to move()
-            if ball_lost:
+            if ball_lost and self.extra_balls:
+                # Another ball of the multiball takes over; its velocity already includes the speed-up
+                self.ball.x, self.ball.y, self.ball.dx, self.ball.dy = self.extra_balls.pop()
+                self.ball.speed_increase_factor = 1.0
+            elif ball_lost:
                 self.lives -= 1
                 if self.lives <= 0:
                     self.game_over = True
                     # Save score when game is over
-                    self.leaderboard.add_score(self.score, self.level)
+                    self.save_score()
                 self.ball.reset()  # Always reset the ball after losing a life
         
         # Check for paddle collision
         if self.ball.active:
-            if self.ball.collide_paddle(self.paddle):
-                bounce_sound.play()
-        
-        # Check for brick collisions
-        bricks_active = False
-        for brick in self.bricks:
-            if brick.active:
-                bricks_active = True
-                if self.ball.active and self.ball.collide_brick(brick):
-                    self.score += brick.points
-                    break  # Only collide with one brick per frame
+            for paddle in self.paddles:
+                if self.ball.collide_paddle(paddle):
+                    audio.play("bounce")
+                    break
+        
+        # Check for brick collisions (only one brick per ball per frame)
+        if self.ball.active:
+            self.ball.collide_bricks(self.bricks)
+        if self.extra_balls:
+            self.extra_balls.update(self)
         
         # Check if all bricks are destroyed (level complete)
-        if not bricks_active and not self.level_complete and not self.game_over:
+        if not self.bricks.remaining and not self.level_complete and not self.game_over:
             self.level_complete = True
             self.ball.active = False
+            self.extra_balls.clear()
             # If this was the last level, save the score
-            if self.level == 10:
+            if self.level == len(LEVELS):
                 self.game_over = True
-                self.leaderboard.add_score(self.score, self.level)
+                self.save_score()
+
+    def catching_paddle(self, powerup):
+        """The paddle a falling power-up has reached, or None."""
+        for paddle in self.paddles:
+            if (powerup.y + powerup.height >= paddle.y and
+                powerup.x + powerup.width >= paddle.x and
+                powerup.x <= paddle.x + paddle.width):
+                return paddle
+        return None
+
+    def save_score(self):
+        # A co-op score isn't comparable with solo ones, so it stays off the leaderboard
+        if self.players == 1:
+            self.leaderboard.add_score(self.score, self.level)
 
-    def apply_powerup(self, type):
-        # Play powerup sound (respect mute settings)
-        powerup_sound.set_volume(0 if self.muted else self.sfx_volume)
-        powerup_sound.play()
+    def save_state(self):
+        """A snapshot of everything step() reads or writes, for load_state().
+
+        The brick field object is shared rather than copied, since a new
+        level replaces it instead of changing it; its per-brick state is
+        copied as bytes, and the balls as array slices.
+        """
+        ball, balls, bricks = self.ball, self.extra_balls, self.bricks
+        return (
+            self.frame, self.rng.getstate(), self.last_inputs,
+            [(paddle.x, paddle.width, paddle.speed) for paddle in self.paddles],
+            (ball.x, ball.y, ball.dx, ball.dy, ball.active, ball.speed_increase_factor),
+            (balls.x[:], balls.y[:], balls.dx[:], balls.dy[:]),
+            (bricks, bytes(bricks.active), bytes(bricks.hits), bricks.remaining),
+            [(powerup.x, powerup.y, powerup.type) for powerup in self.powerups],
+            (self.respawns.heap[:], dict(self.respawns.pending)),
+            (self.score, self.lives, self.level, self.game_over, self.level_complete, self.level_start_time),
+        )
+
+    def load_state(self, state):
+        """Put the game back as it was when save_state() returned state."""
+        (self.frame, rng_state, self.last_inputs, paddles, ball, balls, bricks, powerups, respawns,
+         counters) = state
+        self.rng.setstate(rng_state)
+        for paddle, (x, width, speed) in zip(self.paddles, paddles):
+            paddle.x, paddle.width, paddle.speed = x, width, speed
+        (self.ball.x, self.ball.y, self.ball.dx, self.ball.dy, self.ball.active,
+         self.ball.speed_increase_factor) = ball
+        extra = self.extra_balls
+        extra.x[:], extra.y[:], extra.dx[:], extra.dy[:] = balls
+
+        field, active, hits, remaining = bricks
+        if field is not self.bricks:
+            self.bricks = field
+            field.image = None  # Painted for whatever state it was left in
+        if field.active != active:
+            # Only repaint the bricks that differ
+            changed = [i for i, (now, then) in enumerate(zip(field.active, active)) if now != then]
+            field.active[:] = active
+            for index in changed:
+                field.paint(index)
+        field.hits[:] = hits
+        field.remaining = remaining
+
+        self.powerups = [PowerUp(x, y, type) for x, y, type in powerups]
+        heap, pending = respawns
+        self.respawns.heap[:] = heap
+        self.respawns.pending = dict(pending)
+        (self.score, self.lives, self.level, self.game_over, self.level_complete,
+         self.level_start_time) = counters
+
+    def apply_powerup(self, type, paddle=None):
+        audio.play("powerup")
+        paddle = paddle or self.paddle
         if type == 1:  # Extra life
             self.lives += 1
         elif type == 2:  # Paddle expand
-            self.paddle.width = min(200, self.paddle.width + 20)
+            paddle.width = min(200, paddle.width + 20)
         elif type == 3:  # Ball speed down
             self.ball.dx = max(-6, min(6, self.ball.dx * 0.8))
             self.ball.dy = max(-6, min(6, self.ball.dy * 0.8))
+            self.extra_balls.scale(0.8, 6)
+        elif type == 4:  # Multiball
+            self.split_balls()
+
+    def split_balls(self):
+        """Every ball in play sends off two more at +/-20 degrees, up to MULTIBALL_LIMIT."""
+        balls = [(x, y, dx, dy) for x, y, dx, dy in zip(self.extra_balls.x, self.extra_balls.y,
+                                                         self.extra_balls.dx, self.extra_balls.dy)]
+        if self.ball.active:
+            factor = self.ball.speed_increase_factor
+            balls.insert(0, (self.ball.x, self.ball.y, self.ball.dx * factor, self.ball.dy * factor))
+        cos, sin = math.cos(math.radians(20)), math.sin(math.radians(20))
+        for x, y, dx, dy in balls:
+            for turn in (sin, -sin):
+                if len(self.extra_balls) + 1 >= MULTIBALL_LIMIT:
+                    return
+                self.extra_balls.add(x, y, dx * cos - dy * turn, dx * turn + dy * cos)
+
+    def break_brick(self, index):
+        """Score a broken brick and roll for its respawn and power-up drop."""
+        self.score += self.bricks.points[index]
+        audio.play("explosion")
+
+        # Set respawn timer for levels 7-10 (only during first minute)
+        if 7 <= self.level <= 10:
+            current_time = self.game_time()
+            level_elapsed = current_time - self.level_start_time
+            
+            if level_elapsed <= 60000:  # Only if in first minute
+                respawn_time = {
+                    7: 50000,  
+                    8: 30000,  
+                    9: 20000,  
+                    10: 15000  
+                }[self.level]
+                self.respawns.schedule(index, current_time + respawn_time)
+        
+        # 20% chance to spawn power-up
+        if self.rng.random() < 0.2:
+            brick_x, brick_y, brick_width, brick_height = self.bricks.rect(index)
+            self.powerups.append(
+                PowerUp(brick_x + brick_width//2 - 15, brick_y, self.rng.randint(1, 4))
+            )
     
     def next_level(self):
         self.stop_bgm()  # Stop BGM between levels
-        if self.level < 10:
+        if self.level < len(LEVELS):
             self.level += 1
             self.setup_level(self.level)
             self.level_complete = False
-            self.ball.dx = random.choice([-4, -3, 3, 4])
+            self.ball.dx = self.rng.choice([-4, -3, 3, 4])
             self.ball.dy = -4
             self.ball.manual_control = False  # Reset manual control for new level
             self.start_bgm()  # Start again if gameplay begins
             self.ball.reset()
 
             # Increase paddle speed after level 7
-            if self.level >= 7:
-                self.paddle.set_speed(self.paddle.base_speed * 1.7)  # 50% faster
-            else:
-                self.paddle.set_speed(self.paddle.base_speed)  # Reset to normal speed
+            for paddle in self.paddles:
+                if self.level >= 7:
+                    paddle.set_speed(paddle.base_speed * 1.7)  # 50% faster
+                else:
+                    paddle.set_speed(paddle.base_speed)  # Reset to normal speed
         else:
             # Game is won completely - just set flags, don't show credits yet
             self.game_over = True
@@ -1409,249 +1592,91 @@ class Game:
             return "game_won"  # Signal that game was won
         
     def setup_level(self, level):
-        self.bricks = []
         self.powerups = []
-        self.brick_respawn_timers = {}  # Clear respawn timers
-        self.level_start_time = pygame.time.get_ticks()  # Record level start time
+        self.extra_balls.clear()
+        self.respawns.clear()  # Clear respawn timers
+        self.level_start_time = self.game_time()  # Record level start time
         
-        # Calculate brick layout based on level
-        rows = min(3 + level // 3, 8)  # More rows as levels progress
-        cols = 8
-        brick_width = 80
-        brick_height = 25
-        
-        # Add gaps for higher levels
-        if level == 1:
-            col_gap = 10
-            row_gap = col_gap // 2
-        elif level == 2:
-            col_gap = 10
-            row_gap = 10
-        elif level == 3:
-            col_gap = 20  # Column gap size
-            row_gap = 13  # Row gap is half of column gap
-        elif level == 4:
-            col_gap = 30  # Column gap size
-            row_gap = col_gap // 2  # Row gap is half of column gap
-        elif level == 5:
-            col_gap = 40  # Column gap size
-            row_gap = col_gap // 2  # Row gap is half of column gap
-        elif level == 6:
-            col_gap = 50  # Column gap size
-            row_gap = col_gap // 2  # Row gap is half of column gap
-        else:
-            col_gap = 10  # Default padding
-            row_gap = 10
-
-        # Calculate total width of all bricks including gaps
-        total_bricks_width = cols * brick_width + (cols - 1) * col_gap
-        # Calculate starting x position to center the bricks
-        start_x = (SCREEN_WIDTH - total_bricks_width) // 2
-        
-        colors = [RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE]
-        points = [10, 20, 30, 40, 50, 60]  # Points per row
-        
-        for row in range(rows):
-            for col in range(cols):
-                # 10% chance for special brick in higher levels
-                special = (level > 3) and (random.random() < 0.1)
-                
-                brick_x = start_x + col * (brick_width + col_gap)
-                brick_y = 50 + row * (brick_height + row_gap)
-                
-                color = colors[row % len(colors)]
-                point_value = points[row % len(points)]
-                
-                self.bricks.append(Brick(brick_x, brick_y, brick_width, brick_height, color, point_value))
+        self.bricks = BrickField.from_level(LEVELS[level - 1], SCREEN_WIDTH, LEVELS.palette)
 
     def setup_audio(self):
-        # Initialize mixer if not already done
-        if pygame.mixer.get_init() is None:
-            pygame.mixer.init()
-
-        # Load BGM if not already loaded
-        try:
-            # Load BGM if not already loaded
-            if not hasattr(self, 'bgm') or self.bgm is None:
-                self.bgm = pygame.mixer.Sound(bgm_sound)
-            self.bgm.set_volume(0 if self.muted else self.bgm_volume)
-
-        except Exception as e:
-            self.bgm = None
-        
-        # Set SFX volumes
-        bounce_sound.set_volume(0 if self.muted else self.sfx_volume)
-        explosion_sound.set_volume(0 if self.muted else self.sfx_volume)
-        powerup_sound.set_volume(0 if self.muted else self.sfx_volume)
+        self.apply_volumes()
+
+    def apply_volumes(self):
+        # The audio manager only touches the mixer when a value really changes
+        audio.set_volume("music", self.bgm_volume)
+        audio.set_volume("sfx", self.sfx_volume)
+        audio.set_muted(self.muted)
     
     def start_bgm(self):
-        if not self.bgm_playing and self.bgm:
-            # Stop any currently playing music first
-            pygame.mixer.stop()
-            # Play the BGM with loops
-            self.bgm.play(loops=-1)  # -1 means loop indefinitely
+        # A frame re-run by netplay leaves the music (and this flag) as the first run did
+        if audio.is_silenced():
+            return
+        if not self.bgm_playing:
+            # Stop any currently playing effects first
+            audio.stop_category("sfx")
+            # Fade in the BGM once whatever is streaming has faded out
+            audio.play("bgm", loops=-1, fade_ms=MUSIC_FADE_MS)  # -1 means loop indefinitely
             self.bgm_playing = True
-            # Set volume again in case it was changed
-            self.bgm.set_volume(0 if self.muted else self.bgm_volume)
     
-    def stop_bgm(self):
+    def stop_bgm(self, fade_ms=0):
+        if audio.is_silenced():
+            return
         if self.bgm_playing:
-            self.bgm.stop()
+            audio.stop("bgm", fade_ms=fade_ms)
             self.bgm_playing = False
     
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.stop_bgm()  # Stop BGM when quitting
-                show_exit_credits()  # Show credits before quitting
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if self.show_pause_menu:
-                    menu_action = self.pause_menu.handle_input(event, self)
-                    if menu_action == "resume":
-                        self.show_pause_menu = False
-                        self.paused = False
-                    elif menu_action == "leaderboard":
-                        self.pause_menu.showing_leaderboard = True
-                    elif menu_action == "options":
-                        # Initialize options menu with current settings
-                        self.pause_menu.options_menu.bgm_volume = self.bgm_volume
-                        self.pause_menu.options_menu.sfx_volume = self.sfx_volume
-                        self.pause_menu.options_menu.muted = self.muted
-                        self.pause_menu.showing_options = True
-                    elif menu_action == "restart":
-                        self.__init__()  # Reset the game
-                        self.show_pause_menu = False
-                        self.paused = False
-                    elif menu_action == "exit":
-                        show_exit_credits()  # Show credits before quitting
-                        return False
-                    elif menu_action == "cheat":
-                        self.ball.manual_control = True
-                    elif menu_action == "reset_scores":
-                        self.leaderboard.scores = []
-                        self.leaderboard.save_scores()
-                        self.pause_menu.options_menu.reset_confirmation() 
-                    elif menu_action == "update_volume":
-                        # Update volumes from options menu
-                        self.bgm_volume = self.pause_menu.options_menu.bgm_volume
-                        self.sfx_volume = self.pause_menu.options_menu.sfx_volume
-                        self.muted = self.pause_menu.options_menu.muted
-                        
-                        # Apply volume changes immediately
-                        if self.bgm:
-                            self.bgm.set_volume(0 if self.muted else self.bgm_volume)
-                        bounce_sound.set_volume(0 if self.muted else self.sfx_volume)
-                        explosion_sound.set_volume(0 if self.muted else self.sfx_volume)
-                elif self.game_over:
-                    
-                    if event.key == pygame.K_r or event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        if self.level == 10 and self.level_complete:
-                            show_exit_credits()  # Only show credits when R is pressed after winning
-                            return "main_menu"  # Signal to return to main menu
-                        else:
-                            self.__init__()  # Restart game
-                    elif event.key == pygame.K_ESCAPE:
-                        self.show_pause_menu = True
-                        self.paused = True
-                elif not self.paused and not self.game_over and not self.show_pause_menu:  # Added condition for not paused
-                    if event.key == pygame.K_SPACE and not self.ball.active:
-                        self.ball.active = True
-                
-                if event.key == pygame.K_ESCAPE:
-                    if not self.game_over:
-                        if self.pause_menu.showing_leaderboard or self.pause_menu.showing_options:
-                            self.pause_menu.showing_leaderboard = False
-                            self.pause_menu.showing_options = False
-                        elif self.show_pause_menu:
-                            self.show_pause_menu = False
-                            self.paused = False
-                        else:
-                            self.show_pause_menu = True
-                            self.paused = True
-                    else:
-                        self.show_pause_menu = True
-                        self.paused = True
-                elif event.key == pygame.K_p and not self.game_over and not self.show_pause_menu:
-                    self.paused = not self.paused
-                elif event.key == pygame.K_r and not self.show_pause_menu:
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.stop_bgm()  # Stop BGM when quitting
+            show_exit_credits()  # Show credits before quitting
+            return "quit"
+        elif event.type == pygame.KEYDOWN:
+            if self.game_over and event.key in (pygame.K_r, pygame.K_RETURN, pygame.K_SPACE):
+                if self.level == len(LEVELS) and self.level_complete:
+                    show_exit_credits()  # Only show credits when R is pressed after winning
+                    return "main_menu"  # Signal to return to main menu
+                self.__init__()  # Restart game
+            elif event.key == pygame.K_SPACE and not self.game_over and not self.ball.active:
+                self.ball.active = True
+            elif event.key == pygame.K_ESCAPE:
+                self.stack.push(PauseMenu(self))
+            elif event.key == pygame.K_p and not self.game_over:
+                self.stack.push(PauseOverlay(self))
+            elif event.key == pygame.K_r:
+                self.__init__()  # Restart game
+                # Explicitly reset paddle speed (though __init__ already does this)
+                self.paddle.set_speed(self.paddle.base_speed)
+            elif event.key == pygame.K_o:  # Options shortcut, backing out lands in the pause menu
+                self.stack.push(PauseMenu(self))
+                self.stack.push(OptionsMenu(self))
+
+            # Cheat Activation
+            elif event.key == pygame.K_m:
+                # Start tracking mute press time
+                self.mute_press_time = pygame.time.get_ticks()
+                # Toggle mute state
+                self.muted = not self.muted
+                self.apply_volumes()
+
+        elif event.type == pygame.KEYUP:
+            if event.key == pygame.K_m:
+                # Reset mute press time when M key is released
+                self.mute_press_time = 0
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.game_over and event.button == 1:
+                mouse_pos = pygame.mouse.get_pos()
+                restart_text_rect = pygame.Rect(
+                    SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 60, 300, 30
+                )
+                if restart_text_rect.collidepoint(mouse_pos):
                     self.__init__()  # Restart game
-                    # Explicitly reset paddle speed (though __init__ already does this)
-                    self.paddle.set_speed(self.paddle.base_speed)
-                elif event.key == pygame.K_o and not self.show_pause_menu:  # Options shortcut
-                    self.show_pause_menu = True
-                    self.paused = True
-                    self.pause_menu.showing_options = True
-                    # Initialize options menu with current settings
-                    self.pause_menu.options_menu.bgm_volume = self.bgm_volume
-                    self.pause_menu.options_menu.sfx_volume = self.sfx_volume
-                    self.pause_menu.options_menu.muted = self.muted
-
-                # Cheat Activation
-                elif event.key == pygame.K_m:
-                    # Start tracking mute press time
-                    self.mute_press_time = pygame.time.get_ticks()
-                    # Toggle mute state
-                    self.muted = not self.muted
-                    if self.bgm:
-                        self.bgm.set_volume(0 if self.muted else self.bgm_volume)
-                    bounce_sound.set_volume(0 if self.muted else self.sfx_volume)
-                    explosion_sound.set_volume(0 if self.muted else self.sfx_volume)
-                    powerup_sound.set_volume(0 if self.muted else self.sfx_volume)
-                
-                elif event.type == pygame.KEYUP:
-                    if event.key == pygame.K_m:
-                        # Reset mute press time when M key is released
-                        self.mute_press_time = 0
-                        
+        return None
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.show_pause_menu:
-                    menu_action = self.pause_menu.handle_input(event)
-                    if menu_action == "resume":
-                        self.show_pause_menu = False
-                        self.paused = False
-                    elif menu_action == "leaderboard":
-                        self.pause_menu.showing_leaderboard = True
-                    elif menu_action == "options":
-                        # Initialize options menu with current settings
-                        self.pause_menu.options_menu.bgm_volume = self.bgm_volume
-                        self.pause_menu.options_menu.sfx_volume = self.sfx_volume
-                        self.pause_menu.options_menu.muted = self.muted
-                        self.pause_menu.showing_options = True
-                    elif menu_action == "restart":
-                        self.__init__()  # Reset the game
-                        self.show_pause_menu = False
-                        self.paused = False
-                    elif menu_action == "exit":
-                        show_exit_credits()  # Show credits before quitting
-                        return False
-                    elif menu_action == "reset_scores":
-                        self.leaderboard.scores = []
-                        self.leaderboard.save_scores()
-                        self.pause_menu.options_menu.reset_confirmation()
-                    elif menu_action == "update_volume":
-                        # Update volumes from options menu
-                        self.bgm_volume = self.pause_menu.options_menu.bgm_volume
-                        self.sfx_volume = self.pause_menu.options_menu.sfx_volume
-                        self.muted = self.pause_menu.options_menu.muted
-                        
-                        # Apply volume changes immediately
-                        self.bgm.set_volume(0 if self.muted else self.bgm_volume)
-                        bounce_sound.set_volume(0 if self.muted else self.sfx_volume)
-                        explosion_sound.set_volume(0 if self.muted else self.sfx_volume)
-
-                elif self.game_over and event.button == 1:
-                    mouse_pos = pygame.mouse.get_pos()
-                    restart_text_rect = pygame.Rect(
-                        SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 60, 300, 30
-                    )
-                    if restart_text_rect.collidepoint(mouse_pos):
-                        self.__init__()  # Restart game
-        
+    def update_cheat(self, keys):
         # Handle cheat activation/deactivation
         current_time = pygame.time.get_ticks()
-        keys = pygame.key.get_pressed()
 
         # Check if M key is being held down for 5 seconds
         if self.mute_press_time > 0 and (current_time - self.mute_press_time) >= 5000:
@@ -1669,27 +1694,26 @@ class Game:
                 self.ball.manual_control = False
         else:
             self.ball.manual_control = False
-        
-        return True
-    
+
     def draw(self, surface):
         surface.fill(BLACK)
         
         # Draw game elements
-        self.paddle.draw(surface)
+        for paddle in self.paddles:
+            paddle.draw(surface)
         self.ball.draw(surface)
+        self.extra_balls.draw(surface)
         
-        for brick in self.bricks:
-            brick.draw(surface)
+        self.bricks.draw(surface)
         
         for powerup in self.powerups:
             powerup.draw(surface)
         
         # Draw UI
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         score_text = font.render(f'Score: {self.score}', True, WHITE)
         lives_text = font.render(f'Lives: {self.lives}', True, WHITE)
-        level_text = font.render(f'Level: {self.level}/10', True, WHITE)
+        level_text = font.render(f'Level: {self.level}/{len(LEVELS)}', True, WHITE)
         high_score = self.leaderboard.get_high_score()
         high_score_text = font.render(f'High Score: {high_score}', True, YELLOW)
         
@@ -1699,18 +1723,19 @@ class Game:
         surface.blit(high_score_text, (10, 130))
         
         # Draw powerup legend
-        legend_font = pygame.font.Font(None, 20)
+        legend_font = get_font(20)
         legends = [
             ("Green: Extra Life", GREEN),
             ("Yellow: Paddle Expand", YELLOW),
-            ("Blue: Ball Slow Down", BLUE)
+            ("Blue: Ball Slow Down", BLUE),
+            ("White: Multiball", WHITE)
         ]
         for i, (text, color) in enumerate(legends):
             legend_text = legend_font.render(text, True, color)
             surface.blit(legend_text, (10, 180 + i * 22))
         
         # Draw controls reminder
-        controls_font = pygame.font.Font(None, 24)
+        controls_font = get_font(24)
         controls = [
             "Movement- Left/Right:A/D",
             "SPACE: Launch Ball",
@@ -1718,24 +1743,23 @@ class Game:
             "ESC: Menu",
             "R: Restart",
             "O: Options"
+        ] if self.players == 1 else [
+            "Movement- Left/Right:A/D",
+            "SPACE: Launch Ball",
+            "ESC: Leave"
         ]
         for i, control in enumerate(controls):
             text = controls_font.render(control, True, WHITE)
             surface.blit(text, (SCREEN_WIDTH - 220, 10 + i * 25))
         
-        if self.show_pause_menu:
-            self.pause_menu.draw(surface, self.leaderboard, self)
-        elif self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(BLACK)
-            surface.blit(overlay, (0, 0))
+        if self.game_over:
+            dim(surface, 180)
             
-            big_font = pygame.font.Font(None, 72)
-            small_font = pygame.font.Font(None, 36)
+            big_font = get_font(72)
+            small_font = get_font(36)
             
             # Show different message if all levels completed
-            if self.level == 10 and self.level_complete:
+            if self.level == len(LEVELS) and self.level_complete:
                 game_over_text = big_font.render('Victory secured — you dominated the game!', True, GREEN)
             else:
                 game_over_text = big_font.render('GAME OVER', True, RED)
@@ -1747,7 +1771,8 @@ class Game:
                 new_record_text = small_font.render('NEW HIGH SCORE!', True, YELLOW)
                 surface.blit(new_record_text, new_record_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80)))
             
-            restart_text = small_font.render('Press Space to Continue', True, WHITE)
+            prompt = 'Press Space to Continue' if self.players == 1 else 'Press ESC to Leave'
+            restart_text = small_font.render(prompt, True, WHITE)
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70))
             surface.blit(restart_text, restart_rect)
             
@@ -1755,37 +1780,20 @@ class Game:
             surface.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)))
             surface.blit(level_text, level_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30)))
         elif self.level_complete:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(BLACK)
-            surface.blit(overlay, (0, 0))
+            dim(surface, 180)
             
-            big_font = pygame.font.Font(None, 72)
-            small_font = pygame.font.Font(None, 36)
+            big_font = get_font(72)
+            small_font = get_font(36)
             
             level_complete_text = big_font.render(f'LEVEL {self.level} COMPLETE!', True, GREEN)
             next_text = small_font.render('Press SPACE to continue to next level', True, WHITE)
             
             surface.blit(level_complete_text, level_complete_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40)))
             surface.blit(next_text, next_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 190)))
-        elif self.paused and not self.show_pause_menu:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(BLACK)
-            surface.blit(overlay, (0, 0))
-            
-            big_font = pygame.font.Font(None, 72)
-            small_font = pygame.font.Font(None, 36)
-            
-            pause_text = big_font.render('PAUSED', True, YELLOW)
-            resume_text = small_font.render('Press P to resume or ESC for menu', True, WHITE)
-            
-            surface.blit(pause_text, pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40)))
-            surface.blit(resume_text, resume_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20)))
         
         # Draw launch prompt if ball is inactive
-        if not self.ball.active and not self.game_over and not self.level_complete and not self.paused:
-            small_font = pygame.font.Font(None, 36)
+        if not self.ball.active and not self.game_over and not self.level_complete:
+            small_font = get_font(36)
             launch_text = small_font.render('Press SPACE to launch ball', True, WHITE)
             surface.blit(launch_text, launch_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 190)))
 
@@ -1797,28 +1805,88 @@ class Game:
                 cheat_text = font.render('CHEAT DEACTIVATED', True, RED)
             surface.blit(cheat_text, (SCREEN_WIDTH//2 - 110, SCREEN_HEIGHT - 100))
 
+class NetplayScene(Scene):
+    """Co-op over the network: each side steers one paddle of a shared game.
+
+    The game only moves through the RollbackSession, which runs it with both
+    players' inputs, so it is created once the handshake has agreed on a
+    seed and is never updated directly.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.game = None
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "quit"
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            return "main_menu"
+        return None
+
+    def update(self):
+        if self.game is None:
+            if self.session.connect():
+                self.game = Game(players=2, seed=self.session.seed)
+                self.session.start(self.game)
+            return None
+        self.session.advance(self.game.read_input(pygame.key.get_pressed()))
+        return None
+
+    def draw(self, surface):
+        font = get_font(36)
+        if self.game is None:
+            surface.fill(BLACK)
+            waiting = "Waiting for player 2..." if self.session.player == 0 else "Connecting..."
+            text = font.render(waiting, True, WHITE)
+            surface.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)))
+            return
+        self.game.draw(surface)
+
+        session = self.session
+        status = get_font(20).render(
+            f"Player {session.player + 1}  rollbacks {session.rollbacks}  waits {session.waits}", True, GRAY)
+        surface.blit(status, (SCREEN_WIDTH - 220, 100))
+        if session.silence() > 2:
+            text = font.render("Waiting for the other player...", True, YELLOW)
+            surface.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 120)))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Brick Breaker")
+    parser.add_argument("--host", type=int, nargs="?", const=NETPLAY_PORT, metavar="PORT",
+                        help=f"host a two-player co-op game (default port {NETPLAY_PORT})")
+    parser.add_argument("--join", metavar="HOST[:PORT]", help="join a co-op game")
+    # For trying netplay out on one machine
+    parser.add_argument("--latency", type=float, default=0, metavar="MS", help="delay every packet sent")
+    parser.add_argument("--jitter", type=float, default=0, metavar="MS", help="plus up to this much at random")
+    parser.add_argument("--loss", type=float, default=0, metavar="FRACTION", help="drop this share of packets")
+    # The launcher may add --prewarm, which wait_for_launch() handles
+    args, _ = parser.parse_known_args()
+    return args
+
+def open_session(args):
+    """The RollbackSession for --host or --join."""
+    # Imported here so a single-player start doesn't load the networking code
+    from retro_arcade.netplay import LossyLink, RollbackSession, UdpLink
+
+    if args.join:
+        host, _, port = args.join.partition(":")
+        link, player = UdpLink(peer=(host, int(port or NETPLAY_PORT))), 1
+    else:
+        link, player = UdpLink(args.host), 0
+    if args.latency or args.jitter or args.loss:
+        link = LossyLink(link, args.latency, args.jitter, args.loss)
+    return RollbackSession(link, player, quiet=audio.silenced)
+
 def show_exit_credits():
     """Display exit credits sequence with scrolling credits and dedicated outro music"""
     # Stop any currently playing sounds
     pygame.mixer.stop()
     
-    # Load outro music
-    outro_music_path = get_data_path("outro_music.wav")
-    try:
-        outro_music = pygame.mixer.Sound(outro_music_path)
-        outro_music.set_volume(0.7)
-        outro_music.play(loops=-1)
-    except:
-        outro_music = None
-    
-    # Initialize parameters
-    rolling_text_y = SCREEN_HEIGHT  # Start below screen
-    rolling_text_speed = 2  # Pixels per frame
-    total_duration = 14000  # 14 seconds total
-    start_time = pygame.time.get_ticks()
+    # Stream the outro music in place of whatever was playing
+    audio.play("outro", loops=-1)
     
     # Define credits content
-    credit_font = pygame.font.Font(None, 32)
     credits = [
         "BRICK BREAKER",
         "",
@@ -1854,202 +1922,68 @@ def show_exit_credits():
     skip_keys.update(range(pygame.K_a, pygame.K_z + 1))  # a-z
     skip_keys.update(range(pygame.K_0, pygame.K_9 + 1))  # 0-9
     
-    # Main loop
-    running = True
-    while running:
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - start_time
-        
-        # Check if total duration has been reached
-        if elapsed >= total_duration:
-            if outro_music:
-                outro_music.stop()
-            return "main_menu"
-        
-        # Handle events (allow skipping only for specific keys)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                if outro_music:
-                    outro_music.stop()
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in skip_keys:
-                    if outro_music:
-                        outro_music.stop()
-                    return "main_menu"
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                if outro_music:
-                    outro_music.stop()
-                return "main_menu"
-        
-        # Update credits scrolling
-        rolling_text_y -= rolling_text_speed
-        if rolling_text_y < -2000:  # End when credits scroll past
-            if outro_music:
-                outro_music.stop()
-            return "main_menu"
-        
-        # Draw everything
-        screen.fill(BLACK)
-        
-        # Draw scrolling credits
-        y_pos = rolling_text_y
-        for credit in credits:
-            if credit:
-                text = credit_font.render(credit, True, WHITE)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-                screen.blit(text, text_rect)
-            y_pos += 40
-        
-        pygame.display.flip()
-        clock.tick(FPS)
-    
-    # Clean up music if we exit early
-    if outro_music:
-        outro_music.stop()
+    result = run_credits(screen, credits, skip_keys, fps=FPS)
+    audio.stop("outro")
+    return "quit" if result == "quit" else "main_menu"
 
 def main():
     try:
-        # Initialize sound system
-        pygame.mixer.init()
+        args = parse_args()
+        netplay = args.host is not None or args.join
+
+        # Initialize pygame, sounds and the window
+        create_app(NETPLAY_SIZE if netplay else None)
         
         # Stop any currently playing sounds
         pygame.mixer.stop()
-        
-        # Load and play intro music
-        try:
-            intro_music = pygame.mixer.Sound(get_data_path("intro_music.wav"))
-            intro_music.set_volume(1.0)
-            intro_music.play(loops=-1)
-        except:
-            intro_music = None
+
+        if netplay:
+            session = open_session(args)
+            scene = NetplayScene(session)
+            run_scene(scene, screen, FPS, on_frame=audio.begin_frame)
+            session.close()
+            if scene.game is not None:
+                scene.game.stop_bgm()
+            pygame.quit()
+            sys.exit()
+        
+        # Play intro music
+        audio.play("intro", loops=-1)
         
         leaderboard = LeaderBoard()
         
-        # First show logo screen with credits
-        logo_screen = LogoScreen()
-        logo_start_time = pygame.time.get_ticks()
-        logo_duration = 15000  # 26 seconds for credits
-        
-        while True:
-            current_time = pygame.time.get_ticks()
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    if intro_music:
-                        intro_music.stop()
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    # Allow skipping the logo screen
-                    logo_screen.show_credits = True
-                    logo_start_time = current_time - logo_duration  # Force completion
-            
-            # Update logo screen
-            if logo_screen.update():
-                break
-            
-            # Check if 26 seconds have passed
-            if current_time - logo_start_time >= logo_duration:
-                break
-            
-            # Draw logo screen
-            logo_screen.draw(screen)
-            pygame.display.flip()
-            clock.tick(FPS)
-        
-        # Then show title screen
-        title_screen = TitleScreen(leaderboard)
-        
-        while title_screen.show_title:
-            for event in pygame.event.get():
-                result = title_screen.handle_events(event)
-                if result is False:
-                    if intro_music:
-                        intro_music.stop()
-                    pygame.quit()
-                    sys.exit()
-                elif result is True:
-                    # Stop intro music when game starts
-                    if intro_music:
-                        intro_music.stop()
-                    title_screen.show_title = False
-                    break
-            
-            title_screen.update()
-            title_screen.draw(screen)
-            pygame.display.flip()
-            clock.tick(FPS)
-        
-        # Finally start the game
-        game = Game()
-        game.leaderboard = leaderboard
+        # First show logo screen with credits; any key or click skips it
+        logo_screen = LogoScreen([
+            get_data_path("DD Lab1.png"),
+            (get_data_path("logo1.png"), get_data_path("logo2.jpg")),
+            get_data_path("brick_breaker.jpg")
+        ])
+        if run_scene(logo_screen, screen, FPS) == "quit":
+            audio.stop("intro")
+            pygame.quit()
+            sys.exit()
         
+        # Then alternate between the title screen and the game
         while True:
-            # Handle game events
-            result = game.handle_events()
-            if result == "main_menu":
-                # Show title screen again
-                title_screen = TitleScreen(leaderboard)
-                title_screen.show_title = True
-                # Stop any game music and play intro music again
-                game.stop_bgm()
-                try:
-                    intro_music = pygame.mixer.Sound(get_data_path("intro_music.wav"))
-                    intro_music.set_volume(0.7)
-                    intro_music.play(loops=-1)
-                except:
-                    pass
-                
-                # Show title screen
-                while title_screen.show_title:
-                    for event in pygame.event.get():
-                        result = title_screen.handle_events(event)
-                        if result is False:
-                            if intro_music:
-                                intro_music.stop()
-                            pygame.quit()
-                            sys.exit()
-                        elif result is True:
-                            # Stop intro music when game starts
-                            if intro_music:
-                                intro_music.stop()
-                            title_screen.show_title = False
-                            break
-                    
-                    title_screen.update()
-                    title_screen.draw(screen)
-                    pygame.display.flip()
-                    clock.tick(FPS)
-                
-                # Start a new game
-                game = Game()
-                game.leaderboard = leaderboard
-                continue
-            elif result is False:
+            title_screen = TitleScreen(leaderboard)
+            if run_scene(title_screen, screen, FPS, on_frame=audio.begin_frame) == "quit":
+                audio.stop("intro")
+                pygame.quit()
+                sys.exit()
+
+            # Fade out intro music when game starts
+            audio.stop("intro", fade_ms=MUSIC_FADE_MS)
+            game = Game()
+            game.leaderboard = leaderboard
+
+            # Menus are pushed on top of the game and run on their own
+            result = run_scene(SceneStack(game), screen, FPS, on_frame=audio.begin_frame)
+            if result != "main_menu":
                 break
-            
-            # Handle game updates
-            if not game.paused and not game.show_pause_menu:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                    game.paddle.move("left")
-                if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                    game.paddle.move("right")
-            
-            if game.level_complete and pygame.key.get_pressed()[pygame.K_SPACE]:
-                level_result = game.next_level()
-                if level_result == "game_won":
-                    # Wait for R key to be pressed to show credits
-                    pass
-            
-            game.update()
-            game.draw(screen)
-            pygame.display.flip()
-            clock.tick(FPS)
+
+            # Fade from the game music back to the intro music
+            game.stop_bgm(fade_ms=MUSIC_FADE_MS)
+            audio.play("intro", loops=-1, fade_ms=MUSIC_FADE_MS)
         
         game.stop_bgm()
         pygame.quit()
@@ -5,6 +5,12 @@ import os
 import sys
 import pygame
 import threading
+import queue
+import hashlib
+import platform
+import time
+
+from retro_arcade.audio import AudioManager
 
 # Initialize Pygame mixer
 pygame.mixer.init()
@@ -32,6 +38,72 @@ def resource_path(relative_path):
         return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative_path)
 
 
+def get_cache_dir():
+    """Writable folder for launcher caches (outlives the PyInstaller temp dir)"""
+    if platform.system() == "Windows":
+        base_dir = os.path.join(os.getenv('APPDATA'), 'RetroArcade')
+    else:  # Linux/Mac
+        base_dir = os.path.join(os.path.expanduser("~"), '.retroarcade')
+
+    cache_dir = os.path.join(base_dir, 'thumbnails')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+# --- Image Cache ---
+TILE_SIZE = (200, 200)
+
+# Hover tiles are 30% brighter; a lookup table lets PIL apply it without a Python callback
+BRIGHT_LUT = [min(int(p * 1.3), 255) for p in range(256)]
+
+def brighten(img):
+    bands = img.getbands()
+    if "A" in bands:
+        # Leave the alpha band untouched
+        return img.point(BRIGHT_LUT * (len(bands) - 1) + list(range(256)))
+    return img.point(BRIGHT_LUT * len(bands))
+
+
+class ThumbnailCache:
+    """Resized images and their bright hover variants, cached as PNGs on disk.
+
+    Entries are keyed by the source path, mtime and file size plus the target
+    size, so replacing an image simply produces a new entry.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def entry_path(self, path, size, variant):
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{digest}_{variant}.png")
+
+    def get(self, path, size, variant="normal", resample=Image.BICUBIC):
+        cached = self.entry_path(path, size, variant)
+        if os.path.exists(cached):
+            try:
+                with Image.open(cached) as img:
+                    return img.copy()
+            except OSError:
+                pass  # Corrupt entry, rebuild it below
+
+        if variant == "bright":
+            img = brighten(self.get(path, size, resample=resample))
+        else:
+            with Image.open(path) as source:
+                if source.mode not in ("RGB", "RGBA", "L"):
+                    source = source.convert("RGBA")
+                img = source.resize(size, resample)
+
+        try:
+            img.save(cached)
+        except OSError as e:
+            print(f"Cache error: {e}")
+        return img
+
+
 # --- Sound Functions ---
 def play_music():
     try:
@@ -41,47 +113,221 @@ def play_music():
     except Exception as e:
         print(f"Music error: {e}")
 
+# Sound effects share a small pool of channels; hover is throttled so
+# sweeping the mouse across the tiles doesn't stack up copies of it
+sfx = AudioManager({"sfx": 4})
+
+def load_sounds():
+    """Decode the sound effects once, off the Tk thread (unloaded sounds are skipped)"""
+    sfx.load("click", resource_path("assets/click.wav"))
+    sfx.load("hover", resource_path("assets/hover.wav"), min_interval=120)
+    sfx.load("error", resource_path("assets/error.wav"), min_interval=250)
+
+def play_sfx(name):
+    # The launcher has no frame loop, so every UI event counts as a new frame
+    sfx.begin_frame()
+    sfx.play(name)
+
 def play_click_sound():
-    try:
-        pygame.mixer.Sound(resource_path("assets/click.wav")).play()
-    except:
-        pass
+    play_sfx("click")
 
 def play_hover_sound():
-    try:
-        pygame.mixer.Sound(resource_path("assets/hover.wav")).play()
-    except:
-        pass
+    play_sfx("hover")
 
 def play_error_sound():
-    try:
-        pygame.mixer.Sound(resource_path("assets/error.wav")).play()
-    except:
-        pass
+    play_sfx("error")
+
+
+# --- Game Processes ---
+PREWARM_GAMES = True
+PREWARM_TIMEOUT = 30  # Seconds a parked game gets to report "ready"
+MAX_PREWARM_RESTARTS = 3
+POLL_INTERVAL_MS = 250
+
+
+def stop_process(process, timeout=2):
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class GameSupervisor:
+    """Tracks one child process per game and keeps a parked copy of each ready.
+
+    A parked game is started with --prewarm: it imports pygame, loads its
+    sounds, prints "ready" and then blocks on stdin before opening a window
+    (see retro_arcade.prewarm). Launching it just writes "go" to that pipe.
+    poll() has to be called regularly from the Tk thread.
+    """
+
+    def __init__(self, on_game_exit=None):
+        self.running = {}  # exe path -> Popen of the game being played
+        self.parked = {}  # exe path -> {"process", "started", "ready"}
+        self.restarts = {}  # exe path -> failed prewarms in a row
+        self.on_game_exit = on_game_exit
+
+    def is_running(self, exe_path):
+        process = self.running.get(exe_path)
+        return process is not None and process.poll() is None
+
+    def prewarm(self, exe_path):
+        if exe_path in self.parked or self.is_running(exe_path) or not os.path.exists(exe_path):
+            return
+        try:
+            process = subprocess.Popen(
+                [exe_path, "--prewarm"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+            )
+        except OSError as e:
+            print(f"Prewarm error: {e}")
+            return
+
+        entry = {"process": process, "started": time.monotonic(), "ready": threading.Event()}
+        self.parked[exe_path] = entry
+        threading.Thread(target=self.watch_output, args=(entry,), daemon=True).start()
+
+    def watch_output(self, entry):
+        # Worker thread: wait for "ready", then keep draining so the game never blocks on a full pipe
+        for line in entry["process"].stdout:
+            if line.strip() == "ready":
+                entry["ready"].set()
+
+    def launch(self, exe_path):
+        """Wake the parked game or start a fresh one; False if it is already running"""
+        if self.is_running(exe_path):
+            return False
+
+        entry = self.parked.pop(exe_path, None)
+        if entry is not None and entry["process"].poll() is None:
+            try:
+                # Still loading is fine too, it picks this up as soon as it is ready
+                entry["process"].stdin.write("go\n")
+                entry["process"].stdin.flush()
+                self.running[exe_path] = entry["process"]
+                return True
+            except OSError:
+                stop_process(entry["process"])
+
+        self.running[exe_path] = subprocess.Popen([exe_path])
+        return True
+
+    def poll(self):
+        """Reap finished games, restart parked games that died and time out stuck ones"""
+        for exe_path, process in list(self.running.items()):
+            if process.poll() is not None:
+                del self.running[exe_path]
+                if self.on_game_exit:
+                    self.on_game_exit(exe_path, process.returncode)
+                if PREWARM_GAMES:
+                    self.prewarm(exe_path)
+
+        now = time.monotonic()
+        for exe_path, entry in list(self.parked.items()):
+            process = entry["process"]
+            if entry["ready"].is_set() and process.poll() is None:
+                self.restarts[exe_path] = 0
+                continue
+            if process.poll() is None and now - entry["started"] < PREWARM_TIMEOUT:
+                continue  # Still loading
+
+            # Died while parked or never reported ready
+            stop_process(process, timeout=0.5)
+            del self.parked[exe_path]
+            self.restarts[exe_path] = self.restarts.get(exe_path, 0) + 1
+            if self.restarts[exe_path] <= MAX_PREWARM_RESTARTS:
+                self.prewarm(exe_path)
+            else:
+                print(f"Giving up on prewarming {exe_path}")
+
+    def shutdown(self):
+        # Parked games go away with the launcher; games being played keep running
+        for entry in self.parked.values():
+            stop_process(entry["process"])
+        self.parked.clear()
 
 
 class RetroArcadeLauncher:
     def __init__(self, root):
         self.root = root
+        threading.Thread(target=load_sounds, daemon=True).start()
         self.root.title("🕹️ CORTEX Retro Arcade Launcher")
         self.root.state('zoomed')
         self.root.attributes("-fullscreen", True)
-        self.set_background(resource_path("assets/bg.jpg"))
+        self.root.configure(bg='black')  # Shown until the background image is decoded
         tk.Label(root, text="CORTEX RETRO ARCADE", font=("Press Start 2P", 20), fg="#00FF00", bg="black").pack(pady=20)
-        self.game_buttons()
+
+        # Images are decoded on a worker thread and handed back through this queue
+        self.thumbnails = ThumbnailCache(get_cache_dir())
+        self.image_queue = queue.Queue()
+        self.pending_images = 0
+
+        games = self.game_buttons()
         self.add_control_buttons()
+        self.load_images_async(resource_path("assets/bg.jpg"), games)
         play_music()
 
-    def set_background(self, image_path):
+        self.supervisor = GameSupervisor(on_game_exit=self.on_game_exit)
+        if PREWARM_GAMES:
+            for game in games:
+                self.supervisor.prewarm(game["exe"])
+        self.root.after(POLL_INTERVAL_MS, self.poll_games)
+
+    def load_images_async(self, background_path, games):
+        screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        self.pending_images = len(games) + 1
+        threading.Thread(target=self.load_images, args=(background_path, screen_size, games), daemon=True).start()
+        self.root.after(15, self.poll_images)
+
+    def load_images(self, background_path, screen_size, games):
+        """Worker thread: decode and resize images (PhotoImages are made on the Tk thread)"""
         try:
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            bg_img = Image.open(image_path).resize((screen_width, screen_height), Image.LANCZOS)
-            self.bg_photo = ImageTk.PhotoImage(bg_img)
-            tk.Label(self.root, image=self.bg_photo).place(x=0, y=0, relwidth=1, relheight=1)
+            bg_img = self.thumbnails.get(background_path, screen_size, resample=Image.LANCZOS)
+            self.image_queue.put(("background", None, bg_img, None))
         except Exception as e:
-            print(f"Background error: {e}")
-            self.root.configure(bg='black')
+            self.image_queue.put(("background", None, None, e))
+
+        for game in games:
+            try:
+                img = self.thumbnails.get(game["img"], TILE_SIZE)
+                bright_img = self.thumbnails.get(game["img"], TILE_SIZE, "bright")
+                self.image_queue.put(("tile", game, (img, bright_img), None))
+            except Exception as e:
+                self.image_queue.put(("tile", game, None, e))
+
+    def poll_images(self):
+        while True:
+            try:
+                kind, game, images, error = self.image_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.pending_images -= 1
+
+            if kind == "background":
+                self.set_background(images, error)
+            elif error is None:
+                self.set_tile_images(game["button"], *images)
+            else:
+                print(f"Error loading {game['name']}: {error}")
+                self.show_error(f"Image missing for {game['name']}")
+
+        if self.pending_images > 0:
+            self.root.after(15, self.poll_images)
+
+    def set_background(self, bg_img, error=None):
+        if error is not None:
+            print(f"Background error: {error}")
+            return
+        self.bg_photo = ImageTk.PhotoImage(bg_img)
+        bg_label = tk.Label(self.root, image=self.bg_photo)
+        bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        bg_label.lower()  # Keep it behind the widgets that are already packed
+
+    def set_tile_images(self, button, img, bright_img):
+        button.image = ImageTk.PhotoImage(img)
+        button.bright_image = ImageTk.PhotoImage(bright_img)
+        button.config(image=button.image)
 
     def add_control_buttons(self):
         control_frame = tk.Frame(self.root, bg="black")
@@ -98,6 +344,7 @@ class RetroArcadeLauncher:
     def exit_app(self):
         play_click_sound()
         pygame.mixer.music.stop()
+        self.supervisor.shutdown()
         self.root.destroy()
 
     def game_buttons(self):
@@ -117,38 +364,40 @@ class RetroArcadeLauncher:
                 btn_frame.grid(row=i // 2, column=i % 2, padx=30, pady=20)
                 btn_frame.pack_propagate(False)
 
-                img = Image.open(game["img"]).resize((200, 200))
-                photo = ImageTk.PhotoImage(img)
-                bright_photo = ImageTk.PhotoImage(img.point(lambda p: min(int(p * 1.3), 255)))
-
                 border_canvas = tk.Canvas(btn_frame, bg="black", highlightthickness=0, width=210, height=210)
                 border_canvas.pack(expand=True)
                 border_id = border_canvas.create_rectangle(5, 5, 205, 205, outline="", width=4)
 
+                # The logo is filled in by poll_images once it has been decoded
                 btn = tk.Button(
-                    border_canvas, image=photo, command=lambda exe=game["exe"]: self.launch_game(exe),
+                    border_canvas, command=lambda exe=game["exe"]: self.launch_game(exe),
                     bd=0, bg="black", activebackground="black", highlightthickness=0, relief='flat'
                 )
-                btn.image = photo
-                btn.bright_image = bright_photo
+                btn.image = None
+                btn.bright_image = None
                 btn.border_canvas = border_canvas
                 btn.border_id = border_id
                 border_canvas.create_window(105, 105, window=btn, width=200, height=200)
 
                 btn.bind("<Enter>", lambda e, b=btn: self.on_hover_enter(b))
                 btn.bind("<Leave>", lambda e, b=btn: self.on_hover_leave(b))
+                game["button"] = btn
 
             except Exception as e:
                 print(f"Error loading {game['name']}: {e}")
                 self.show_error(f"Image missing for {game['name']}")
 
+        return [game for game in games if "button" in game]
+
     def on_hover_enter(self, button):
-        button.config(image=button.bright_image)
+        if button.bright_image:
+            button.config(image=button.bright_image)
         self.animate_border_glow(button)
         play_hover_sound()
 
     def on_hover_leave(self, button):
-        button.config(image=button.image)
+        if button.image:
+            button.config(image=button.image)
         if hasattr(button, "hover_after_ids"):
             for after_id in button.hover_after_ids:
                 button.border_canvas.after_cancel(after_id)
@@ -167,19 +416,13 @@ class RetroArcadeLauncher:
         button.hover_after_ids.append(final_id)
 
     def launch_game(self, exe_path):
+        if self.supervisor.is_running(exe_path):
+            return  # Ignore repeated clicks while the game is up
         play_click_sound()
         if os.path.exists(exe_path):
             try:
                 pygame.mixer.music.stop()
-
-                def run_game():
-                    try:
-                        process = subprocess.Popen([exe_path], shell=True)
-                        process.wait()  # Wait until the game exits
-                    finally:
-                        play_music()
-
-                threading.Thread(target=run_game, daemon=True).start()
+                self.supervisor.launch(exe_path)
 
             except Exception as e:
                 play_error_sound()
@@ -188,6 +431,13 @@ class RetroArcadeLauncher:
             play_error_sound()
             self.show_error(f"File not found: {exe_path}")
 
+    def on_game_exit(self, exe_path, returncode):
+        if not self.supervisor.running:
+            play_music()
+
+    def poll_games(self):
+        self.supervisor.poll()
+        self.root.after(POLL_INTERVAL_MS, self.poll_games)
 
     def show_error(self, message):
         error = tk.Toplevel(self.root)
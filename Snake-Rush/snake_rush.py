@@ -1,78 +1,79 @@
 import pygame
 import sys
 import random
+import time
+from collections import deque
 from datetime import datetime
-import json
+from itertools import chain, islice, repeat
 import os
-import platform
 
-# Initialize pygame early for sound/mixer
-pygame.init()
-pygame.mixer.init()
+# Shared arcade runtime lives alongside the game folders
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from retro_arcade.audio import AudioManager
+from retro_arcade.credits import run_credits
+from retro_arcade.display import open_window
+from retro_arcade.fonts import get_font
+from retro_arcade.grid import ChunkedGrid
+from retro_arcade.leaderboard import LeaderboardStore
+from retro_arcade.logos import LogoScreen
+from retro_arcade.overlays import dim
+from retro_arcade.paths import data_path, writable_path
+from retro_arcade.prewarm import wait_for_launch
+from retro_arcade.replay import TurnLog
+from retro_arcade.scene import Scene, SceneStack, run_scene
+from retro_arcade.ui import Button, ToggleButton
 
 # Determine the correct paths for data files
 def get_data_path(filename):
-    # If we're running as a PyInstaller bundle
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    
-    return os.path.join(base_path, filename)
+    return data_path(__file__, filename)
 
 def get_writable_path(filename):
-    # Get appropriate writable location based on OS
-    if platform.system() == "Windows":
-        appdata = os.getenv('APPDATA')
-        save_dir = os.path.join(appdata, 'SnakeRush')
-    else:  # Linux/Mac
-        home = os.path.expanduser("~")
-        save_dir = os.path.join(home, '.snakerush')
-    
-    os.makedirs(save_dir, exist_ok=True)
-    return os.path.join(save_dir, filename)
-
-# Sound files
-try:
-    game_bg = pygame.mixer.Sound(get_data_path("snake_rush_bgm.wav"))
-    game_bg.set_volume(0.6)
-    game_over_sound = pygame.mixer.Sound(get_data_path("game_over.wav"))
-    game_over_sound.set_volume(0.9)
-    food_capture_sound = pygame.mixer.Sound(get_data_path("food_capture_sound.wav"))
-    food_capture_sound.set_volume(0.7)
-except:
-    # Fallback if sound files aren't found
-    class DummySound:
-        def play(self): pass
-        def stop(self): pass
-        def set_volume(self, vol): pass
-    
-    game_bg = DummySound()
-    game_over_sound = DummySound()
-    food_capture_sound = DummySound()
+    return writable_path('SnakeRush', filename)
 
-# Leaderboard file path
-LEADERBOARD_FILE = get_writable_path("snake_rush_leaderboard.json")
+FPS = 60
+BLOCK_SIZE = 30
+# Logical resolution (64x36 cells); SDL scales it to the display
+LOGICAL_SIZE = (1920, 1080)
 
-# Settings Variables
-bgm_muted = False
-sfx_muted = False
-game_bg_playing = False
-fullscreen = False
+# Set up by create_app(); importing this module has no side effects
+audio = None
+screen = None
+GRID_WIDTH, GRID_HEIGHT = 0, 0
+SCREEN_WIDTH, SCREEN_HEIGHT = 0, 0
+LEADERBOARD_FILE = None
 
-FPS = 60
-clock = pygame.time.Clock()
+def create_app():
+    """Initialize pygame, load the sounds and open the window (once)."""
+    global audio, screen, GRID_WIDTH, GRID_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, LEADERBOARD_FILE
+    if screen is not None:
+        return screen
 
-# Calculate grid-aligned screen dimensions
-BLOCK_SIZE = 30
-info = pygame.display.Info()
-GRID_WIDTH = info.current_w // BLOCK_SIZE
-GRID_HEIGHT = info.current_h // BLOCK_SIZE
-SCREEN_WIDTH = GRID_WIDTH * BLOCK_SIZE
-SCREEN_HEIGHT = GRID_HEIGHT * BLOCK_SIZE
+    pygame.init()
+    pygame.mixer.init()
+
+    # Sound banks (missing files simply stay silent)
+    audio = AudioManager({"sfx": 4})
+    audio.load("game_over", get_data_path("game_over.wav"), volume=0.9)
+    audio.load("food_capture", get_data_path("food_capture_sound.wav"), volume=0.7)
+    # Music is streamed from disk (an .ogg beside the .wav is preferred)
+    audio.stream("bgm", get_data_path("snake_rush_bgm.wav"), volume=0.3)
+    audio.stream("outro", get_data_path("outro_music.wav"), volume=0.7)
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption('Snake Rush - Endless Mode')
+    # Leaderboard file path
+    LEADERBOARD_FILE = get_writable_path("snake_rush_leaderboard.json")
+
+    # When pre-warmed by the launcher, wait here until the player picks this game
+    wait_for_launch()
+
+    # Grid-aligned logical screen, the same on every display
+    GRID_WIDTH = LOGICAL_SIZE[0] // BLOCK_SIZE
+    GRID_HEIGHT = LOGICAL_SIZE[1] // BLOCK_SIZE
+    SCREEN_WIDTH = GRID_WIDTH * BLOCK_SIZE
+    SCREEN_HEIGHT = GRID_HEIGHT * BLOCK_SIZE
+
+    screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen=True)
+    pygame.display.set_caption('Snake Rush - Endless Mode')
+    return screen
 
 # Colors
 BLACK = (0, 0, 0)
@@ -87,410 +88,435 @@ GRAY = (100, 100, 100)
 DARK_GRAY = (50, 50, 50)
 LIGHT_GRAY = (150, 150, 150)
 ORANGE = (255, 165, 0)
+PINK = (255, 105, 180)
+SKY = (0, 160, 255)
+
+# Body gradient: each segment is SHADE_STEP darker than the one before, down to SHADE_FLOOR
+SHADE_STEP = 3
+SHADE_FLOOR = 50
+
+# Large-world mode: a walled board of LARGE_WORLD x LARGE_WORLD cells seen through a camera
+LARGE_WORLD = 1000
+CHUNK_SIZE = 16  # Cells per side of a storage chunk
 
 # Game settings
 BASE_FPS = 8
 MAX_FPS = 20
 SPEED_INTERVAL = 5  # Increase speed every 5 points
+ATTRACT_DELAY = 15000  # ms idle on the title screen before the demo starts
 
-class Button:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.is_hovered = False
-        self.font = pygame.font.Font(None, 36)
-        
-    def draw(self, surface):
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=5)
-        
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-        
-    def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
-        return self.is_hovered
-        
-    def is_clicked(self, pos, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            return self.rect.collidepoint(pos)
-        return False
-
-class ToggleButton(Button):
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE, is_on=False):
-        super().__init__(x, y, width, height, text, color, hover_color, text_color)
-        self.is_on = is_on
-        
-    def draw(self, surface):
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=5)
-        
-        status = "ON" if self.is_on else "OFF"
-        full_text = f"{self.text}: {status}"
-        text_surf = self.font.render(full_text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-        
-    def toggle(self):
-        self.is_on = not self.is_on
-        return self.is_on
+DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# (old direction, new direction) -> clockwise quarter turns between them, as replays record them
+TURNS = {(old, new): (DIRECTIONS.index(new) - DIRECTIONS.index(old)) & 3
+         for old in DIRECTIONS for new in DIRECTIONS}
+
+# Local multiplayer: up to MAX_PLAYERS snakes on the classic board
+MAX_PLAYERS = 4
+# (head, body) colours per player
+PLAYER_COLORS = ((CYAN, GREEN), (WHITE, ORANGE), (WHITE, PINK), (WHITE, SKY))
+# Up, down, left, right per player; playing alone, player one may also use the arrows
+PLAYER_KEYS = (
+    (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d),
+    (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT),
+    (pygame.K_i, pygame.K_k, pygame.K_j, pygame.K_l),
+    (pygame.K_KP8, pygame.K_KP5, pygame.K_KP4, pygame.K_KP6),
+)
+PLAYER_KEY_NAMES = ("WASD", "Arrows", "IJKL", "Numpad 8456")
+# Where each player starts, as fractions of the board, and which way they face
+PLAYER_STARTS = ((0.25, 0.25, (1, 0)), (0.75, 0.75, (-1, 0)), (0.75, 0.25, (0, 1)), (0.25, 0.75, (0, -1)))
 
-class LeaderBoard:
+# Ghost opacity (0-255) for the head and the body
+GHOST_ALPHA = (140, 70)
+
+class LeaderBoard(LeaderboardStore):
     def __init__(self):
-        self.scores = []
-        self.load_scores()
-    
-    def reset_scores(self):
-        self.scores = []
-        self.save_scores()
-
-    def load_scores(self):
-        try:
-            if os.path.exists(LEADERBOARD_FILE):
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    self.scores = json.load(f)
-                    # Ensure scores are sorted
-                    self.scores.sort(key=lambda x: x['score'], reverse=True)
-                    # Keep only top 10
-                    self.scores = self.scores[:10]
-            else:
-                # Create file if it doesn't exist
-                self.save_scores()
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading leaderboard: {e}")
-            self.scores = []
-    
-    def save_scores(self):
-        try:
-            with open(LEADERBOARD_FILE, 'w') as f:
-                json.dump(self.scores, f)
-        except IOError as e:
-            print(f"Error saving leaderboard: {e}")
-    
-    def add_score(self, score, length):
+        super().__init__(LEADERBOARD_FILE)
+
+    def add_score(self, score, length, replay=None):
         if score > 0:
-            new_entry = {
+            entry = {
                 'score': score,
                 'length': length,
                 'date': datetime.now().strftime("%Y-%m-%d %H:%M")
             }
-            
-            # Add new score and sort
-            self.scores.append(new_entry)
-            self.scores.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Keep only top 10
-            if len(self.scores) > 10:
-                self.scores = self.scores[:10]
-            
-            self.save_scores()
+            if replay is not None:
+                entry['replay'] = replay
+            self.add(entry)
     
-    def get_top_scores(self, limit=10):
-        return self.scores[:limit]
-    
-    def get_high_score(self):
-        return self.scores[0]['score'] if self.scores else 0
-    
-    def is_high_score(self, score):
-        if not self.scores:
-            return True
-        return len(self.scores) < 10 or score > min(entry['score'] for entry in self.scores)
+    def best_replay(self, board):
+        """The replay of the best-scoring run on board ('classic' or 'large'), or None."""
+        for entry in self.scores:
+            replay = entry.get('replay')
+            if isinstance(replay, dict) and replay.get('board') == board:
+                return replay
+        return None
 
 class Snake:
-    def __init__(self):
-        self.reset()
-        
-    def reset(self):
-        grid_x = GRID_WIDTH // 2
-        grid_y = GRID_HEIGHT // 2
-        self.positions = [(grid_x * BLOCK_SIZE, grid_y * BLOCK_SIZE)]
-        self.direction = (1, 0)
-        self.next_direction = (1, 0)
+    ramps = {}  # player -> segment sprites by distance from the head, built on first draw
+
+    def __init__(self, world, player=1, cell=None, direction=(1, 0)):
+        self.reset(world, player, cell, direction)
+        
+    def reset(self, world, player=1, cell=None, direction=(1, 0)):
+        self.world = world
+        self.player = player  # Also the value the body leaves in the occupancy grid
+        grid_x, grid_y = cell or (world.width // 2, world.height // 2)
+        # Head first; a deque so moving is O(1) at both ends
+        self.positions = deque([(grid_x * BLOCK_SIZE, grid_y * BLOCK_SIZE)])
+        world.occupancy.set(grid_x, grid_y, player)
+        self.direction = direction
+        self.next_direction = direction
         self.length = 1
         self.score = 0
-        self.color = GREEN
+        self.alive = True
+        self.head_color, self.color = PLAYER_COLORS[player - 1]
     
     def get_head_position(self):
         return self.positions[0]
     
-    def update(self):
+    def place(self, positions):
+        """Lay the body out along pixel positions, head first (for scripted starts)."""
+        occupancy = self.world.occupancy
+        for x, y in self.positions:
+            occupancy.set(x // BLOCK_SIZE, y // BLOCK_SIZE, 0)
+        self.positions = deque(positions)
+        for x, y in self.positions:
+            occupancy.set(x // BLOCK_SIZE, y // BLOCK_SIZE, self.player)
+        self.length = len(self.positions)
+    
+    def next_cell(self):
+        """Turn to the queued direction; the cell the head moves into, or None past a wall."""
         self.direction = self.next_direction
-        
         head_x, head_y = self.get_head_position()
-        dir_x, dir_y = self.direction
-        
-        new_x = (head_x + dir_x * BLOCK_SIZE) % SCREEN_WIDTH
-        new_y = (head_y + dir_y * BLOCK_SIZE) % SCREEN_HEIGHT
-        
-        if (new_x, new_y) in self.positions[1:]:
-            return True  # Game over
-            
-        self.positions.insert(0, (new_x, new_y))
-        if len(self.positions) > self.length:
-            self.positions.pop()
-        
-        return False
+        return self.world.neighbor((head_x // BLOCK_SIZE, head_y // BLOCK_SIZE), self.direction)
+    
+    def advance(self, cell):
+        """Move the head into cell, which World.move has found free, and drag the tail along."""
+        occupancy = self.world.occupancy
+        self.positions.appendleft((cell[0] * BLOCK_SIZE, cell[1] * BLOCK_SIZE))
+        occupancy.set(cell[0], cell[1], self.player)
+        while len(self.positions) > self.length:
+            tail_x, tail_y = self.positions.pop()
+            occupancy.set(tail_x // BLOCK_SIZE, tail_y // BLOCK_SIZE, 0)
+    
+    def lift(self):
+        """Take the body off the board, for a snake knocked out of a multiplayer round."""
+        occupancy = self.world.occupancy
+        for x, y in self.positions:
+            occupancy.set(x // BLOCK_SIZE, y // BLOCK_SIZE, 0)
+        self.alive = False
     
     def change_direction(self, direction):
         if (direction[0] * -1, direction[1] * -1) != self.direction:
             self.next_direction = direction
     
+    @staticmethod
+    def build_ramp(head_color, body_color):
+        """One bordered sprite per shade: the head, then the body down to the floor."""
+        colors = [head_color]
+        shade = 255 - SHADE_STEP
+        while shade > SHADE_FLOOR:
+            colors.append(tuple(c * shade // 255 for c in body_color))
+            shade -= SHADE_STEP
+        colors.append(tuple(c * SHADE_FLOOR // 255 for c in body_color))
+
+        ramp = []
+        for color in colors:
+            sprite = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+            sprite.fill(color)
+            pygame.draw.rect(sprite, BLACK, sprite.get_rect(), 1)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            ramp.append(sprite)
+        return ramp
+    
     def draw(self, surface):
-        for i, p in enumerate(self.positions):
-            shade = 255 - (i * 3)
-            shade = max(50, shade)
-            color = (0, shade, 0)
-            
-            if i == 0:
-                color = CYAN
-            
-            rect = pygame.Rect(p[0], p[1], BLOCK_SIZE, BLOCK_SIZE)
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, BLACK, rect, 1)
+        ramp = Snake.ramps.get(self.player)
+        if ramp is None:
+            ramp = Snake.ramps[self.player] = self.build_ramp(self.head_color, self.color)
+        world = self.world
+        floor = ramp[-1]
+        if world.wrap:
+            # The classic board is the screen and never scrolls: blit the whole body as it is,
+            # past the ramp every segment uses the floor shade
+            surface.blits(chain(zip(ramp, self.positions),
+                                zip(repeat(floor), islice(self.positions, len(ramp), None))), False)
+            return
+        
+        # In the large world the body cells in view come from the occupancy chunks under the
+        # camera, not the whole body: all in the floor shade, then the head end of the ramp on top
+        left, top = world.camera.topleft
+        surface.blits([(floor, (x * BLOCK_SIZE - left, y * BLOCK_SIZE - top))
+                       for x, y, player in world.occupancy.cells_in(*world.view_cells())
+                       if player == self.player], False)
+        surface.blits([(sprite, (x - left, y - top)) for sprite, (x, y) in zip(ramp, self.positions)], False)
+
+class Ghost:
+    """A recorded run replayed tick by tick as a translucent snake.
+
+    The replay holds the run's turns as a TurnLog and the ticks at which
+    it grew. The ghost isn't on the occupancy grid, so nothing can hit it
+    and it eats nothing; each tick reads one turn from the streaming
+    decoder and moves a deque, whatever the length of the run. It stops
+    where the recording ends.
+    """
+    sprites = None  # (head, body), built on first draw
+
+    def __init__(self, world, replay):
+        self.world = world
+        self.turns = TurnLog.from_text(replay['turns'], replay['ticks']).turns()
+        self.growth = iter(replay['growth'])  # [tick, length] pairs in order
+        self.next_growth = next(self.growth, None)
+        self.ticks = 0
+        self.heading = DIRECTIONS.index((1, 0))  # Every solo run starts facing right from the centre
+        self.cell = (world.width // 2, world.height // 2)
+        self.positions = deque([(self.cell[0] * BLOCK_SIZE, self.cell[1] * BLOCK_SIZE)])
+        self.length = 1
+        self.done = False
+    
+    def update(self):
+        if self.done:
+            return
+        turn = next(self.turns, None)
+        cell = None
+        if turn is not None:
+            self.heading = (self.heading + turn) & 3
+            cell = self.world.neighbor(self.cell, DIRECTIONS[self.heading])
+        if cell is None:
+            self.done = True  # The run ended here
+            return
+        # Growth recorded at a tick shows from the next move on, as it does for the snake
+        while self.next_growth is not None and self.next_growth[0] <= self.ticks:
+            self.length = self.next_growth[1]
+            self.next_growth = next(self.growth, None)
+        self.ticks += 1
+        self.cell = cell
+        self.positions.appendleft((cell[0] * BLOCK_SIZE, cell[1] * BLOCK_SIZE))
+        while len(self.positions) > self.length:
+            self.positions.pop()
+    
+    @staticmethod
+    def build_sprites():
+        sprites = []
+        for alpha in GHOST_ALPHA:
+            sprite = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+            sprite.fill(WHITE)
+            pygame.draw.rect(sprite, BLACK, sprite.get_rect(), 1)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprite.set_alpha(alpha)  # Whole-surface alpha blends faster than per-pixel
+            sprites.append(sprite)
+        return sprites
+    
+    def draw(self, surface, offset=(0, 0)):
+        if self.done:
+            return
+        if Ghost.sprites is None:
+            Ghost.sprites = self.build_sprites()
+        head, body = Ghost.sprites
+        left, top = offset
+        surface.blits([(body, (x - left, y - top)) for x, y in islice(self.positions, 1, None)], False)
+        x, y = self.positions[0]
+        surface.blit(head, (x - left, y - top))
 
 class Food:
     def __init__(self, food_type=1):
         self.type = food_type
         self.color = RED
-        self.position = (0, 0)
-        self.randomize_position()
+        self.position = (0, 0)  # Pixels; set when the world places it
         self.timer = 0
         self.active = True
         self.points = 1
         
         if self.type == 2:
             self.color = YELLOW
-            self.timer = 150
+            self.timer = 18750  # ms; bonus food lasts as long as 150 moves at the base speed
             self.points = 2
         elif self.type == 3:
             self.color = BLUE
-            self.timer = 100
+            self.timer = 12500
             self.points = 3
         elif self.type == 4:
             self.color = PURPLE
-            self.timer = 80
+            self.timer = 10000
             self.points = 5
     
-    def randomize_position(self):
-        self.position = (
-            random.randint(0, GRID_WIDTH - 1) * BLOCK_SIZE,
-            random.randint(0, GRID_HEIGHT - 1) * BLOCK_SIZE
-        )
-    
-    def update(self):
+    def update(self, elapsed_ms):
         if self.type > 1:
-            self.timer -= 1
+            self.timer -= elapsed_ms
             if self.timer <= 0:
                 self.active = False
         return self.active
     
-    def draw(self, surface):
+    def draw(self, surface, offset=(0, 0)):
         if self.active:
-            rect = pygame.Rect(self.position[0], self.position[1], BLOCK_SIZE, BLOCK_SIZE)
+            x = self.position[0] - offset[0]
+            y = self.position[1] - offset[1]
+            rect = pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE)
             pygame.draw.rect(surface, self.color, rect)
             pygame.draw.rect(surface, BLACK, rect, 1)
             
-            center_x = self.position[0] + BLOCK_SIZE//2
-            center_y = self.position[1] + BLOCK_SIZE//2
+            center_x = x + BLOCK_SIZE//2
+            center_y = y + BLOCK_SIZE//2
             
             if self.type == 2:
                 pygame.draw.circle(surface, BLACK, (center_x, center_y), BLOCK_SIZE//4)
             elif self.type == 3:
                 points = [
-                    (center_x, self.position[1] + 2),
-                    (self.position[0] + BLOCK_SIZE - 2, center_y),
-                    (center_x, self.position[1] + BLOCK_SIZE - 2),
-                    (self.position[0] + 2, center_y)
+                    (center_x, y + 2),
+                    (x + BLOCK_SIZE - 2, center_y),
+                    (center_x, y + BLOCK_SIZE - 2),
+                    (x + 2, center_y)
                 ]
                 pygame.draw.polygon(surface, BLACK, points)
             elif self.type == 4:
                 pygame.draw.line(surface, BLACK, 
-                               (self.position[0] + 4, center_y), 
-                               (self.position[0] + BLOCK_SIZE - 4, center_y), 3)
+                               (x + 4, center_y), 
+                               (x + BLOCK_SIZE - 4, center_y), 3)
                 pygame.draw.line(surface, BLACK, 
-                               (center_x, self.position[1] + 4), 
-                               (center_x, self.position[1] + BLOCK_SIZE - 4), 3)
+                               (center_x, y + 4), 
+                               (center_x, y + BLOCK_SIZE - 4), 3)
             else:
                 pygame.draw.circle(surface, BLACK, (center_x, center_y), BLOCK_SIZE//4)
 
-class LogoScreen:
-    def __init__(self):
-        self.logos = []
-        self.current_logo = 0
-        self.logo_duration = 4000  # 4 seconds per logo set
-        self.fade_duration = 1000  # 1 second fade in/out
-        self.start_time = pygame.time.get_ticks()
-        self.load_logos()
-        self.fade_state = "in"  # "in", "hold", or "out"
-        self.next_logo_time = self.start_time + self.fade_duration
-        self.paired_logos = []  # Store pairs of logos to display together
-
-        # Keys that should trigger skipping the logos
-        self.skip_keys = {
-            pygame.K_TAB, pygame.K_SPACE, pygame.K_RETURN, pygame.K_ESCAPE
-        }
+class World:
+    """The board: snake occupancy and food, both stored by chunk.
 
-    def load_logos(self):
-        # Try to load multiple logo images
-        logo_paths = [
-            get_data_path("DD Lab1.png"),
-            (get_data_path("logo1.png"), get_data_path("logo2.jpg")),
-            get_data_path("snake_rush.png")
-        ]
-        
-        for item in logo_paths:
-            try:
-                # Handle single logos
-                if isinstance(item, str):
-                    logo = pygame.image.load(item)
-                    # Scale logo if needed
-                    max_width = SCREEN_WIDTH * 0.9
-                    max_height = SCREEN_HEIGHT * 0.8
-                    logo_width, logo_height = logo.get_size()
-                    scale = min(max_width / logo_width, max_height / logo_height)
-                    if scale < 1:
-                        logo = pygame.transform.scale(
-                            logo, 
-                            (int(logo_width * scale), int(logo_height * scale)))
-                    self.logos.append([logo])  # Store as single-item list
-                
-                # Handle logo pairs
-                elif isinstance(item, tuple) and len(item) == 2:
-                    logo_pair = []
-                    for path in item:
-                        logo = pygame.image.load(path)
-                        # Scale each logo to fit half the screen
-                        max_width = SCREEN_WIDTH * 0.45
-                        max_height = SCREEN_HEIGHT * 0.8
-                        logo_width, logo_height = logo.get_size()
-                        scale = min(max_width / logo_width, max_height / logo_height)
-                        if scale < 1:
-                            logo = pygame.transform.scale(
-                                logo, 
-                                (int(logo_width * scale), int(logo_height * scale)))
-                        logo_pair.append(logo)
-                    self.logos.append(logo_pair)
-            
-            except Exception as e:
-                print(f"Error loading logo: {e}")
-                pass
-        
-        # If no logos loaded, create text-based ones
-        if not self.logos:
-            font = pygame.font.Font(None, 72)
-            for i in range(3):
-                surf = pygame.Surface((400, 200), pygame.SRCALPHA)
-                text = font.render(f"Desk Devil Labs", True, WHITE)
-                text_rect = text.get_rect(center=(200, 100))
-                surf.blit(text, text_rect)
-                pygame.draw.rect(surf, WHITE, (0, 0, 400, 200), 2)
-                self.logos.append([surf])
-    
-    def update(self):
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - self.start_time
-
-        # Check for key presses to skip
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in self.skip_keys:
-                    return True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                return True
-        
-        # Update fade state
-        if self.fade_state == "in" and current_time >= self.next_logo_time:
-            self.fade_state = "hold"
-            self.next_logo_time = current_time + (self.logo_duration - 2 * self.fade_duration)
-        elif self.fade_state == "hold" and current_time >= self.next_logo_time:
-            self.fade_state = "out"
-            self.next_logo_time = current_time + self.fade_duration
-        elif self.fade_state == "out" and current_time >= self.next_logo_time:
-            self.current_logo += 1
-            if self.current_logo >= len(self.logos):
-                return True
-            self.start_time = current_time
-            self.fade_state = "in"
-            self.next_logo_time = current_time + self.fade_duration
-        
-        return False
-    
-    def draw(self, surface):
-        surface.fill(BLACK)
-        
-        if self.current_logo < len(self.logos):
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.start_time
-            
-            # Calculate alpha based on fade state
-            if self.fade_state == "in":
-                alpha = min(255, int(255 * (elapsed / self.fade_duration)))
-            elif self.fade_state == "out":
-                alpha = max(0, 255 - int(255 * ((current_time - (self.next_logo_time - self.fade_duration)) / self.fade_duration)))
-            else:  # hold
-                alpha = 255
-            
-            # Get current logo(s) - could be single or pair
-            current_logos = self.logos[self.current_logo]
-            
-            # Create a composite surface if multiple logos
-            if len(current_logos) > 1:
-                # Calculate total width and max height
-                total_width = sum(logo.get_width() for logo in current_logos) + 20 * (len(current_logos) - 1)
-                max_height = max(logo.get_height() for logo in current_logos)
-                
-                # Create a temporary surface for the composite
-                composite = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
-                x_offset = 0
-                for logo in current_logos:
-                    composite.blit(logo, (x_offset, (max_height - logo.get_height()) // 2))
-                    x_offset += logo.get_width() + 20
-                
-                # Apply alpha to the composite
-                composite.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                composite_rect = composite.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(composite, composite_rect)
-            
-            else:  # Single logo
-                logo = current_logos[0]
-                temp_surface = pygame.Surface((logo.get_width(), logo.get_height()), pygame.SRCALPHA)
-                temp_surface.blit(logo, (0, 0))
-                temp_surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                logo_rect = temp_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(temp_surface, logo_rect)
+    Every snake on the board shares the one occupancy grid, which holds
+    each body cell's player number.
+
+    The classic board is exactly the screen and wraps around. The large
+    world is LARGE_WORLD cells square with walls at its edges, and the
+    camera follows the head. Occupancy is a ChunkedGrid and food sits in
+    per-chunk dicts, only for the chunks in view, so memory follows the
+    chunks in use and each frame touches just the chunks the camera sees.
+    """
+
+    def __init__(self, width, height, wrap=True):
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.pixel_width = width * BLOCK_SIZE
+        self.pixel_height = height * BLOCK_SIZE
+        self.occupancy = ChunkedGrid(width, height, CHUNK_SIZE)  # Body cells, by player number
+        self.food = {}  # chunk key -> {(x, y) cell: Food}
+        self.food_count = 0
+        self.stocked = set()  # Chunks in view that have been given their food
+        self.camera = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)  # The visible part, in pixels
+
+    def follow(self, position):
+        """Centre the camera on a pixel position, keeping it inside the world."""
+        self.camera.center = (position[0] + BLOCK_SIZE // 2, position[1] + BLOCK_SIZE // 2)
+        self.camera.clamp_ip(pygame.Rect(0, 0, self.pixel_width, self.pixel_height))
+
+    def view_cells(self):
+        """The camera's view in cells as (left, top, right, bottom), right and bottom exclusive."""
+        camera = self.camera
+        return (camera.left // BLOCK_SIZE, camera.top // BLOCK_SIZE,
+                -(-camera.right // BLOCK_SIZE), -(-camera.bottom // BLOCK_SIZE))
+
+    def neighbor(self, cell, direction):
+        """The cell one step from cell in direction, or None past a wall."""
+        x, y = cell[0] + direction[0], cell[1] + direction[1]
+        if self.wrap:
+            return (x % self.width, y % self.height)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return (x, y)
+        return None
+
+    def move(self, snakes):
+        """Move every snake one cell in a single pass; return the ones that crashed.
+
+        Each head is checked with one occupancy lookup before anything
+        moves, so a tail still counts until it has moved on and a head
+        running into another snake's head counts as hitting its body. Heads
+        that meet on the same free cell crash together. Crashed snakes stay
+        where they are and the rest move, which costs the same however long
+        the bodies are.
+        """
+        occupied = self.occupancy.get
+        crashed = []
+        heads = {}  # cell -> the snakes moving into it
+        for snake in snakes:
+            cell = snake.next_cell()
+            if cell is None or occupied(*cell):
+                crashed.append(snake)  # Wall or body
+            elif cell in heads:
+                heads[cell].append(snake)
+            else:
+                heads[cell] = [snake]
+        for cell, movers in heads.items():
+            if len(movers) > 1:
+                crashed.extend(movers)  # Head to head
+            else:
+                movers[0].advance(cell)
+        return crashed
+
+    def steps(self, a, b):
+        """Moves between two cells ignoring obstacles (across the edges when the board wraps)."""
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        if self.wrap:
+            dx, dy = min(dx, self.width - dx), min(dy, self.height - dy)
+        return dx + dy
+
+    def food_at(self, cell):
+        chunk = self.food.get(self.occupancy.key(*cell))
+        return chunk.get(cell) if chunk else None
+
+    def add_food(self, food, cell):
+        food.position = (cell[0] * BLOCK_SIZE, cell[1] * BLOCK_SIZE)
+        self.food.setdefault(self.occupancy.key(*cell), {})[cell] = food
+        self.food_count += 1
+
+    def remove_food(self, food):
+        cell = (food.position[0] // BLOCK_SIZE, food.position[1] // BLOCK_SIZE)
+        key = self.occupancy.key(*cell)
+        chunk = self.food[key]
+        del chunk[cell]
+        if not chunk:
+            del self.food[key]
+        self.food_count -= 1
+
+    def visible_food(self):
+        """The food in the chunks under the camera (safe to remove while iterating)."""
+        found = []
+        for key in self.occupancy.chunk_keys(*self.view_cells()):
+            chunk = self.food.get(key)
+            if chunk:
+                found.extend(chunk.values())
+        return found
+
+    def free_cell(self, left, top, right, bottom, tries=100):
+        """A random cell in the rectangle with neither snake nor food on it, or None."""
+        for _ in range(tries):
+            cell = (random.randrange(left, right), random.randrange(top, bottom))
+            if not self.occupancy.get(*cell) and self.food_at(cell) is None:
+                return cell
+        return None
+
+    def stock(self, make_food):
+        """Put one food in each chunk as it comes into view; drop what scrolls out of view."""
+        left, top, right, bottom = self.view_cells()
+        visible = set(self.occupancy.chunk_keys(left, top, right, bottom))
+        size = CHUNK_SIZE
+        for key in visible - self.stocked:
+            x, y = (key % self.occupancy.cols) * size, (key // self.occupancy.cols) * size
+            cell = self.free_cell(x, y, min(x + size, self.width), min(y + size, self.height))
+            if cell is not None:
+                self.add_food(make_food(), cell)
+        for key in self.stocked - visible:
+            self.food_count -= len(self.food.pop(key, ()))
+        self.stocked = visible
 
 def show_exit_credits():
     """Display exit credits sequence with scrolling credits and dedicated outro music"""
     # Stop any currently playing sounds
     pygame.mixer.stop()
     
-    # Load outro music
-    outro_music_path = get_data_path("outro_music.wav")
-    try:
-        outro_music = pygame.mixer.Sound(outro_music_path)
-        outro_music.set_volume(0.7)
-        outro_music.play(loops=-1)
-    except:
-        outro_music = None
-    
-    # Initialize parameters
-    rolling_text_y = SCREEN_HEIGHT  # Start below screen
-    rolling_text_speed = 2  # Pixels per frame
-    total_duration = 14000  # 14 seconds total
-    start_time = pygame.time.get_ticks()
+    # Stream the outro music in place of whatever was playing
+    audio.play("outro", loops=-1)
     
     # Define credits content
-    credit_font = pygame.font.Font(None, 32)
     credits = [
         "SNAKE RUSH",
         "",
@@ -523,75 +549,154 @@ def show_exit_credits():
         pygame.K_TAB, pygame.K_SPACE, pygame.K_RETURN, pygame.K_ESCAPE
     }
     
-    # Main loop
-    running = True
-    while running:
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - start_time
-        
-        # Check if total duration has been reached
-        if elapsed >= total_duration:
-            if outro_music:
-                outro_music.stop()
-            return "quit"
-        
-        # Handle events (allow skipping only for specific keys)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                if outro_music:
-                    outro_music.stop()
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in skip_keys:
-                    if outro_music:
-                        outro_music.stop()
-                    return "quit"
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                if outro_music:
-                    outro_music.stop()
-                return "quit"
-        
-        # Update credits scrolling
-        rolling_text_y -= rolling_text_speed
-        if rolling_text_y < -2000:  # End when credits scroll past
-            if outro_music:
-                outro_music.stop()
-            return "quit"
-        
-        # Draw everything
-        screen.fill(BLACK)
-        
-        # Draw scrolling credits
-        y_pos = rolling_text_y
-        for credit in credits:
-            if credit:
-                text = credit_font.render(credit, True, WHITE)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-                screen.blit(text, text_rect)
-            y_pos += 40
-        
-        pygame.display.flip()
-        clock.tick(FPS)
-    
-    # Clean up music if we exit early
-    if outro_music:
-        outro_music.stop()
+    run_credits(screen, credits, skip_keys, fps=FPS)
+    audio.stop("outro")
     return 'quit'
 
-class Game:
-    def __init__(self):
-        self.snake = Snake()
-        self.foods = []
+class Autopilot:
+    """Steers a snake toward food: the player in the attract-mode demo.
+
+    Planning runs backwards. A breadth-first distance field grows out from
+    the target food over free cells, at most budget_ms of it per tick, and
+    is kept from tick to tick while that food stands, so the snake's own
+    moves never restart the search and a long search is spread over
+    several ticks. Once the field touches the head the snake walks
+    downhill, one lookup per move. Every move is also checked with a flood
+    fill, capped at flood_limit cells, that the head can still reach the
+    tail or enough open space, so it doesn't coil itself into a trap.
+    """
+
+    UNREACHED = float("inf")
+
+    def __init__(self, snake, world, budget_ms=1.0, flood_limit=250):
+        self.snake = snake
+        self.world = world
+        self.budget = budget_ms / 1000
+        self.flood_limit = flood_limit
+        self.target = None  # The Food being chased
+        self.target_cell = None
+        self.distance = {}  # cell -> moves to the target
+        self.frontier = deque()
+        self.skip = set()  # Food found to be out of reach
+        self.expanded = 0  # Cells the search has expanded, for benchmarks
+
+    def cell(self, position):
+        return (position[0] // BLOCK_SIZE, position[1] // BLOCK_SIZE)
+
+    def retarget(self, head):
+        """Chase the nearest food in view, starting a fresh distance field from it."""
+        foods = self.world.visible_food()
+        candidates = [food for food in foods if food not in self.skip]
+        if not candidates:
+            self.skip.clear()
+            candidates = foods
+        self.distance.clear()
+        self.frontier.clear()
+        if not candidates:
+            self.target = self.target_cell = None
+            return
+        self.target = min(candidates, key=lambda food: self.world.steps(head, self.cell(food.position)))
+        self.target_cell = self.cell(self.target.position)
+        self.distance[self.target_cell] = 0
+        self.frontier.append(self.target_cell)
+
+    def touches(self, head):
+        return any(self.world.neighbor(head, direction) in self.distance for direction in DIRECTIONS)
+
+    def grow(self, head, deadline):
+        """Extend the distance field until it reaches the head or the tick's time is up."""
+        world, distance, frontier = self.world, self.distance, self.frontier
+        occupied = world.occupancy.get
+        count = 0
+        while frontier:
+            cell = frontier.popleft()
+            next_distance = distance[cell] + 1
+            for direction in DIRECTIONS:
+                neighbor = world.neighbor(cell, direction)
+                if neighbor is None or neighbor in distance:
+                    continue
+                if neighbor == head:
+                    return  # cell is next to the head: there's a way
+                if not occupied(*neighbor):
+                    distance[neighbor] = next_distance
+                    frontier.append(neighbor)
+            count += 1
+            if not count & 31 and time.perf_counter() > deadline:
+                break
+        self.expanded += count
+
+    def room(self, start, head, limit):
+        """Free cells reachable from start, up to limit; reaching the tail counts as limit."""
+        world = self.world
+        occupied = world.occupancy.get
+        tail = self.cell(self.snake.positions[-1])
+        seen = {start}
+        queue = deque(seen)
+        while queue:
+            cell = queue.popleft()
+            for direction in DIRECTIONS:
+                neighbor = world.neighbor(cell, direction)
+                if neighbor is None or neighbor in seen or neighbor == head:
+                    continue
+                if neighbor == tail:
+                    return limit  # The tail moves on, so following it always gets out
+                if occupied(*neighbor):
+                    continue
+                seen.add(neighbor)
+                if len(seen) >= limit:
+                    return limit
+                queue.append(neighbor)
+        return len(seen)
+
+    def steer(self):
+        """The direction to take this tick; call it once per tick before the snake moves."""
+        deadline = time.perf_counter() + self.budget
+        world = self.world
+        head = self.cell(self.snake.get_head_position())
+
+        if self.target is not None and world.food_at(self.target_cell) is not self.target:
+            self.target = None  # Eaten or expired
+        if self.target is None:
+            self.retarget(head)
+        if self.frontier and not self.touches(head):
+            self.grow(head, deadline)
+
+        moves = []
+        for direction in DIRECTIONS:
+            cell = world.neighbor(head, direction)
+            if cell is not None and not world.occupancy.get(*cell):
+                moves.append((self.distance.get(cell, self.UNREACHED), direction, cell))
+        moves.sort(key=lambda move: move[0])
+        if self.target is not None and not self.frontier and (not moves or moves[0][0] == self.UNREACHED):
+            # The field is complete and doesn't reach us: try other food next tick
+            self.skip.add(self.target)
+            self.target = None
+
+        # Downhill first, but never into a dead end if there's any way out
+        need = min(len(self.snake.positions), self.flood_limit)
+        best, best_room = None, -1
+        for _, direction, cell in moves:
+            room = self.room(cell, head, need)
+            if room >= need:
+                return direction
+            if room > best_room:
+                best, best_room = direction, room
+        return best or self.snake.direction
+
+class Game(Scene):
+    def __init__(self, large_world=False, players=1):
+        # Multiplayer shares one screen, so it's always played on the classic board
+        self.players = players
+        self.large_world = large_world and players == 1
+        self.demo = False  # Attract mode: autopilots play until someone touches a key
+        self.autopilots = []
+        self.idle_ms = 0
+        self.show_ghost = True
         self.game_over = False
-        self.paused = False
         self.current_speed = BASE_FPS
         self.leaderboard = LeaderBoard()
         self.score_submitted = False
         self.title_screen = True
-        self.show_leaderboard = False
-        self.show_options = False
         
         # Pause menu buttons
         button_width = 200
@@ -621,25 +726,25 @@ class Game:
                                  "Start Game", GREEN, (100, 255, 100))
         self.title_leaderboard_button = Button(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing, 
                                             button_width, button_height, "Leaderboard", BLUE, CYAN)
-        self.title_quit_button = Button(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing * 3,
+        self.large_world_button = ToggleButton(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 50 + button_spacing * 2,
+                                               300, button_height, "Large World", GRAY, LIGHT_GRAY,
+                                               is_on=self.large_world)
+        self.players_button = Button(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 50 + button_spacing * 3,
+                                     300, button_height, f"Players: {players}", GRAY, LIGHT_GRAY)
+        self.title_quit_button = Button(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing * 4,
                                       button_width, button_height, "Quit", RED, (255, 100, 100))
         
-        self.spawn_food()
-        self.spawn_food()
-
-        # When starting the game:
-        global game_bg_playing
-        if not game_bg_playing:
-            game_bg.play(-1)
-            game_bg_playing = True
-            # Apply mute state
-            if bgm_muted:
-                game_bg.set_volume(0.0)
-            else:
-                game_bg.set_volume(0.3)
+        self.new_board()
+
+        # When starting the game (mute state is applied by the audio manager):
+        if not audio.is_playing("bgm"):
+            audio.play("bgm", loops=-1)
+    
+    def top_score(self):
+        return max(snake.score for snake in self.snakes)
     
     def get_food_spawn_chances(self):
-        score = self.snake.score
+        score = self.top_score()
         
         if score < 10:
             return [85, 15, 0, 0]
@@ -650,7 +755,7 @@ class Game:
         else:
             return [50, 30, 15, 5]
     
-    def spawn_food(self):
+    def new_food(self):
         chances = self.get_food_spawn_chances()
         rand = random.randint(1, 100)
         
@@ -663,236 +768,257 @@ class Game:
         else:
             food_type = 4
         
-        new_food = Food(food_type)
-        
-        while new_food.position in [pos for pos in self.snake.positions]:
-            new_food.randomize_position()
-        
-        self.foods.append(new_food)
+        return Food(food_type)
+    
+    def spawn_food(self):
+        cell = self.world.free_cell(0, 0, self.world.width, self.world.height)
+        if cell is not None:
+            self.world.add_food(self.new_food(), cell)
+    
+    def restock_food(self):
+        if self.large_world:
+            self.world.stock(self.new_food)
+        else:
+            min_foods = min(2 + (self.top_score() // 15), 4) + self.players - 1
+            while self.world.food_count < min_foods:
+                self.spawn_food()
+    
+    def board_name(self):
+        return 'large' if self.large_world else 'classic'
+    
+    def new_board(self):
+        if self.large_world:
+            self.world = World(LARGE_WORLD, LARGE_WORLD, wrap=False)
+        else:
+            self.world = World(GRID_WIDTH, GRID_HEIGHT)
+        if self.players == 1:
+            self.snakes = [Snake(self.world)]
+        else:
+            self.snakes = [Snake(self.world, player, (int(self.world.width * x), int(self.world.height * y)), direction)
+                           for player, (x, y, direction) in enumerate(PLAYER_STARTS[:self.players], 1)]
+        self.snake = self.snakes[0]  # Player one, whom the camera follows
+        self.world.follow(self.snake.get_head_position())
+        
+        # key -> (snake, direction), so a key press is one lookup whoever it belongs to
+        self.keys = {}
+        bindings = list(zip(self.snakes, PLAYER_KEYS))
+        if self.players == 1:
+            bindings.append((self.snake, PLAYER_KEYS[1]))
+        for snake, keys in bindings:
+            for key, direction in zip(keys, ((0, -1), (0, 1), (-1, 0), (1, 0))):
+                self.keys[key] = (snake, direction)
+        
+        # Solo runs are recorded, and race the ghost of the best recorded run on this board
+        self.recording = None
+        self.ghost = None
+        if self.players == 1:
+            self.recording = TurnLog()
+            self.growth = []  # [tick, length] whenever the snake grew
+            self.recorded_length = self.snake.length
+            replay = self.leaderboard.best_replay(self.board_name())
+            if replay is not None:
+                try:
+                    self.ghost = Ghost(self.world, replay)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"Error loading ghost replay: {e}")
+        self.restock_food()
     
     def update_speed(self):
-        speed_increase = self.snake.score // SPEED_INTERVAL
+        speed_increase = self.top_score() // SPEED_INTERVAL
         self.current_speed = min(BASE_FPS + speed_increase, MAX_FPS)
     
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "show_credits" 
-            
-            elif event.type == pygame.VIDEORESIZE:
-                if not fullscreen:
-                    global SCREEN_WIDTH, SCREEN_HEIGHT, screen
-                    SCREEN_WIDTH, SCREEN_HEIGHT = event.size
-                    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-    
-            
-            elif event.type == pygame.KEYDOWN:
-                if self.title_screen:
-                    if (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE) and not (self.show_leaderboard):
-                        self.title_screen = False
-                    elif event.key == pygame.K_ESCAPE:
-                        if self.show_leaderboard:
-                            self.show_leaderboard = False
-                            self.show_options = False
-                elif self.show_leaderboard:
-                    if event.key == pygame.K_ESCAPE:
-                        self.show_leaderboard = False
-                        self.show_options = False
-                elif self.paused:
-                    if event.key == pygame.K_ESCAPE:
-                        self.paused = False
-                elif not self.game_over and not self.paused:
-                    if event.key == pygame.K_UP or event.key == pygame.K_w:
-                        self.snake.change_direction((0, -1))
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        self.snake.change_direction((0, 1))
-                    elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                        self.snake.change_direction((-1, 0))
-                    elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                        self.snake.change_direction((1, 0))
-                    elif event.key == pygame.K_ESCAPE:
-                        self.paused = True
-                    elif event.key == pygame.K_p:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_r:
-                        self.restart_game()
-                elif self.game_over:
-                    if event.key == pygame.K_r:
-                        self.restart_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.__init__()
-                        self.title_screen = True
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                
-                if self.title_screen:
-                    if not (self.show_leaderboard):
-                        if self.start_button.is_clicked(mouse_pos, event):
-                            self.title_screen = False
-                        elif self.title_leaderboard_button.is_clicked(mouse_pos, event):
-                            self.show_leaderboard = True
-                            self.show_options = False
-                        elif self.title_quit_button.is_clicked(mouse_pos, event):
-                            return "show_credits"
-                    elif self.show_leaderboard and self.back_button.is_clicked(mouse_pos, event):
-                        self.show_leaderboard = False
-                    elif self.show_leaderboard and self.reset_scores_button.is_clicked(mouse_pos, event):
-                        # Add confirmation dialog
-                        confirm = self.show_confirmation_dialog("Reset all scores?")
-                        if confirm:
-                            self.leaderboard.reset_scores()
-                            # Force a refresh of the leaderboard display
-                            self.show_leaderboard = True  # This will make it redraw
-                
-                elif self.paused and not (self.show_leaderboard):
-                    if self.resume_button.is_clicked(mouse_pos, event):
-                        self.paused = False
-                    elif self.leaderboard_button.is_clicked(mouse_pos, event):
-                        self.show_leaderboard = True
-                        self.show_options = False
-                    elif self.restart_button.is_clicked(mouse_pos, event):
-                        self.restart_game()
-                        self.paused = False
-                    elif self.quit_button.is_clicked(mouse_pos, event):
-                        self.__init__()
-                        self.title_screen = True
-                        self.paused = False
-                
-                elif self.show_leaderboard and self.back_button.is_clicked(mouse_pos, event):
-                    self.show_leaderboard = False
-                
-                elif self.reset_scores_button.is_clicked(mouse_pos, event):
-                        # Add confirmation dialog
-                        confirm = self.show_confirmation_dialog("Reset all scores?")
-                        if confirm:
-                            self.leaderboard.reset_scores()
-                
-                elif self.game_over:
-                    restart_text_rect = pygame.Rect(
-                        SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 60, 300, 30
-                    )
-                    if restart_text_rect.collidepoint(mouse_pos):
-                        self.restart_game()
-        
-        return True
-
-    def show_confirmation_dialog(self, message):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        screen.blit(overlay, (0, 0))
-        
-        font = pygame.font.Font(None, 36)
-        text = font.render(message, True, WHITE)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30))
-        screen.blit(text, text_rect)
-        
-        yes_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 20, 120, 50, 
-                          "Yes", RED, (255, 100, 100))
-        no_button = Button(SCREEN_WIDTH//2 + 30, SCREEN_HEIGHT//2 + 20, 120, 50,
-                         "No", GRAY, LIGHT_GRAY)
-        
-        pygame.display.flip()
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "show_credits" 
+        
+        elif self.demo:
+            # Any key or click ends the demo
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                self.end_demo()
+            return None
+        
+        if self.title_screen and event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+            self.idle_ms = 0
+        
+        if event.type == pygame.KEYDOWN:
+            if self.title_screen:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                    self.title_screen = False
+            elif not self.game_over:
+                if event.key in self.keys:
+                    snake, direction = self.keys[event.key]
+                    snake.change_direction(direction)
+                elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
+                    self.stack.push(PauseMenu(self))
+                elif event.key == pygame.K_r:
+                    self.restart_game()
+                elif event.key == pygame.K_g:
+                    self.show_ghost = not self.show_ghost
+            else:
+                if event.key == pygame.K_r:
+                    self.restart_game()
+                elif event.key == pygame.K_ESCAPE:
+                    self.__init__(self.large_world, self.players)
+                    self.title_screen = True
         
-        waiting = True
-        while waiting:
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = pygame.mouse.get_pos()
-            yes_button.check_hover(mouse_pos)
-            no_button.check_hover(mouse_pos)
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "show_credits" 
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if yes_button.is_clicked(mouse_pos, event):
-                        return True
-                    elif no_button.is_clicked(mouse_pos, event):
-                        return False
+            if self.title_screen:
+                if self.start_button.is_clicked(mouse_pos, event):
+                    self.title_screen = False
+                elif self.title_leaderboard_button.is_clicked(mouse_pos, event):
+                    self.stack.push(LeaderboardView(self))
+                elif self.large_world_button.is_clicked(mouse_pos, event):
+                    self.large_world = self.large_world_button.toggle()
+                    if self.large_world:
+                        self.set_players(1)
+                    self.new_board()
+                elif self.players_button.is_clicked(mouse_pos, event):
+                    self.set_players(self.players % MAX_PLAYERS + 1)
+                    if self.players > 1:
+                        self.large_world = self.large_world_button.is_on = False
+                    self.new_board()
+                elif self.title_quit_button.is_clicked(mouse_pos, event):
+                    return "show_credits"
             
-            yes_button.draw(screen)
-            no_button.draw(screen)
-            pygame.display.flip()
-            clock.tick(60)
-        
-        return False
+            elif self.game_over:
+                restart_text_rect = pygame.Rect(
+                    SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 60, 300, 30
+                )
+                if restart_text_rect.collidepoint(mouse_pos):
+                    self.restart_game()
+        
+        return None
+    
+    def set_players(self, players):
+        self.players = players
+        self.players_button.text = f"Players: {players}"
+    
+    def start_demo(self):
+        self.restart_game()
+        self.title_screen = False
+        self.demo = True
+        self.autopilots = [Autopilot(snake, self.world) for snake in self.snakes]
+    
+    def end_demo(self):
+        self.demo = False
+        self.autopilots = []
+        self.restart_game()
+        self.title_screen = True
+        self.idle_ms = 0
     
     def update(self):
-        if self.title_screen or self.game_over or self.paused or self.show_leaderboard:
-            if self.game_over and not self.score_submitted:
+        if self.title_screen:
+            # Left alone on the title screen, the game starts playing itself
+            self.idle_ms += 1000 / self.current_speed
+            if self.idle_ms >= ATTRACT_DELAY:
+                self.start_demo()
+            return
+        
+        if self.game_over:
+            # Party rounds aren't comparable with solo runs, so only solo scores are kept
+            if not self.score_submitted and self.players == 1:
                 if self.leaderboard.is_high_score(self.snake.score):
-                    self.leaderboard.add_score(self.snake.score, self.snake.length)
+                    self.leaderboard.add_score(self.snake.score, self.snake.length, self.replay())
                 self.score_submitted = True
             return
         
-        game_over = self.snake.update()
-        global game_bg_playing 
-        if game_over:
+        if self.demo:
+            for autopilot in self.autopilots:
+                if autopilot.snake.alive:
+                    autopilot.snake.change_direction(autopilot.steer())
+        
+        world = self.world
+        heading = self.snake.direction
+        crashed = world.move([snake for snake in self.snakes if snake.alive])
+        for snake in crashed:
+            snake.lift()
+        # Solo, any crash ends the game; in multiplayer the last snake left wins
+        alive = sum(snake.alive for snake in self.snakes)
+        round_over = alive == 0 or (self.players > 1 and alive == 1)
+        if round_over and self.demo:
+            self.end_demo()
+            return
+        if round_over:
             self.game_over = True
-            game_bg.stop()
-            game_bg_playing = False
-            if not sfx_muted:
-                game_over_sound.play()
+            audio.stop("bgm")
+            audio.play("game_over")
             return
         
-        for food in self.foods[:]:
-            if not food.update():
-                self.foods.remove(food)
+        if self.snake.alive:
+            world.follow(self.snake.get_head_position())
+        if self.ghost is not None:
+            self.ghost.update()
         
-        head = self.snake.get_head_position()
-        head_rect = pygame.Rect(head[0], head[1], BLOCK_SIZE, BLOCK_SIZE)
+        # One move lasts 1000 / current_speed ms of real time; only food in view ticks
+        step_ms = 1000 / self.current_speed
+        for food in world.visible_food():
+            if not food.update(step_ms):
+                world.remove_food(food)
         
-        for food in self.foods[:]:
-            food_rect = pygame.Rect(food.position[0], food.position[1], BLOCK_SIZE, BLOCK_SIZE)
-            if head_rect.colliderect(food_rect) and food.active:
-                self.foods.remove(food)
-
-                if not sfx_muted:
-                    food_capture_sound.play()
-                
-                self.snake.score += food.points
-                
-                if food.type == 1:
-                    self.snake.length += 1
-                elif food.type == 2:
-                    self.snake.length += 2
-                elif food.type == 3:
-                    self.snake.length += 3
-                elif food.type == 4:
-                    self.snake.length += 4
-                
-                self.spawn_food()
-                self.update_speed()
+        for snake in self.snakes:
+            if snake.alive:
+                self.eat(snake)
+        if self.recording is not None:
+            self.record_tick(heading)
         
-        min_foods = min(2 + (self.snake.score // 15), 4)
-        while len(self.foods) < min_foods:
-            self.spawn_food()
+        self.restock_food()
+    
+    def record_tick(self, heading):
+        """Log the move just made (and any growth) for the run's replay."""
+        self.recording.record(TURNS[heading, self.snake.direction])
+        if self.snake.length != self.recorded_length:
+            self.recorded_length = self.snake.length
+            self.growth.append([self.recording.ticks, self.snake.length])
+    
+    def replay(self):
+        """The run so far, in the form stored with its leaderboard entry."""
+        if self.recording is None:
+            return None
+        return {
+            'board': self.board_name(),
+            'ticks': self.recording.ticks,
+            'turns': self.recording.as_text(),
+            'growth': self.growth
+        }
+    
+    def eat(self, snake):
+        world = self.world
+        head = snake.get_head_position()
+        food = world.food_at((head[0] // BLOCK_SIZE, head[1] // BLOCK_SIZE))
+        if food is not None and food.active:
+            world.remove_food(food)
+
+            audio.play("food_capture")
+            
+            snake.score += food.points
+            
+            if food.type == 1:
+                snake.length += 1
+            elif food.type == 2:
+                snake.length += 2
+            elif food.type == 3:
+                snake.length += 3
+            elif food.type == 4:
+                snake.length += 4
+            
+            self.update_speed()
     
     def restart_game(self):
-        self.snake.reset()
-        self.foods = []
         self.game_over = False
-        self.paused = False
         self.score_submitted = False
         self.current_speed = BASE_FPS
-        
-        self.spawn_food()
-        self.spawn_food()
+        self.new_board()
 
         # When restarting the game:
-        global game_bg_playing 
-        if not game_bg_playing:
-            game_bg.play(-1)
-            game_bg_playing = True
-            # Restore mute state
-            if bgm_muted:
-                game_bg.set_volume(0.0)
-            else:
-                game_bg.set_volume(0.3)
+        if not audio.is_playing("bgm"):
+            audio.play("bgm", loops=-1)
     
     def draw_title_screen(self):
         screen.fill(BLACK)
         
-        title_font = pygame.font.Font(None, 72)
+        title_font = get_font(72)
         title_text = title_font.render("SNAKE RUSH", True, GREEN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
         screen.blit(title_text, title_rect)
@@ -915,127 +1041,76 @@ class Game:
         mouse_pos = pygame.mouse.get_pos()
         self.start_button.check_hover(mouse_pos)
         self.title_leaderboard_button.check_hover(mouse_pos)
+        self.large_world_button.check_hover(mouse_pos)
+        self.players_button.check_hover(mouse_pos)
         self.title_quit_button.check_hover(mouse_pos)
         
-        if not (self.show_leaderboard):
-            self.start_button.draw(screen)
-            self.title_leaderboard_button.draw(screen)
-            self.title_quit_button.draw(screen)
+        self.start_button.draw(screen)
+        self.title_leaderboard_button.draw(screen)
+        self.large_world_button.draw(screen)
+        self.players_button.draw(screen)
+        self.title_quit_button.draw(screen)
         
         # Show high score on title screen
         high_score = self.leaderboard.get_high_score()
         if high_score > 0:
-            hs_font = pygame.font.Font(None, 36)
+            hs_font = get_font(36)
             hs_text = hs_font.render(f"High Score: {high_score}", True, YELLOW)
             hs_rect = hs_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3 + 50))
             screen.blit(hs_text, hs_rect)
         
-        controls_font = pygame.font.Font(None, 24)
-        controls = [
-            "Controls:",
-            "WASD / Arrow Keys to Move",
+        controls_font = get_font(24)
+        if self.players == 1:
+            moves = ["WASD / Arrow Keys to Move"]
+        else:
+            moves = [f"P{player}: {PLAYER_KEY_NAMES[player - 1]}" for player in range(1, self.players + 1)]
+        controls = ["Controls:"] + moves + [
             "P to Pause",
             "ESC for Menu",
             "R to Restart"
         ]
         for i, control in enumerate(controls):
             text = controls_font.render(control, True, WHITE)
-            screen.blit(text, (50, SCREEN_HEIGHT - 150 + i * 25))
-    
-    def draw_pause_menu(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
-        
-        big_font = pygame.font.Font(None, 72)
-        title = big_font.render("GAME PAUSED", True, WHITE)
-        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.resume_button.check_hover(mouse_pos)
-        self.leaderboard_button.check_hover(mouse_pos)
-        self.restart_button.check_hover(mouse_pos)
-        self.quit_button.check_hover(mouse_pos)
-        
-        self.resume_button.draw(screen)
-        self.leaderboard_button.draw(screen)
-        self.restart_button.draw(screen)
-        self.quit_button.draw(screen)
-    
-    
-    def draw_leaderboard(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        screen.blit(overlay, (0, 0))
-        
-        big_font = pygame.font.Font(None, 72)
-        title = big_font.render("LEADERBOARD", True, CYAN)
-        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 100)))
-        
-        header_font = pygame.font.Font(None, 48)
-        rank_header = header_font.render("RANK", True, YELLOW)
-        score_header = header_font.render("SCORE", True, YELLOW)
-        length_header = header_font.render("LENGTH", True, YELLOW)
-        date_header = header_font.render("DATE", True, YELLOW)
-        
-        header_y = 180
-        screen.blit(rank_header, (200, header_y))
-        screen.blit(score_header, (350, header_y))
-        screen.blit(length_header, (550, header_y))
-        screen.blit(date_header, (700, header_y))
-        
-        pygame.draw.line(screen, WHITE, (150, header_y + 50), (SCREEN_WIDTH - 150, header_y + 50), 2)
-        
-        score_font = pygame.font.Font(None, 36)
-        scores = self.leaderboard.get_top_scores()
-        
-        if not scores:
-            no_scores_text = score_font.render("No scores yet! Be the first to play!", True, WHITE)
-            screen.blit(no_scores_text, no_scores_text.get_rect(center=(SCREEN_WIDTH//2, 300)))
-        else:
-            for i, entry in enumerate(scores):
-                y_pos = 250 + i * 40
-                
-                color = GREEN if (self.game_over and entry['score'] == self.snake.score and 
-                                entry['length'] == self.snake.length) else WHITE
-                
-                rank_text = score_font.render(f"{i + 1}.", True, color)
-                score_text = score_font.render(f"{entry['score']:,}", True, color)
-                length_text = score_font.render(f"{entry['length']}", True, color)
-                date_text = score_font.render(entry['date'][:10], True, color)
-                
-                screen.blit(rank_text, (200, y_pos))
-                screen.blit(score_text, (350, y_pos))
-                screen.blit(length_text, (550, y_pos))
-                screen.blit(date_text, (700, y_pos))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        self.back_button.check_hover(mouse_pos)
-        self.reset_scores_button.check_hover(mouse_pos)
-        
-        self.back_button.draw(screen)
-        self.reset_scores_button.draw(screen)
+            screen.blit(text, (50, SCREEN_HEIGHT - 25 * (len(controls) + 1) + i * 25))
     
     def draw(self, screen):
         screen.fill(BLACK)
         
-        if not (self.title_screen or self.show_leaderboard or self.paused or self.game_over):
-            # Draw grid
-            for x in range(0, SCREEN_WIDTH, BLOCK_SIZE):
+        if not (self.title_screen or self.game_over):
+            world = self.world
+            camera = world.camera
+            
+            # Draw grid, scrolled with the camera
+            for x in range(-(camera.left % BLOCK_SIZE), SCREEN_WIDTH, BLOCK_SIZE):
                 pygame.draw.line(screen, (20, 20, 20), (x, 0), (x, SCREEN_HEIGHT))
-            for y in range(0, SCREEN_HEIGHT, BLOCK_SIZE):
+            for y in range(-(camera.top % BLOCK_SIZE), SCREEN_HEIGHT, BLOCK_SIZE):
                 pygame.draw.line(screen, (20, 20, 20), (0, y), (SCREEN_WIDTH, y))
+            if not world.wrap:
+                # The large world's walls
+                pygame.draw.rect(screen, GRAY, (-camera.left, -camera.top, world.pixel_width, world.pixel_height), 3)
             
-            # Draw game elements
-            for food in self.foods:
-                food.draw(screen)
-            self.snake.draw(screen)
+            # Draw game elements (only what the camera can see)
+            for food in world.visible_food():
+                food.draw(screen, camera.topleft)
+            if self.ghost is not None and self.show_ghost:
+                self.ghost.draw(screen, camera.topleft)
+            for snake in self.snakes:
+                if snake.alive:
+                    snake.draw(screen)
             
             # Draw HUD
-            font = pygame.font.Font(None, 36)
-            score_text = font.render(f'Score: {self.snake.score}', True, WHITE)
-            length_text = font.render(f'Length: {self.snake.length}', True, WHITE)
+            font = get_font(36)
+            if self.players == 1:
+                score_text = font.render(f'Score: {self.snake.score}', True, WHITE)
+                length_text = font.render(f'Length: {self.snake.length}', True, WHITE)
+            else:
+                # One line per player in their colour, greyed out once knocked out
+                for i, snake in enumerate(self.snakes):
+                    status = f'{snake.score}' if snake.alive else f'{snake.score} OUT'
+                    text = font.render(f'P{snake.player}: {status}', True, snake.color if snake.alive else GRAY)
+                    screen.blit(text, (SCREEN_WIDTH // 2 - 330 + i * 170, SCREEN_HEIGHT - 50))
+                score_text = font.render(f'Top Score: {self.top_score()}', True, WHITE)
+                length_text = font.render(f'Players: {self.players}', True, WHITE)
             speed_text = font.render(f'Speed: {self.current_speed}', True, WHITE)
             high_score = self.leaderboard.get_high_score()
             high_score_text = font.render(f'High Score: {high_score}', True, YELLOW)
@@ -1045,7 +1120,7 @@ class Game:
             screen.blit(speed_text, (10, 90))
             screen.blit(high_score_text, (10, 130))
             
-            legend_font = pygame.font.Font(None, 20)
+            legend_font = get_font(20)
             legends = [
                 ("Red: +1 point", RED),
                 ("Yellow: +2 points", YELLOW),
@@ -1056,37 +1131,49 @@ class Game:
                 legend_text = legend_font.render(text, True, color)
                 screen.blit(legend_text, (10, 180 + i * 22))
             
-            controls_font = pygame.font.Font(None, 24)
-            controls = [
-                "WASD: Move",
+            controls_font = get_font(24)
+            if self.players == 1:
+                moves = ["WASD: Move"]
+            else:
+                moves = [f"P{player}: {PLAYER_KEY_NAMES[player - 1]}" for player in range(1, self.players + 1)]
+            if self.ghost is not None:
+                moves.append("G: Ghost")
+            controls = moves + [
                 "P: Pause",
                 "ESC: Menu",
                 "R: Restart"
             ]
             for i, control in enumerate(controls):
                 text = controls_font.render(control, True, WHITE)
-                screen.blit(text, (SCREEN_WIDTH - 180, 10 + i * 25))
+                screen.blit(text, (SCREEN_WIDTH - 220, 10 + i * 25))
+            
+            if self.demo:
+                demo_text = get_font(48).render("DEMO - PRESS ANY KEY TO PLAY", True, YELLOW)
+                screen.blit(demo_text, demo_text.get_rect(center=(SCREEN_WIDTH // 2, 40)))
         
         if self.title_screen:
             self.draw_title_screen()
         
-        if self.show_leaderboard:
-            self.draw_leaderboard()
-        
-        if self.paused and not (self.show_leaderboard):
-            self.draw_pause_menu()
-        
         if self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))
-            screen.blit(overlay, (0, 0))
+            dim(screen, 200)
             
-            big_font = pygame.font.Font(None, 72)
-            small_font = pygame.font.Font(None, 36)
+            big_font = get_font(72)
+            small_font = get_font(36)
             
-            game_over_text = big_font.render('GAME OVER', True, RED)
-            score_text = small_font.render(f'Final Score: {self.snake.score}', True, WHITE)
-            length_text = small_font.render(f'Final Length: {self.snake.length}', True, WHITE)
+            if self.players == 1:
+                game_over_text = big_font.render('GAME OVER', True, RED)
+                score_text = small_font.render(f'Final Score: {self.snake.score}', True, WHITE)
+                length_text = small_font.render(f'Final Length: {self.snake.length}', True, WHITE)
+            else:
+                winners = [snake for snake in self.snakes if snake.alive]
+                if winners:
+                    game_over_text = big_font.render(f'PLAYER {winners[0].player} WINS', True, winners[0].color)
+                else:
+                    game_over_text = big_font.render('DRAW', True, RED)
+                score_text = small_font.render('Final Scores: ' + '   '.join(
+                    f'P{snake.player}: {snake.score}' for snake in self.snakes), True, WHITE)
+                length_text = small_font.render('Final Lengths: ' + '   '.join(
+                    f'P{snake.player}: {snake.length}' for snake in self.snakes), True, WHITE)
             
             restart_text = small_font.render('Press R to Restart or Click Here', True, WHITE)
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70))
@@ -1100,56 +1187,164 @@ class Game:
             screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)))
             screen.blit(length_text, length_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30)))
 
-def main():
-    # Initialize pygame and screen
-    pygame.init()
-    global screen, SCREEN_WIDTH, SCREEN_HEIGHT, BLOCK_SIZE, GRID_WIDTH, GRID_HEIGHT
-    
-    # Calculate grid-aligned screen dimensions
-    BLOCK_SIZE = 30
-    GRID_WIDTH = pygame.display.Info().current_w // BLOCK_SIZE
-    GRID_HEIGHT = pygame.display.Info().current_h // BLOCK_SIZE
-    SCREEN_WIDTH = GRID_WIDTH * BLOCK_SIZE
-    SCREEN_HEIGHT = GRID_HEIGHT * BLOCK_SIZE
+class Overlay(Scene):
+    """A menu or dialog drawn over a dimmed, frozen snapshot of the screen beneath it."""
+    opaque = False
+    dim = 200
 
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-    pygame.display.set_caption('Snake Rush - Endless Mode')
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "show_credits"
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.stack.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            return self.click(pygame.mouse.get_pos(), event)
+        return None
+
+    def click(self, mouse_pos, event):
+        return None
+
+    def draw_buttons(self, surface, buttons):
+        mouse_pos = pygame.mouse.get_pos()
+        for button in buttons:
+            button.check_hover(mouse_pos)
+        for button in buttons:
+            button.draw(surface)
+
+
+class PauseMenu(Overlay):
+    def click(self, mouse_pos, event):
+        game = self.game
+        if game.resume_button.is_clicked(mouse_pos, event):
+            self.stack.pop()
+        elif game.leaderboard_button.is_clicked(mouse_pos, event):
+            self.stack.push(LeaderboardView(game))
+        elif game.restart_button.is_clicked(mouse_pos, event):
+            game.restart_game()
+            self.stack.pop()
+        elif game.quit_button.is_clicked(mouse_pos, event):
+            game.__init__(game.large_world, game.players)
+            game.title_screen = True
+            self.stack.pop()
+
+    def draw(self, surface):
+        game = self.game
+        big_font = get_font(72)
+        title = big_font.render("GAME PAUSED", True, WHITE)
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
+
+        self.draw_buttons(surface, [game.resume_button, game.leaderboard_button,
+                                    game.restart_button, game.quit_button])
+
+
+class LeaderboardView(Overlay):
+    dim = 220
+
+    def click(self, mouse_pos, event):
+        if self.game.back_button.is_clicked(mouse_pos, event):
+            self.stack.pop()
+        elif self.game.reset_scores_button.is_clicked(mouse_pos, event):
+            self.stack.push(ConfirmDialog(self.game, "Reset all scores?", self.game.leaderboard.reset_scores))
+
+    def draw(self, surface):
+        game = self.game
+        big_font = get_font(72)
+        title = big_font.render("LEADERBOARD", True, CYAN)
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 100)))
+
+        header_font = get_font(48)
+        rank_header = header_font.render("RANK", True, YELLOW)
+        score_header = header_font.render("SCORE", True, YELLOW)
+        length_header = header_font.render("LENGTH", True, YELLOW)
+        date_header = header_font.render("DATE", True, YELLOW)
+
+        header_y = 180
+        surface.blit(rank_header, (200, header_y))
+        surface.blit(score_header, (350, header_y))
+        surface.blit(length_header, (550, header_y))
+        surface.blit(date_header, (700, header_y))
+
+        pygame.draw.line(surface, WHITE, (150, header_y + 50), (SCREEN_WIDTH - 150, header_y + 50), 2)
+
+        score_font = get_font(36)
+        scores = game.leaderboard.get_top_scores()
+
+        if not scores:
+            no_scores_text = score_font.render("No scores yet! Be the first to play!", True, WHITE)
+            surface.blit(no_scores_text, no_scores_text.get_rect(center=(SCREEN_WIDTH//2, 300)))
+        else:
+            for i, entry in enumerate(scores):
+                y_pos = 250 + i * 40
+
+                color = GREEN if (game.game_over and entry['score'] == game.snake.score and
+                                entry['length'] == game.snake.length) else WHITE
+
+                rank_text = score_font.render(f"{i + 1}.", True, color)
+                score_text = score_font.render(f"{entry['score']:,}", True, color)
+                length_text = score_font.render(f"{entry['length']}", True, color)
+                date_text = score_font.render(entry['date'][:10], True, color)
+
+                surface.blit(rank_text, (200, y_pos))
+                surface.blit(score_text, (350, y_pos))
+                surface.blit(length_text, (550, y_pos))
+                surface.blit(date_text, (700, y_pos))
+
+        self.draw_buttons(surface, [game.back_button, game.reset_scores_button])
+
+
+class ConfirmDialog(Overlay):
+    """Yes/No question; on_yes runs only when the player confirms."""
+    dim = 220
+
+    def __init__(self, game, message, on_yes):
+        super().__init__(game)
+        self.message = message
+        self.on_yes = on_yes
+        self.yes_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 20, 120, 50,
+                                 "Yes", RED, (255, 100, 100))
+        self.no_button = Button(SCREEN_WIDTH//2 + 30, SCREEN_HEIGHT//2 + 20, 120, 50,
+                                "No", GRAY, LIGHT_GRAY)
+
+    def click(self, mouse_pos, event):
+        if self.yes_button.is_clicked(mouse_pos, event):
+            self.on_yes()
+            self.stack.pop()
+        elif self.no_button.is_clicked(mouse_pos, event):
+            self.stack.pop()
+
+    def draw(self, surface):
+        font = get_font(36)
+        text = font.render(self.message, True, WHITE)
+        surface.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30)))
+
+        self.draw_buttons(surface, [self.yes_button, self.no_button])
+
+
+def main():
+    # Initialize pygame, sounds and the scaled, grid-aligned window
+    create_app()
 
     # Show logo screen first
-    logo_screen = LogoScreen()
-    logo_done = False
-    
-    # Logo screen loop
-    while not logo_done:
-        result = logo_screen.update()
-        if result == "quit":  # If user quits during logo screen
-            pygame.quit()
-            sys.exit()
-        elif result:  # If logo sequence is done or skipped
-            logo_done = True
-        
-        logo_screen.draw(screen)
-        pygame.display.flip()
-        clock.tick(FPS)
+    logo_screen = LogoScreen(
+        [
+            get_data_path("DD Lab1.png"),
+            (get_data_path("logo1.png"), get_data_path("logo2.jpg")),
+            get_data_path("snake_rush.png")
+        ],
+        skip_keys={pygame.K_TAB, pygame.K_SPACE, pygame.K_RETURN, pygame.K_ESCAPE}
+    )
+    if run_scene(logo_screen, screen, FPS) == "quit":  # If user quits during logo screen
+        pygame.quit()
+        sys.exit()
     
     # Now proceed to main game
     game = Game()
-    running = True
-    
-    while running:
-        result = game.handle_events()
-        if result == "show_credits":  # Handle quit from game
-            running = False
-        elif result == "quit":  # Handle immediate quit
-            pygame.quit()
-            sys.exit()
-        elif not result:  # Handle other cases
-            running = False
-            
-        game.update()
-        game.draw(screen)
-        pygame.display.flip()
-        clock.tick(game.current_speed)
+
+    # Menus are pushed on top of the game; the frame rate is the snake's speed
+    run_scene(SceneStack(game), screen, lambda: game.current_speed, on_frame=audio.begin_frame)
         
     # When quitting the game, show exit credits
     result = show_exit_credits()
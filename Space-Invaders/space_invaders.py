@@ -1,48 +1,34 @@
 import pygame
 import sys
 import random
-import json
 import math
 import os
 from datetime import datetime
 
+# Shared arcade runtime lives alongside the game folders
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from retro_arcade.audio import AudioManager
+from retro_arcade.credits import run_credits
+from retro_arcade import display
+from retro_arcade.display import DEFAULT_SCALING, open_window
+from retro_arcade.fonts import get_font
+from retro_arcade.leaderboard import LeaderboardStore
+from retro_arcade.logos import LogoScreen
+from retro_arcade.overlays import dim
+from retro_arcade.pacing import FramePacer
+from retro_arcade.paths import data_path, writable_path
+from retro_arcade.prewarm import wait_for_launch
+from retro_arcade.scene import Scene, SceneStack, run_scene
+from retro_arcade.ui import Button, ToggleButton
 
-pygame.mixer.init()
 
 def resource_path(filename):
     """Get absolute path to resource, works for dev and for PyInstaller exe"""
-    if getattr(sys, 'frozen', False):  # Running as compiled .exe
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_path, filename)
-
-laser_soundpath = resource_path("laser.wav")
-laser_sound = pygame.mixer.Sound(laser_soundpath)
-laser_sound.set_volume(0.8)
-
-explosion_soundpath = resource_path("explosion.wav")
-explosion_sound = pygame.mixer.Sound(explosion_soundpath)
-explosion_sound.set_volume(0.8)
-
-game_over_soundpath = resource_path("game_over.wav")
-game_over_sound = pygame.mixer.Sound(game_over_soundpath)
-game_over_sound.set_volume(1)  # Set volume
-
-# Game BGM
-game_bg_soundpath = resource_path("space_invader_bgm.wav")
-game_bg = pygame.mixer.Sound(game_bg_soundpath)
-game_bg.set_volume(0.4)  # Set volume
-game_bg_playing = False  # Track BGM state
-
-# Initialize Pygame
-pygame.init()
-
-# Screen settings
+    return data_path(__file__, filename)
+
+# Logical resolution; SDL scales it to the window or display
 SCREEN_WIDTH = 1366
 SCREEN_HEIGHT = 720
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption('Space Invaders')
 
 # Colors
 BLACK = (0, 0, 0)
@@ -58,9 +44,62 @@ GRAY = (100, 100, 100)
 LIGHT_GRAY = (200, 200, 200)
 DARK_GRAY = (50, 50, 50)
 
+# Classic bunker, one character per SHIELD_SCALE x SHIELD_SCALE block of pixels
+SHIELD_SHAPE = (
+    "....##############....",
+    "...################...",
+    "..##################..",
+    ".####################.",
+    "######################",
+    "######################",
+    "######################",
+    "######################",
+    "######################",
+    "######################",
+    "######################",
+    "######################",
+    "#######........#######",
+    "######..........######",
+    "#####............#####",
+    "#####............#####",
+)
+SHIELD_SCALE = 4
+SHIELD_COUNT = 4
+
 # Game settings
-FPS = 60
-clock = pygame.time.Clock()
+FPS = 60  # Simulation steps per second; frames are drawn at the display's rate
+STEP_MS = 1000 / FPS
+
+# Set up by create_app(); importing this module has no side effects
+audio = None
+screen = None
+
+def create_app(fullscreen=False):
+    """Initialize pygame, load the sounds and open the window (once)."""
+    global audio, screen
+    if screen is not None:
+        return screen
+
+    pygame.mixer.init()
+    pygame.init()
+
+    # Sound banks; explosions are rate limited so a wave dying at once stays audible
+    audio = AudioManager({"sfx": 8})
+    audio.load("laser", resource_path("laser.wav"), volume=0.8, min_interval=40)
+    audio.load("explosion", resource_path("explosion.wav"), volume=0.8, min_interval=40)
+    audio.load("game_over", resource_path("game_over.wav"), volume=1)
+
+    # Music is streamed from disk (an .ogg beside the .wav is preferred)
+    audio.stream("bgm", resource_path("space_invader_bgm.wav"), volume=0.4)
+    audio.stream("title", resource_path("space_invader_title.wav"), volume=0.5)
+    audio.stream("outro", resource_path("outro_music.wav"), volume=0.7)
+
+    # When pre-warmed by the launcher, wait here until the player picks this game
+    wait_for_launch()
+
+    screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen)
+    pygame.display.set_caption('Space Invaders')
+    return screen
 
 
 def is_new_high_score(self):
@@ -72,195 +111,37 @@ def is_new_high_score(self):
     return self.score > top_score
 
 
-class LeaderboardManager:
+class LeaderboardManager(LeaderboardStore):
     def __init__(self):
-        self._determine_file_path()
-        self.scores = self.load_scores()
+        super().__init__(
+            self._determine_file_path(),
+            sort_key=lambda x: (-x['score'], -x['level']),  # Score, then level, descending
+            fallback_path=os.path.join(os.path.expanduser('~'), 'space_invaders_leaderboard_fallback.json'),
+            indent=2
+        )
 
-    def _determine_file_path(self):
+    @staticmethod
+    def _determine_file_path():
         """Determine the appropriate path for the leaderboard file"""
         try:
             if getattr(sys, 'frozen', False):
                 # Running as compiled executable
-                if os.name == 'nt':  # Windows
-                    appdata = os.getenv('APPDATA')
-                    save_dir = os.path.join(appdata, 'SpaceInvaders')
-                else:  # Mac/Linux
-                    home = os.path.expanduser('~')
-                    save_dir = os.path.join(home, '.spaceinvaders')
-                
-                # Create directory if it doesn't exist
-                os.makedirs(save_dir, exist_ok=True)
-                self.leaderboard_file = os.path.join(save_dir, "leaderboard.json")
-            else:
-                # Running in development
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-                self.leaderboard_file = os.path.join(base_dir, "space_invaders_leaderboard.json")
-                
-            
-        except Exception as e:
-            self.leaderboard_file = "leaderboard_fallback.json"
-
-    def load_scores(self):
-        """Load scores from the leaderboard file"""
-        try:
-            if os.path.exists(self.leaderboard_file):
-                with open(self.leaderboard_file, 'r') as f:
-                    try:
-                        scores = json.load(f)
-                        
-                        return scores
-                    except json.JSONDecodeError as je:
-                        
-                        return self._handle_corrupt_file()
-            else:
-                
-                return []
-        except Exception as e:
-            return []
-
-    def _handle_corrupt_file(self):
-        """Handle cases where the leaderboard file is corrupt"""
-        try:
-            # Try to rename the corrupt file for debugging
-            corrupt_path = f"{self.leaderboard_file}.corrupt"
-            if os.path.exists(corrupt_path):
-                os.remove(corrupt_path)
-            os.rename(self.leaderboard_file, corrupt_path)
-            
-        except Exception as e:
-            pass
-        
-        return []
-
-    def save_scores(self):
-        """Save scores to the leaderboard file"""
-        try:
-            # First try saving to primary location
-            self._save_to_file(self.leaderboard_file)
-        except Exception as primary_error:
-            pass
-            
-            # Try saving to fallback location
-            fallback_path = os.path.join(os.path.expanduser('~'), 'space_invaders_leaderboard_fallback.json')
-            try:
-                self._save_to_file(fallback_path)
-                
-            except Exception as fallback_error:
-                
-                raise RuntimeError("Could not save leaderboard to any location")
-
-    def _save_to_file(self, file_path):
-        """Internal method to handle actual file saving"""
-        temp_path = f"{file_path}.tmp"
-        
-        # Write to temporary file first
-        with open(temp_path, 'w') as f:
-            json.dump(self.scores, f, indent=2)
-        
-        # Then rename to final file (atomic operation)
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        os.rename(temp_path, file_path)
-        
-        
+                return writable_path('SpaceInvaders', "leaderboard.json")
+            # Running in development
+            return resource_path("space_invaders_leaderboard.json")
+        except Exception:
+            return "leaderboard_fallback.json"
 
     def add_score(self, score, level):
         """Add a new score to the leaderboard"""
         if not isinstance(score, int) or not isinstance(level, int):
             return False
-        
-        entry = {
+
+        return self.add({
             'score': score,
             'level': level,
             'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        self.scores.append(entry)
-        # Sort by score (descending) then by level (descending)
-        self.scores.sort(key=lambda x: (-x['score'], -x['level']))
-        # Keep only top 10
-        self.scores = self.scores[:10]
-        
-        try:
-            self.save_scores()
-            
-            return True
-        except Exception as e:
-            
-            return False
-    
-    def get_top_scores(self, limit=10):
-        """Get the top scores from the leaderboard"""
-        return self.scores[:limit]
-    
-    def is_high_score(self, score):
-        """Check if a score would qualify for the leaderboard"""
-        if not self.scores:  # If no scores exist yet
-            return True
-        
-        # Check if score is higher than the lowest score in top 10
-        min_score = min(entry['score'] for entry in self.scores)
-        return len(self.scores) < 10 or score > min_score
-        
-    def reset_scores(self):
-        """Reset all scores in the leaderboard"""
-        self.scores = []
-        try:
-            self.save_scores()
-            
-            return True
-        except Exception as e:
-            
-            return False
-
-class Button:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.is_hovered = False
-        self.font = pygame.font.Font(None, 36)
-        
-    def draw(self, surface):
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=5)
-        
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-        
-    def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
-        return self.is_hovered
-        
-    def is_clicked(self, pos, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            return self.rect.collidepoint(pos)
-        return False
-
-class ToggleButton(Button):
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE, is_on=False):
-        super().__init__(x, y, width, height, text, color, hover_color, text_color)
-        self.is_on = is_on
-        
-    def draw(self, surface):
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=5)
-        
-        status = "ON" if self.is_on else "OFF"
-        full_text = f"{self.text}: {status}"
-        text_surf = self.font.render(full_text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-        
-    def toggle(self):
-        self.is_on = not self.is_on
-        return self.is_on
+        })
 
 class Player:
     def __init__(self):
@@ -272,9 +153,10 @@ class Player:
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.is_hit = False  # Track if player is currently in hit state
         self.hit_timer = 0   # Timer for hit animation
-        self.hit_duration = 30  # Duration of hit animation (in frames)
+        self.hit_duration = 500  # Duration of hit animation (ms)
         self.is_invincible = False  # Track invincibility state
         self.death_animation_timer = 0  # New: Timer for death animation
+        self.death_duration = 1000  # Duration of death animation (ms)
         self.is_dying = False  # New: Track if player is in death animation
         self.death_particles = []  # New: For particle effects
         self.death_stage = 0  # New: Track which stage of death animation we're in
@@ -285,7 +167,7 @@ class Player:
             
         # Update hit animation timer
         if self.is_hit:
-            self.hit_timer -= 1
+            self.hit_timer -= STEP_MS
             if self.hit_timer <= 0:
                 self.is_hit = False
                 
@@ -302,19 +184,38 @@ class Player:
         self.x = max(0, min(SCREEN_WIDTH - self.width, self.x))
         self.rect.x = self.x
         
+    def update_death(self):
+        """Run one step of the death animation"""
+        self.death_animation_timer -= STEP_MS
+        self.update_particles()
+        
+        # Add new particles throughout the animation
+        if random.random() < 0.3 and self.death_animation_timer > self.death_duration / 6:
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(0.5, 3)
+            size = random.randint(1, 4)
+            lifetime = random.randint(10, 30) * STEP_MS
+            self.death_particles.append({
+                'x': self.x + self.width//2,
+                'y': self.y + self.height//2,
+                'dx': math.cos(angle) * speed,
+                'dy': math.sin(angle) * speed,
+                'size': size,
+                'lifetime': lifetime,
+                'color': random.choice([RED, ORANGE, YELLOW])
+            })
+            
+    def update_particles(self):
+        """Move the death particles one step and drop the burnt-out ones"""
+        for particle in self.death_particles[:]:
+            particle['x'] += particle['dx']
+            particle['y'] += particle['dy']
+            particle['lifetime'] -= STEP_MS
+            if particle['lifetime'] <= 0:
+                self.death_particles.remove(particle)
+                
     def draw(self, screen):
         if self.is_dying:
-            # Update death animation
-            self.death_animation_timer -= 1
-            
-            # Update particles
-            for particle in self.death_particles[:]:
-                particle['x'] += particle['dx']
-                particle['y'] += particle['dy']
-                particle['lifetime'] -= 1
-                if particle['lifetime'] <= 0:
-                    self.death_particles.remove(particle)
-            
             # Draw particles
             for particle in self.death_particles:
                 pygame.draw.circle(
@@ -324,14 +225,15 @@ class Player:
                     particle['size']
                 )
             
-            # Draw different stages of explosion
-            if self.death_animation_timer > 40:  # Initial flash
-                radius = int((60 - self.death_animation_timer) * 3)
+            # Draw different stages of explosion, a third of the animation each
+            stage = self.death_duration / 3
+            if self.death_animation_timer > 2 * stage:  # Initial flash
+                radius = int((self.death_duration - self.death_animation_timer) / stage * 60)
                 pygame.draw.circle(screen, WHITE, 
                                 (self.x + self.width//2, self.y + self.height//2), 
                                 radius)
-            elif self.death_animation_timer > 20:  # Main explosion
-                radius = int((40 - self.death_animation_timer) * 4)
+            elif self.death_animation_timer > stage:  # Main explosion
+                radius = int((2 * stage - self.death_animation_timer) / stage * 80)
                 pygame.draw.circle(screen, ORANGE, 
                                 (self.x + self.width//2, self.y + self.height//2), 
                                 radius)
@@ -339,31 +241,14 @@ class Player:
                                 (self.x + self.width//2, self.y + self.height//2), 
                                 radius - 10)
             else:  # Fading out
-                alpha = int(255 * (self.death_animation_timer / 20))
+                alpha = int(255 * (self.death_animation_timer / stage))
                 s = pygame.Surface((100, 100), pygame.SRCALPHA)
                 pygame.draw.circle(s, (255, 165, 0, alpha), (50, 50), 30)
                 screen.blit(s, (self.x + self.width//2 - 50, self.y + self.height//2 - 50))
-            
-            # Add new particles throughout the animation
-            if random.random() < 0.3 and self.death_animation_timer > 10:
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(0.5, 3)
-                size = random.randint(1, 4)
-                lifetime = random.randint(10, 30)
-                self.death_particles.append({
-                    'x': self.x + self.width//2,
-                    'y': self.y + self.height//2,
-                    'dx': math.cos(angle) * speed,
-                    'dy': math.sin(angle) * speed,
-                    'size': size,
-                    'lifetime': lifetime,
-                    'color': random.choice([RED, ORANGE, YELLOW])
-                })
-            
             return
             
         # Flash between red and normal colors during hit
-        if self.is_hit and self.hit_timer % 10 < 5:  # Flash every 5 frames
+        if self.is_hit and self.hit_timer % 160 < 80:  # Flash every 80 ms
             base_color = RED
         else:
             base_color = GREEN
@@ -391,7 +276,7 @@ class Player:
     def trigger_death(self):
         """Start the death animation"""
         self.is_dying = True
-        self.death_animation_timer = 60  # 1 second at 60 FPS
+        self.death_animation_timer = self.death_duration
         self.death_stage = 0
         self.death_particles = []  # Clear any old particles
         
@@ -400,7 +285,7 @@ class Player:
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(1, 5)
             size = random.randint(2, 6)
-            lifetime = random.randint(30, 60)
+            lifetime = random.randint(30, 60) * STEP_MS
             self.death_particles.append({
                 'x': self.x + self.width//2,
                 'y': self.y + self.height//2,
@@ -425,6 +310,10 @@ class Bullet:
         self.y += self.speed
         self.rect.y = self.y
         
+    def swept_rect(self):
+        """The area the bullet passed through on its last move."""
+        return self.rect.union(self.rect.move(0, -self.speed))
+        
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect)
 
@@ -441,7 +330,7 @@ class Invader:
         self.points = 10 * invader_type
         self.is_hit = False  # Track if invader is currently in hit state
         self.hit_timer = 0   # Timer for hit animation
-        self.hit_duration = 15  # Duration of hit animation (shorter than player's)
+        self.hit_duration = 250  # Duration of hit animation in ms (shorter than player's)
         
     def update(self, dx, dy):
         self.x += dx
@@ -451,7 +340,7 @@ class Invader:
         
         # Update hit animation timer
         if self.is_hit:
-            self.hit_timer -= 1
+            self.hit_timer -= STEP_MS
             if self.hit_timer <= 0:
                 self.is_hit = False
                 
@@ -472,7 +361,7 @@ class Invader:
             color = tuple(c // 2 for c in color)
             
         # Flash white when hit
-        if self.is_hit and self.hit_timer % 5 < 3:  # Faster flash than player
+        if self.is_hit and self.hit_timer % 80 < 50:  # Faster flash than player
             color = WHITE
             
         pygame.draw.rect(screen, color, self.rect)
@@ -497,161 +386,165 @@ class Invader:
             pygame.draw.rect(screen, BLACK if self.is_hit else WHITE, (self.x + 5, self.y + 10, 8, 8))
             pygame.draw.rect(screen, BLACK if self.is_hit else WHITE, (self.x + 27, self.y + 10, 8, 8))
 
-class LogoScreen:
-    def __init__(self):
-        self.logos = []
-        self.current_logo = 0
-        self.logo_duration = 4000  # 4 seconds per logo set
-        self.fade_duration = 1000  # 1 second fade in/out
-        self.start_time = pygame.time.get_ticks()
-        self.load_logos()
-        self.fade_state = "in"  # "in", "hold", or "out"
-        self.next_logo_time = self.start_time + self.fade_duration
-        self.paired_logos = []  # Store pairs of logos to display together
-
-        # Keys that should trigger skipping the logos
-        self.skip_keys = {
-            pygame.K_RETURN, pygame.K_ESCAPE
-        }
+def make_crater(seed, radius=6):
+    """A ragged, roughly round blast mask; each seed gives a different one."""
+    rng = random.Random(seed)
+    size = radius * 2 + 1
+    crater = pygame.mask.Mask((size, size))
+    for y in range(size):
+        for x in range(size):
+            distance = math.hypot(x - radius, y - radius)
+            # Solid core, frayed edge and a few stray pixels knocked out around it
+            if distance <= radius - 2 or (distance <= radius and rng.random() < 0.6) or rng.random() < 0.05:
+                crater.set_at((x, y))
+    return crater
 
-    def load_logos(self):
-        # Try to load multiple logo images
-        logo_paths = [
-            resource_path("DD Lab1.png"),
-            (resource_path("logo1.png"), resource_path("logo2.jpg")),
-            resource_path("space_invaders.jpg")
-        ]
-        
-        for item in logo_paths:
-            try:
-                # Handle single logos
-                if isinstance(item, str):
-                    logo = pygame.image.load(item)
-                    # Scale logo if needed
-                    max_width = SCREEN_WIDTH * 0.9
-                    max_height = SCREEN_HEIGHT * 0.8
-                    logo_width, logo_height = logo.get_size()
-                    scale = min(max_width / logo_width, max_height / logo_height)
-                    if scale < 1:
-                        logo = pygame.transform.scale(
-                            logo, 
-                            (int(logo_width * scale), int(logo_height * scale)))
-                    self.logos.append([logo])  # Store as single-item list
-                
-                # Handle logo pairs
-                elif isinstance(item, tuple) and len(item) == 2:
-                    logo_pair = []
-                    for path in item:
-                        logo = pygame.image.load(path)
-                        # Scale each logo to fit half the screen
-                        max_width = SCREEN_WIDTH * 0.45
-                        max_height = SCREEN_HEIGHT * 0.8
-                        logo_width, logo_height = logo.get_size()
-                        scale = min(max_width / logo_width, max_height / logo_height)
-                        if scale < 1:
-                            logo = pygame.transform.scale(
-                                logo, 
-                                (int(logo_width * scale), int(logo_height * scale)))
-                        logo_pair.append(logo)
-                    self.logos.append(logo_pair)
-            
-            except Exception as e:
-                pass
-        
-        # If no logos loaded, create text-based ones
-        if not self.logos:
-            font = pygame.font.Font(None, 72)
-            for i in range(3):
-                surf = pygame.Surface((400, 200), pygame.SRCALPHA)
-                text = font.render(f"Desk Devil Labs", True, WHITE)
-                text_rect = text.get_rect(center=(200, 100))
-                surf.blit(text, text_rect)
-                pygame.draw.rect(surf, WHITE, (0, 0, 400, 200), 2)
-                self.logos.append([surf])
-    
-    def update(self):
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - self.start_time
+class Shield:
+    """A destructible bunker that erodes pixel by pixel under fire.
 
-        # Check for key presses to skip
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in self.skip_keys:
-                    return True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                return True
-        
-        # Update fade state
-        if self.fade_state == "in" and current_time >= self.next_logo_time:
-            self.fade_state = "hold"
-            self.next_logo_time = current_time + (self.logo_duration - 2 * self.fade_duration)
-        elif self.fade_state == "hold" and current_time >= self.next_logo_time:
-            self.fade_state = "out"
-            self.next_logo_time = current_time + self.fade_duration
-        elif self.fade_state == "out" and current_time >= self.next_logo_time:
-            self.current_logo += 1
-            if self.current_logo >= len(self.logos):
-                return True
-            self.start_time = current_time
-            self.fade_state = "in"
-            self.next_logo_time = current_time + self.fade_duration
-        
-        return False
-    
-    def draw(self, surface):
-        surface.fill(BLACK)
-        
-        if self.current_logo < len(self.logos):
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.start_time
-            
-            # Calculate alpha based on fade state
-            if self.fade_state == "in":
-                alpha = min(255, int(255 * (elapsed / self.fade_duration)))
-            elif self.fade_state == "out":
-                alpha = max(0, 255 - int(255 * ((current_time - (self.next_logo_time - self.fade_duration)) / self.fade_duration)))
-            else:  # hold
-                alpha = 255
-            
-            # Get current logo(s) - could be single or pair
-            current_logos = self.logos[self.current_logo]
-            
-            # Create a composite surface if multiple logos
-            if len(current_logos) > 1:
-                # Calculate total width and max height
-                total_width = sum(logo.get_width() for logo in current_logos) + 20 * (len(current_logos) - 1)
-                max_height = max(logo.get_height() for logo in current_logos)
-                
-                # Create a temporary surface for the composite
-                composite = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
-                x_offset = 0
-                for logo in current_logos:
-                    composite.blit(logo, (x_offset, (max_height - logo.get_height()) // 2))
-                    x_offset += logo.get_width() + 20
-                
-                # Apply alpha to the composite
-                composite.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                composite_rect = composite.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(composite, composite_rect)
-            
-            else:  # Single logo
-                logo = current_logos[0]
-                temp_surface = pygame.Surface((logo.get_width(), logo.get_height()), pygame.SRCALPHA)
-                temp_surface.blit(logo, (0, 0))
-                temp_surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-                logo_rect = temp_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                surface.blit(temp_surface, logo_rect)
-
-class Game:
+    Its shape lives in a pygame mask. A bullet's rect is tested against it
+    with Mask.overlap (after a plain rect check), and a hit erases a crater
+    from the mask and clears the same pixels in the shield's per-pixel
+    alpha surface in place, so no hit allocates a surface or rebuilds the
+    mask from pixels.
+    """
+
+    COLOR = GREEN
+    CLEAR = (0, 0, 0, 0)
+    shape = None  # Full-size mask of SHIELD_SHAPE, built with the first shield
+    craters = []
+    solids = {}  # size -> fully set mask, for bullet and invader rects
+
+    def __init__(self, x, y):
+        if Shield.shape is None:
+            Shield.shape = self.build_shape()
+            Shield.craters = [make_crater(seed) for seed in range(4)]
+        self.mask = Shield.shape.copy()
+        self.surface = self.mask.to_surface(setcolor=self.COLOR, unsetcolor=self.CLEAR)
+        self.rect = self.surface.get_rect(topleft=(x, y))
+
+    @staticmethod
+    def build_shape():
+        blocks = pygame.mask.Mask((len(SHIELD_SHAPE[0]), len(SHIELD_SHAPE)))
+        for y, line in enumerate(SHIELD_SHAPE):
+            for x, cell in enumerate(line):
+                if cell == "#":
+                    blocks.set_at((x, y))
+        width, height = blocks.get_size()
+        return blocks.scale((width * SHIELD_SCALE, height * SHIELD_SCALE))
+
+    @classmethod
+    def solid(cls, size):
+        mask = cls.solids.get(size)
+        if mask is None:
+            mask = cls.solids[size] = pygame.mask.Mask(size, fill=True)
+        return mask
+
+    def hit(self, rect, direction):
+        """Erode the shield where a shot's rect meets it; True if the shot was stopped.
+
+        direction is 1 for shots falling from the invaders and -1 for the
+        player's. The crater is centred on the first solid pixel in the
+        shot's path.
+        """
+        if not self.rect.colliderect(rect):
+            return False
+        offset_x, offset_y = rect.x - self.rect.x, rect.y - self.rect.y
+        point = self.mask.overlap(self.solid(rect.size), (offset_x, offset_y))
+        if point is None:
+            return False
+
+        # Walk the hit column from the edge the shot came in by
+        x = point[0]
+        top = max(offset_y, 0)
+        bottom = min(offset_y + rect.height, self.rect.height) - 1
+        rows = range(top, bottom + 1) if direction > 0 else range(bottom, top - 1, -1)
+        y = next(y for y in rows if self.mask.get_at((x, y)))
+
+        crater = random.choice(self.craters)
+        width, height = crater.get_size()
+        dest = (x - width // 2, y - height // 2)
+        self.mask.erase(crater, dest)
+        crater.to_surface(self.surface, setcolor=self.CLEAR, unsetcolor=None, dest=dest)
+        return True
+
+    def erase(self, rect):
+        """Clear everything under rect (invaders plough through the shields)."""
+        if self.rect.colliderect(rect):
+            local = rect.move(-self.rect.x, -self.rect.y)
+            self.mask.erase(self.solid(rect.size), local.topleft)
+            self.surface.fill(self.CLEAR, local)
+
+    def draw(self, screen):
+        screen.blit(self.surface, self.rect)
+
+class ShooterIndex:
+    """The bottom-most live invader of every formation column.
+
+    Only those invaders have a clear line of fire. Each column keeps its
+    invaders top to bottom and a kill just drops dead ones off the bottom,
+    while the columns that still have a shooter sit in a list with their
+    positions, so picking a shooter or retiring an emptied column is O(1)
+    however big the formation is.
+    """
+
+    def __init__(self, cols=0, pitch=70):
+        self.columns = [[] for _ in range(cols)]
+        self.pitch = pitch  # Horizontal distance between columns
+        self.live = []  # Columns that still have an invader
+        self.slot = {}  # column -> its position in live
+
+    def add(self, invader):
+        # Invaders are added a row at a time, from the top down
+        column = self.columns[invader.col]
+        if not column:
+            self.slot[invader.col] = len(self.live)
+            self.live.append(invader.col)
+        column.append(invader)
+
+    def remove(self, invader):
+        """Forget a destroyed invader; an invader further up may take over its column."""
+        column = self.columns[invader.col]
+        while column and column[-1].health <= 0:
+            column.pop()
+        if not column:
+            # Swap the emptied column out of the live list
+            index = self.slot.pop(invader.col)
+            last = self.live.pop()
+            if last != invader.col:
+                self.live[index] = last
+                self.slot[last] = index
+
+    def volley(self, count):
+        """Shooters from up to count different columns."""
+        cols = random.sample(self.live, min(count, len(self.live)))
+        return [self.columns[col][-1] for col in cols]
+
+    def nearest(self, x):
+        """The shooter of the live column closest to x."""
+        # Every column moves together, so any shooter gives the formation's position
+        anchor = self.columns[self.live[0]][-1]
+        exact = (x - anchor.x - anchor.width / 2) / self.pitch + anchor.col
+        target = max(0, min(round(exact), len(self.columns) - 1))
+        side = 1 if exact > target else -1  # Look on x's side of the target column first
+        for distance in range(len(self.columns)):
+            for col in (target + side * distance, target - side * distance):
+                if 0 <= col < len(self.columns) and self.columns[col]:
+                    return self.columns[col][-1]
+        return None
+
+    def __len__(self):
+        return len(self.live)
+
+class Game(Scene):
     def __init__(self):
         self.player = Player()
         self.player_bullets = []
         self.invader_bullets = []
         self.invaders = []
+        self.shooters = ShooterIndex()
+        self.shields = []
+        self.shield_area = pygame.Rect(0, 0, 0, 0)  # Bounding box of all the shields
         self.score = 0
         self.lives = 10
         self.level = 1
@@ -666,20 +559,15 @@ class Game:
         self.invader_shoot_delay = 60
         self.level_start_time = 0
         self.show_level_text = False
-        self.level_text_timer = 180  # 3 seconds at 60 FPS
-        self.paused = False
-        self.show_leaderboard = False
-        self.show_options = False
-        self.mute_sounds = False
-        self.mute_bgm = False
+        self.level_text_timer = 3000  # ms
+        self.mute_sounds = audio.is_muted("sfx")
+        self.mute_bgm = audio.is_muted("music")
         self.leaderboard_manager = LeaderboardManager()
         self.score_submitted = False
         self.title_screen = True
         self.fullscreen = True
-        self.show_confirmation = False
-        self.confirmation_buttons = []
-        self.show_exit_confirmation = False
-        self.death_delay = 120  # 1 second delay at 60 FPS
+        self.scaling = DEFAULT_SCALING
+        self.death_delay = 2000  # ms between the explosion and the game over screen
         self.death_timer = 0
         
 
@@ -688,52 +576,62 @@ class Game:
             1: {
                 'rows': 4, 'cols': 8, 'types': [1, 1], 'speed': 1, 'shoot_chance': 0.02,
                 'name': 'LEVEL 1: Basic Formation',
-                'bullets_per_shot': 1
+                'bullets_per_shot': 1,
+                'volley': 1, 'aimed_chance': 0
             },
             2: {
                 'rows': 5, 'cols': 9, 'types': [1, 1, 2], 'speed': 2, 'shoot_chance': 0.02,
                 'name': 'LEVEL 2: Mixed Forces',
-                'bullets_per_shot': 1
+                'bullets_per_shot': 1,
+                'volley': 1, 'aimed_chance': 0
             },
             3: {
                 'rows': 5, 'cols': 10, 'types': [1, 2, 2, 3], 'speed': 3, 'shoot_chance': 0.025,
                 'name': 'LEVEL 3: Heavy Resistance',
-                'bullets_per_shot': 1
+                'bullets_per_shot': 1,
+                'volley': 1, 'aimed_chance': 0
             },
             4: {
                 'rows': 6, 'cols': 10, 'types': [2, 2, 3, 3, 4], 'speed': 3, 'shoot_chance': 0.025,
                 'name': 'LEVEL 4: Elite Squadron',
-                'bullets_per_shot': 1
+                'bullets_per_shot': 1,
+                'volley': 1, 'aimed_chance': 0.1
             },
             5: {
                 'rows': 6, 'cols': 12, 'types': [3, 3, 4, 4, 5, 5], 'speed': 3.5, 'shoot_chance': 0.025,
                 'name': 'LEVEL 5: BOSS WAVE',
-                'bullets_per_shot': 2
+                'bullets_per_shot': 2,
+                'volley': 1, 'aimed_chance': 0.2
             },
             6: {
                 'rows': 7, 'cols': 12, 'types': [3, 3, 4, 4, 5, 5], 'speed': 3.7, 'shoot_chance': 0.029,
                 'name': 'LEVEL 6: ARMADA APPROACHES',
-                'bullets_per_shot': 3
+                'bullets_per_shot': 3,
+                'volley': 1, 'aimed_chance': 0.2
             },
             7: {
                 'rows': 7, 'cols': 12, 'types': [3, 4, 4, 4, 5, 5], 'speed': 3.7, 'shoot_chance': 0.030,
                 'name': 'LEVEL 7: DANGER ZONE',
-                'bullets_per_shot': 3
+                'bullets_per_shot': 3,
+                'volley': 2, 'aimed_chance': 0.25
             },
             8: {
                 'rows': 8, 'cols': 13, 'types': [4, 4, 4, 4, 4, 5], 'speed': 3.9, 'shoot_chance': 0.031,
                 'name': 'LEVEL 8: ARMAGEDDON',
-                'bullets_per_shot': 4
+                'bullets_per_shot': 4,
+                'volley': 2, 'aimed_chance': 0.25
             },
             9: {
                 'rows': 8, 'cols': 13, 'types': [4, 4, 4, 4, 5, 5], 'speed': 4.1, 'shoot_chance': 0.032,
                 'name': 'LEVEL 9: FINAL DEFENSE',
-                'bullets_per_shot': 4
+                'bullets_per_shot': 4,
+                'volley': 2, 'aimed_chance': 0.3
             },
             10: {
                 'rows': 9, 'cols': 13, 'types': [4, 4, 4, 5, 5, 5], 'speed': 4.4, 'shoot_chance': 0.035,
                 'name': 'LEVEL 10: GALACTIC SHOWDOWN',
-                'bullets_per_shot': 5
+                'bullets_per_shot': 5,
+                'volley': 3, 'aimed_chance': 0.3
             }
         }
         
@@ -764,6 +662,9 @@ class Game:
                                 "Back", GRAY, LIGHT_GRAY)
         
         # Options menu buttons
+        self.smooth_scaling_button = ToggleButton(center_x, start_y, button_width, button_height,
+                                                  "Smoothing", GRAY, LIGHT_GRAY,
+                                                  is_on=self.scaling == "bilinear")
         self.mute_sounds_button = ToggleButton(center_x, start_y + button_spacing, button_width, button_height,
                                                "Sounds", GRAY, LIGHT_GRAY, is_on=not self.mute_sounds)
         self.mute_bgm_button = ToggleButton(center_x, start_y + button_spacing * 2, button_width, button_height,
@@ -796,238 +697,133 @@ class Game:
         self.create_invaders()
 
     def toggle_fullscreen(self):
-        global screen, SCREEN_WIDTH, SCREEN_HEIGHT
-        self.fullscreen = not self.fullscreen
-        
-        if self.fullscreen:
-            info = pygame.display.Info()
-            screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
-        else:
-            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-        
-        SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
-        self.reposition_ui()
+        # The game keeps drawing at its logical size; only the presentation changes
+        if self.reopen_window(not self.fullscreen, self.scaling):
+            self.fullscreen = not self.fullscreen
+            return True
+        return False
+
+    def toggle_scaling(self):
+        scaling = "integer" if self.scaling == "bilinear" else "bilinear"
+        if self.reopen_window(self.fullscreen, scaling):
+            self.scaling = scaling
+            return True
+        return False
+
+    def reopen_window(self, fullscreen, scaling):
+        try:
+            open_window((SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen, scaling)
+        except pygame.error as e:
+            print(f"Error changing display mode: {e}")
+            return False
+        return True
 
     def create_invaders(self):
         self.invaders = []
         config = self.level_configs[self.level]
+        col_pitch = 70
+        self.shooters = ShooterIndex(config['cols'], col_pitch)
         
         for row in range(config['rows']):
             for col in range(config['cols']):
-                x = 100 + col * 70
+                x = 100 + col * col_pitch
                 y = 80 + row * 50
                 
                 type_index = min(row, len(config['types']) - 1)
                 invader_type = config['types'][type_index]
                 
-                self.invaders.append(Invader(x, y, invader_type))
+                invader = Invader(x, y, invader_type)
+                invader.col = col
+                self.invaders.append(invader)
+                self.shooters.add(invader)
         
         self.invader_speed_x = config['speed']
         self.invader_shoot_chance = config['shoot_chance']
+        # Every wave starts with fresh shields
+        self.create_shields()
 
-    def reposition_ui(self):
-        button_width = 200
-        button_height = 50
-        center_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_spacing = 70
-        start_y = SCREEN_HEIGHT // 2 - 120
-        
-        # Reposition all buttons
-        self.resume_button.rect = pygame.Rect(center_x, start_y, button_width, button_height)
-        self.leaderboard_button.rect = pygame.Rect(center_x, start_y + button_spacing, button_width, button_height)
-        self.options_button.rect = pygame.Rect(center_x, start_y + button_spacing * 2, button_width, button_height)
-        self.restart_button.rect = pygame.Rect(center_x, start_y + button_spacing * 3, button_width, button_height)
-        self.quit_button.rect = pygame.Rect(center_x, start_y + button_spacing * 4, button_width, button_height)
-                
-        self.back_button.rect = pygame.Rect(center_x, SCREEN_HEIGHT - 60, button_width, button_height)
-        
-        # Add the reset scores button to options position
-        self.reset_scores_button.rect = pygame.Rect(center_x, start_y + button_spacing * 4, button_width, button_height)
-        self.options_back_button.rect = pygame.Rect(center_x, start_y + button_spacing * 5, button_width, button_height)
-        
-        self.start_button.rect = pygame.Rect(center_x, SCREEN_HEIGHT // 2 + 50, button_width, button_height)
-        self.title_leaderboard_button.rect = pygame.Rect(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing, 
-                                                         button_width, button_height)
-        self.title_options_button.rect = pygame.Rect(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing * 2,
-                                                     button_width, button_height)
-        self.title_quit_button.rect = pygame.Rect(center_x, SCREEN_HEIGHT // 2 + 50 + button_spacing * 3,
-                                                  button_width, button_height)
-        
-        self.yes_button.rect = pygame.Rect(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 60, 120, 50)
-        self.no_button.rect = pygame.Rect(SCREEN_WIDTH//2 + 30, SCREEN_HEIGHT//2 + 60, 120, 50)
+    def create_shields(self):
+        width = len(SHIELD_SHAPE[0]) * SHIELD_SCALE
+        height = len(SHIELD_SHAPE) * SHIELD_SCALE
+        y = self.player.y - height - 40
+        self.shields = [Shield(SCREEN_WIDTH * (i + 1) // (SHIELD_COUNT + 1) - width // 2, y)
+                        for i in range(SHIELD_COUNT)]
+        self.shield_area = self.shields[0].rect.unionall([shield.rect for shield in self.shields])
 
-    def handle_events(self):
-        global game_bg_playing, SCREEN_WIDTH, SCREEN_HEIGHT, screen
-        ctrl_pressed = pygame.key.get_pressed()[pygame.K_RCTRL]
-        alt_pressed = pygame.key.get_pressed()[pygame.K_RALT]
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                # Pause the game
-                self.paused = True
-                self.show_exit_confirmation = True
-
-            elif event.type == pygame.VIDEORESIZE:
-                if not self.fullscreen:
-                    SCREEN_WIDTH, SCREEN_HEIGHT = event.size
-                    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-                    self.reposition_ui()
-                            
-            elif event.type == pygame.KEYDOWN:
-                if self.title_screen:
-                    if (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE) and not (self.show_leaderboard or self.show_options):
-                        self.title_screen = False
-                        self.level_start_time = 0
-                        self.show_level_text = True
-                        self.level_text_timer = 180
-                    elif event.key == pygame.K_ESCAPE:
-                        if self.show_leaderboard or self.show_options:
-                            self.show_leaderboard = False
-                            self.show_options = False
-                else:
-                    if (event.key == pygame.K_SPACE and not self.game_over and not self.level_complete 
-                        and not self.paused and not self.show_level_text and not self.show_leaderboard 
-                        and not self.show_options):
-                        if ctrl_pressed:
-                            # Rapid fire cheat code
-                            for offset in range(-100, 101, 10):
-                                bullet_x = self.player.x + self.player.width // 2 - 2 + offset
-                                bullet_y = self.player.y
-                                self.player_bullets.append(Bullet(bullet_x, bullet_y, -12))
-                            if not self.mute_sounds:
-                                laser_sound.play()
-                        else:
-                            self.shoot_player_bullet()
-                    elif event.key == pygame.K_r and (self.game_over or self.won):
-                        self.restart_game()
-                    elif event.key == pygame.K_RETURN and self.level_complete and not self.won:
-                        self.next_level()
-                    elif event.key == pygame.K_ESCAPE:
-                        if self.show_options:
-                            self.show_options = False
-                        elif self.show_leaderboard:
-                            self.show_leaderboard = False
-                        elif self.paused:
-                            self.paused = False
-                        elif not (self.game_over or self.won or self.level_complete or self.show_level_text):
-                            self.paused = True
-                        elif self.game_over or self.won:
-                            self.__init__()
-                            self.title_screen = True
-                        elif self.game_over or self.won:
-                            self.__init__()
-                            self.title_screen = True
-                        elif (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE) and self.won:
-                            # Return to main menu when won
-                            self.__init__()
-                            self.title_screen = True
-            
-            # Handle mouse button down events
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left mouse button only
-                mouse_pos = pygame.mouse.get_pos()
-                
-                # Handle confirmation dialog first if active
-                if self.show_confirmation:
-                    if self.yes_button.rect.collidepoint(mouse_pos):
-                        self.leaderboard_manager.reset_scores()
-                        self.show_confirmation = False
-                        continue  # Skip other checks after confirmation
-                    elif self.no_button.rect.collidepoint(mouse_pos):
-                        self.show_confirmation = False
-                    continue  # Skip other checks after confirmation
-                
-                # Handle exit confirmation first if active
-                if self.show_exit_confirmation:
-                    if self.yes_button.rect.collidepoint(mouse_pos):
-                        game_bg.stop()
-                        self.exit_confirmed = True
-                        self.exit_time = pygame.time.get_ticks()
-                    elif self.no_button.rect.collidepoint(mouse_pos):
-                        self.show_exit_confirmation = False
-                    continue  # Skip other checks after confirmation
-
-                # Handle options menu buttons
-                if self.show_options:
-                    if self.mute_sounds_button.rect.collidepoint(mouse_pos):
-                        self.mute_sounds = not self.mute_sounds_button.toggle()
-                        if self.mute_sounds:
-                            laser_sound.set_volume(0)
-                            explosion_sound.set_volume(0)
-                            game_over_sound.set_volume(0)
-                        else:
-                            laser_sound.set_volume(0.7)
-                            explosion_sound.set_volume(0.8)
-                            game_over_sound.set_volume(0.7)
-                    elif self.mute_bgm_button.rect.collidepoint(mouse_pos):
-                        self.mute_bgm = not self.mute_bgm_button.toggle()
-                        if self.mute_bgm:
-                            game_bg.set_volume(0)
-                        else:
-                            game_bg.set_volume(0.3)
-                            if not game_bg_playing and not self.title_screen:
-                                game_bg.play(-1)
-                                game_bg_playing = True
-                    elif self.fullscreen_button.rect.collidepoint(mouse_pos):
-                        self.toggle_fullscreen()
-                        self.fullscreen_button.toggle()
-                    elif self.reset_scores_button.rect.collidepoint(mouse_pos):
-                        self.show_confirmation = True
-                    elif self.options_back_button.rect.collidepoint(mouse_pos):
-                        self.show_options = False
+    def update_shields(self):
+        """Stop the bullets that hit a shield, from either side, and let invaders plough through."""
+        area = self.shield_area
+        for bullets, direction in ((self.invader_bullets, 1), (self.player_bullets, -1)):
+            for bullet in bullets[:]:
+                swept = bullet.swept_rect()
+                if not area.colliderect(swept):
                     continue
+                for shield in self.shields:
+                    if shield.hit(swept, direction):
+                        bullets.remove(bullet)
+                        break
+
+        for invader in self.invaders:
+            if invader.rect.bottom >= area.top:
+                for shield in self.shields:
+                    shield.erase(invader.rect)
+
+    def start_game(self):
+        self.title_screen = False
+        self.level_start_time = 0
+        self.show_level_text = True
+        self.level_text_timer = 3000
 
-                # Handle pause menu buttons if game is paused
-                if self.paused and not (self.show_leaderboard or self.show_options):
-                    if self.resume_button.rect.collidepoint(mouse_pos):
-                        self.paused = False
-                    elif self.leaderboard_button.rect.collidepoint(mouse_pos):
-                        self.show_leaderboard = True
-                        self.show_options = False
-                    elif self.options_button.rect.collidepoint(mouse_pos):
-                        self.show_options = True
-                        self.show_leaderboard = False
-                    elif self.restart_button.rect.collidepoint(mouse_pos):
-                        self.restart_game(current_level_only=True)
-                        self.paused = False
-                    elif self.quit_button.rect.collidepoint(mouse_pos):
-                        mute_sounds = self.mute_sounds
-                        mute_bgm = self.mute_bgm
+    def handle_event(self, event):
+        ctrl_pressed = pygame.key.get_pressed()[pygame.K_RCTRL]
+
+        if event.type == pygame.QUIT:
+            self.stack.push(ExitDialog(self))
+
+        elif event.type == pygame.KEYDOWN:
+            if self.title_screen:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                    self.start_game()
+            else:
+                if (event.key == pygame.K_SPACE and not self.game_over and not self.level_complete
+                    and not self.show_level_text):
+                    if ctrl_pressed:
+                        # Rapid fire cheat code
+                        for offset in range(-100, 101, 10):
+                            bullet_x = self.player.x + self.player.width // 2 - 2 + offset
+                            bullet_y = self.player.y
+                            self.player_bullets.append(Bullet(bullet_x, bullet_y, -12))
+                        audio.play("laser")
+                    else:
+                        self.shoot_player_bullet()
+                elif event.key == pygame.K_r and (self.game_over or self.won):
+                    self.restart_game()
+                elif event.key == pygame.K_RETURN and self.level_complete and not self.won:
+                    self.next_level()
+                elif (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE) and self.won:
+                    # Roll the credits once the player has seen the victory screen
+                    return "credits"
+                elif event.key == pygame.K_ESCAPE:
+                    if not (self.game_over or self.won or self.level_complete or self.show_level_text):
+                        self.stack.push(PauseMenu(self))
+                    elif self.game_over or self.won:
                         self.__init__()
-                        self.mute_sounds = mute_sounds
-                        self.mute_bgm = mute_bgm
                         self.title_screen = True
-                        self.paused = False
-                        # Stop the BGM when returning to main menu
-                        game_bg.stop()
-                        game_bg_playing = False
-                    continue
-                
-                # Handle title screen buttons
-                if self.title_screen:
-                    if not (self.show_leaderboard or self.show_options):
-                        if self.start_button.rect.collidepoint(mouse_pos):
-                            self.title_screen = False
-                            self.show_level_text = True
-                            self.level_text_timer = 180
-                        elif self.title_leaderboard_button.rect.collidepoint(mouse_pos):
-                            self.show_leaderboard = True
-                            self.show_options = False
-                        elif self.title_options_button.rect.collidepoint(mouse_pos):
-                            self.show_options = True
-                            self.show_leaderboard = False
-                        elif self.title_quit_button.rect.collidepoint(mouse_pos):
-                            self.show_exit_confirmation = True
-                    elif self.show_leaderboard and self.back_button.rect.collidepoint(mouse_pos):
-                        self.show_leaderboard = False
-                    continue
-                
-                # Handle leaderboard back button
-                if self.show_leaderboard and self.back_button.rect.collidepoint(mouse_pos):
-                    self.show_leaderboard = False
-                    continue
-        
-        return True
-        
+
+        # Title screen buttons; in-game menus handle their own clicks
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.title_screen:
+            mouse_pos = pygame.mouse.get_pos()
+            if self.start_button.rect.collidepoint(mouse_pos):
+                self.start_game()
+            elif self.title_leaderboard_button.rect.collidepoint(mouse_pos):
+                self.stack.push(LeaderboardView(self))
+            elif self.title_options_button.rect.collidepoint(mouse_pos):
+                self.stack.push(OptionsMenu(self))
+            elif self.title_quit_button.rect.collidepoint(mouse_pos):
+                self.stack.push(ExitDialog(self))
+
+        return None
+
     def shoot_player_bullet(self):
         bullets_per_shot = self.level_configs[self.level]['bullets_per_shot']
         
@@ -1057,19 +853,26 @@ class Game:
                     
                 self.player_bullets.append(Bullet(bullet_x, self.player.y, speed_y))
         
-        if not self.mute_sounds:
-            laser_sound.play()
+        audio.play("laser")
 
     def shoot_invader_bullet(self):
-        if self.invaders and random.random() < self.invader_shoot_chance and not self.show_level_text:
-            invader = random.choice(self.invaders)
-            bullet_x = invader.x + invader.width // 2 - 2
-            bullet_y = invader.y + invader.height
+        # Only the bottom invader of each column fires, so shots never pass through the formation
+        if self.shooters and random.random() < self.invader_shoot_chance and not self.show_level_text:
+            config = self.level_configs[self.level]
+            if random.random() < config['aimed_chance']:
+                # Fire from the column over the player
+                shooters = [self.shooters.nearest(self.player.x + self.player.width / 2)]
+            else:
+                # A volley from several columns at once on the later levels
+                shooters = self.shooters.volley(config['volley'])
             
             bullet_speed = 6 + self.level
-            bullet_color = RED if invader.type <= 2 else PURPLE if invader.type <= 4 else ORANGE
-            
-            self.invader_bullets.append(Bullet(bullet_x, bullet_y, bullet_speed, bullet_color))
+            for invader in shooters:
+                bullet_x = invader.x + invader.width // 2 - 2
+                bullet_y = invader.y + invader.height
+                bullet_color = RED if invader.type <= 2 else PURPLE if invader.type <= 4 else ORANGE
+                
+                self.invader_bullets.append(Bullet(bullet_x, bullet_y, bullet_speed, bullet_color))
             
     def next_level(self):
         if self.level < self.max_level:
@@ -1079,29 +882,27 @@ class Game:
             self.invader_bullets = []
             self.create_invaders()
             self.show_level_text = True
-            self.level_text_timer = 180
+            self.level_text_timer = 3000
             self.score += 100 * self.level
         else:
             self.won = True
             self.game_over = True
             
     def update(self):
-        global game_bg_playing
-        if self.title_screen or self.game_over or self.level_complete or self.paused or self.show_leaderboard or self.show_options:
+        if self.title_screen or self.game_over or self.level_complete:
             if self.game_over and not self.score_submitted:
                 if self.leaderboard_manager.is_high_score(self.score):
                     self.leaderboard_manager.add_score(self.score, self.level)
                 self.score_submitted = True
                 # Stop BGM when game is over
-                game_bg.stop()
-                game_bg_playing = False
+                audio.stop("bgm")
             return
             
         alt_pressed = pygame.key.get_pressed()[pygame.K_RALT]
 
         # Handle death animation
         if self.player.is_dying:
-            self.player.death_animation_timer -= 1
+            self.player.update_death()
             if self.player.death_animation_timer <= 0:
                 self.death_timer = self.death_delay
                 self.player.is_dying = False
@@ -1110,7 +911,7 @@ class Game:
                     angle = random.uniform(0, 2 * math.pi)
                     speed = random.uniform(1, 8)
                     size = random.randint(1, 4)
-                    lifetime = random.randint(20, 40)
+                    lifetime = random.randint(20, 40) * STEP_MS
                     self.player.death_particles.append({
                         'x': self.player.x + self.player.width//2,
                         'y': self.player.y + self.player.height//2,
@@ -1125,27 +926,20 @@ class Game:
         # Handle death delay
         if self.death_timer > 0:
             # Update particles during death delay
-            for particle in self.player.death_particles[:]:
-                particle['x'] += particle['dx']
-                particle['y'] += particle['dy']
-                particle['lifetime'] -= 1
-                if particle['lifetime'] <= 0:
-                    self.player.death_particles.remove(particle)
+            self.player.update_particles()
             
-            self.death_timer -= 1
+            self.death_timer -= STEP_MS
             if self.death_timer <= 0:
                 self.game_over = True
-                if not self.mute_sounds:
-                    game_over_sound.play()
+                audio.play("game_over")
             return
             
         if self.show_level_text:
-            self.level_text_timer -= 1
+            self.level_text_timer -= STEP_MS
             if self.level_text_timer <= 0:
                 self.show_level_text = False
-                if not self.mute_bgm and not game_bg_playing and not self.title_screen:
-                    game_bg.play(-1)
-                    game_bg_playing = True
+                if not self.mute_bgm and not audio.is_playing("bgm") and not self.title_screen:
+                    audio.play("bgm", loops=-1)
             
         self.player.update(can_move=not self.show_level_text)
         
@@ -1174,14 +968,16 @@ class Game:
         if not alt_pressed:
             self.shoot_invader_bullet()
         
+        self.update_shields()
+        
         for bullet in self.player_bullets[:]:
             for invader in self.invaders[:]:
                 if bullet.rect.colliderect(invader.rect):
                     self.player_bullets.remove(bullet)
                     if invader.hit():
-                        if not self.mute_sounds:
-                            explosion_sound.play()
+                        audio.play("explosion")
                         self.invaders.remove(invader)
+                        self.shooters.remove(invader)
                         self.score += invader.points
                     break
                     
@@ -1197,8 +993,7 @@ class Game:
 
                 if self.lives <= 0:
                     self.game_over = True
-                    if not self.mute_sounds:
-                        game_over_sound.play()
+                    audio.play("game_over")
                     
         if not self.invaders and not self.level_complete and not self.show_level_text:
             if self.level >= self.max_level:
@@ -1214,7 +1009,6 @@ class Game:
                 break
                 
     def restart_game(self, current_level_only=False):
-        global game_bg_playing
         if current_level_only:
             self.player_bullets = []
             self.invader_bullets = []
@@ -1224,24 +1018,22 @@ class Game:
             self.game_over = False
             self.level_complete = False
             self.show_level_text = True
-            self.level_text_timer = 180
+            self.level_text_timer = 3000
             # Stop BGM during restart
-            game_bg.stop()
-            game_bg_playing = False
+            audio.stop("bgm")
             
         else:
             self.__init__()
             self.title_screen = False
             self.show_level_text = True
-            self.level_text_timer = 180
+            self.level_text_timer = 3000
             # Stop BGM during full restart
-            game_bg.stop()
-            game_bg_playing = False
+            audio.stop("bgm")
             
     def draw_title_screen(self):
         screen.fill(BLACK)
         
-        title_font = pygame.font.Font(None, 120)
+        title_font = get_font(120)
         shadow_offset = 5
         shadow_color = (50, 50, 100)
         
@@ -1253,15 +1045,15 @@ class Game:
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
         screen.blit(title_text, title_rect)
         
-        subtitle_font = pygame.font.Font(None, 36)
+        subtitle_font = get_font(36)
         subtitle_text = subtitle_font.render("Defeat Them All !", True, WHITE)
         screen.blit(subtitle_text, subtitle_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 80)))
 
-        subtitle_font = pygame.font.Font(None, 28)
+        subtitle_font = get_font(28)
         subtitle_text = subtitle_font.render("Press ENTER/SPACE to start", True, YELLOW)
         screen.blit(subtitle_text, subtitle_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 120)))
         
-        instr_font = pygame.font.Font(None, 24)
+        instr_font = get_font(24)
         instructions = [
             "Controls:",
             "Arrow Keys or A/D: Move",
@@ -1279,227 +1071,15 @@ class Game:
         self.title_options_button.check_hover(mouse_pos)
         self.title_quit_button.check_hover(mouse_pos)
         
-        if not (self.show_leaderboard or self.show_options):
-            self.start_button.draw(screen)
-            self.title_leaderboard_button.draw(screen)
-            self.title_options_button.draw(screen)
-            self.title_quit_button.draw(screen)
-    
-        if self.show_leaderboard:
-            self.draw_leaderboard()
-    
-        if self.show_options:
-            self.draw_options_menu()
-    
-    def draw_pause_menu(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
-        
-        big_font = pygame.font.Font(None, 72)
-        title = big_font.render("GAME PAUSED", True, WHITE)
-        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.resume_button.check_hover(mouse_pos)
-        self.leaderboard_button.check_hover(mouse_pos)
-        self.options_button.check_hover(mouse_pos)
-        self.restart_button.check_hover(mouse_pos)
-        self.quit_button.check_hover(mouse_pos)
-        
-        self.resume_button.draw(screen)
-        self.leaderboard_button.draw(screen)
-        self.options_button.draw(screen)
-        self.restart_button.draw(screen)
-        self.quit_button.draw(screen)
-    
-    def draw_options_menu(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
-        
-        big_font = pygame.font.Font(None, 72)
-        title = big_font.render("OPTIONS", True, WHITE)
-        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.mute_sounds_button.check_hover(mouse_pos)
-        self.mute_bgm_button.check_hover(mouse_pos)
-        self.fullscreen_button.check_hover(mouse_pos)
-        self.reset_scores_button.check_hover(mouse_pos)
-        self.options_back_button.check_hover(mouse_pos)
-        
-        self.mute_sounds_button.draw(screen)
-        self.mute_bgm_button.draw(screen)
-        self.fullscreen_button.draw(screen)
-        self.reset_scores_button.draw(screen)
-        self.options_back_button.draw(screen)
-
-        if self.show_confirmation:
-            self.draw_confirmation_dialog()
-    
-    def draw_leaderboard(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        screen.blit(overlay, (0, 0))
-        
-        big_font = pygame.font.Font(None, 72)
-        title = big_font.render("LEADERBOARD", True, CYAN)
-        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 100)))
+        self.start_button.draw(screen)
+        self.title_leaderboard_button.draw(screen)
+        self.title_options_button.draw(screen)
+        self.title_quit_button.draw(screen)
 
-        # Check if this is a new high score and show message if it is
-        if self.game_over and self.is_new_high_score():
-            high_score_font = pygame.font.Font(None, 48)
-            high_score_text = high_score_font.render("NEW HIGH SCORE!", True, YELLOW)
-            screen.blit(high_score_text, high_score_text.get_rect(center=(SCREEN_WIDTH//2, 160)))
-            
-        header_font = pygame.font.Font(None, 48)
-        rank_header = header_font.render("RANK", True, YELLOW)
-        score_header = header_font.render("SCORE", True, YELLOW)
-        level_header = header_font.render("LEVEL", True, YELLOW)
-        date_header = header_font.render("DATE", True, YELLOW)
-        
-        header_y = 180
-        screen.blit(rank_header, (200, header_y))
-        screen.blit(score_header, (350, header_y))
-        screen.blit(level_header, (550, header_y))
-        screen.blit(date_header, (700, header_y))
-        
-        pygame.draw.line(screen, WHITE, (150, header_y + 50), (SCREEN_WIDTH - 150, header_y + 50), 2)
-        
-        score_font = pygame.font.Font(None, 36)
-        scores = self.leaderboard_manager.get_top_scores()
-        
-        if not scores:
-            no_scores_text = score_font.render("No scores yet! Be the first to play!", True, WHITE)
-            screen.blit(no_scores_text, no_scores_text.get_rect(center=(SCREEN_WIDTH//2, 300)))
-        else:
-            for i, entry in enumerate(scores):
-                y_pos = 250 + i * 40
-                if self.game_over and self.is_new_high_score():
-                    y_pos += 30  # Adjust position if we showed the high score message
-                
-                color = GREEN if (self.game_over and entry['score'] == self.score and 
-                                entry['level'] == self.level) else WHITE
-                
-                rank_text = score_font.render(f"{i + 1}.", True, color)
-                score_text = score_font.render(f"{entry['score']:,}", True, color)
-                level_text = score_font.render(f"{entry['level']}", True, color)
-                date_text = score_font.render(entry['date'][:10], True, color)
-                
-                screen.blit(rank_text, (200, y_pos))
-                screen.blit(score_text, (350, y_pos))
-                screen.blit(level_text, (550, y_pos))
-                screen.blit(date_text, (700, y_pos))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.back_button.check_hover(mouse_pos)
-        self.back_button.draw(screen)
-        
-    def draw_confirmation_dialog(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        screen.blit(overlay, (0, 0))
-        
-        # Calculate required width based on text
-        confirm_font = pygame.font.Font(None, 48)
-        confirm_text = confirm_font.render("Are you sure you want to reset all scores?", True, WHITE)
-        text_width = confirm_text.get_width()
-        
-        # Set dialog dimensions with padding
-        dialog_width = max(500, text_width + 100)  # Minimum 500, or text width + padding
-        dialog_height = 250
-        dialog_rect = pygame.Rect(SCREEN_WIDTH//2 - dialog_width//2, 
-                                SCREEN_HEIGHT//2 - dialog_height//2, 
-                                dialog_width, dialog_height)
-        
-        # Draw dialog box
-        pygame.draw.rect(screen, DARK_GRAY, dialog_rect, border_radius=10)
-        pygame.draw.rect(screen, WHITE, dialog_rect, 2, border_radius=10)
-        
-        # Render and position text (split into two lines if needed)
-        if text_width > SCREEN_WIDTH - 200:  # If text is too wide for screen
-            # Split into two lines
-            parts = "Are you sure you want to reset all scores?".split('reset')
-            line1 = confirm_font.render(parts[0] + "reset", True, WHITE)
-            line2 = confirm_font.render(parts[1] + "?", True, WHITE)
-            
-            screen.blit(line1, line1.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50)))
-            screen.blit(line2, line2.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 10)))
-        else:
-            # Single line
-            screen.blit(confirm_text, confirm_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30)))
-        
-        # Position buttons with new dialog width
-        button_spacing = 20
-        total_button_width = 120 * 2 + button_spacing
-        button_start_x = SCREEN_WIDTH//2 - total_button_width//2
-        
-        self.yes_button.rect = pygame.Rect(button_start_x, SCREEN_HEIGHT//2 + 60, 120, 50)
-        self.no_button.rect = pygame.Rect(button_start_x + 120 + button_spacing, SCREEN_HEIGHT//2 + 60, 120, 50)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.yes_button.check_hover(mouse_pos)
-        self.no_button.check_hover(mouse_pos)
-        
-        self.yes_button.draw(screen)
-        self.no_button.draw(screen)
-    
-    def draw_exit_confirmation(self):
-        # Check if confirmation was already given
-        if hasattr(self, 'exit_confirmed') and self.exit_confirmed:
-            # Initialize starfield if not already done
-            if not hasattr(self, 'exit_stars'):
-                self.exit_stars = []
-                for _ in range(100):  # Number of stars
-                    self.exit_stars.append([
-                        random.randint(0, SCREEN_WIDTH),  # x
-                        random.randint(0, SCREEN_HEIGHT), # y
-                        random.uniform(0.5, 3),          # speed
-                        random.randint(1, 3)             # size
-                    ])
-            
-            # Show thank you messages and exit after delay
-            current_time = pygame.time.get_ticks()
-            if current_time - self.exit_time >= 1000:  
-                return "exit"
-            
-            # Solid black background
-            screen.fill(BLACK)
-            
-            # Update and draw stars
-            for star in self.exit_stars:
-                star[1] += star[2]  # Move star downward
-                if star[1] > SCREEN_HEIGHT:  # Reset star at top if it goes off screen
-                    star[1] = 0
-                    star[0] = random.randint(0, SCREEN_WIDTH)
-                pygame.draw.circle(screen, WHITE, (int(star[0]), int(star[1])), int(star[3]))
-                        
-            return
-        
-        # Create a new overlay surface that will cover everything
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 250))
-        screen.blit(overlay, (0, 0))
-        
-        # Draw confirmation dialog
-        confirm_font = pygame.font.Font(None, 48)
-        confirm_text = confirm_font.render("Are you sure you want to exit?", True, WHITE)
-        
-        screen.blit(confirm_text, confirm_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40)))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.yes_button.check_hover(mouse_pos)
-        self.no_button.check_hover(mouse_pos)
-        
-        self.yes_button.draw(screen)
-        self.no_button.draw(screen)
-        
     def draw(self, screen):
-        exit_signal = None  
         screen.fill(BLACK)
-        font = pygame.font.Font(None, 36)
-        big_font = pygame.font.Font(None, 72)
+        font = get_font(36)
+        big_font = get_font(72)
 
         # Draw particles first (so they appear behind other elements)
         if self.player.is_dying or (self.death_timer > 0 and self.player.death_particles):
@@ -1512,13 +1092,15 @@ class Game:
                 )
         
         # Draw game elements first (only if no overlays are active)
-        if not (self.show_level_text or self.level_complete or self.game_over or self.paused or 
-                self.show_leaderboard or self.show_options or self.show_exit_confirmation or self.title_screen):
+        if not (self.show_level_text or self.level_complete or self.game_over or self.title_screen):
             
             # Draw player unless in death animation (it draws itself during death)
             if not self.player.is_dying:
                 self.player.draw(screen)
                 
+            for shield in self.shields:
+                shield.draw(screen)
+                
             for bullet in self.player_bullets:
                 bullet.draw(screen)
                 
@@ -1541,7 +1123,7 @@ class Game:
                 hit_text = font.render("HIT!", True, RED)
                 screen.blit(hit_text, (self.player.x + self.player.width//2 - 20, self.player.y - 30))
             
-            control_font = pygame.font.Font(None, 24)
+            control_font = get_font(24)
             controls = [
                 "Arrow Keys / AD: Move",
                 "SPACE: Shoot",
@@ -1553,20 +1135,14 @@ class Game:
         
         # Draw overlay screens
         if self.show_level_text:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            dim(screen, 180)
             
             level_name = self.level_configs[self.level]['name']
             level_intro_text = big_font.render(level_name, True, CYAN)
             screen.blit(level_intro_text, level_intro_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)))
             
         elif self.level_complete and not self.won:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            dim(screen, 128)
             
             complete_text = big_font.render('LEVEL COMPLETE!', True, GREEN)
             bonus_text = font.render(f'Bonus: {100 * self.level} points', True, YELLOW)
@@ -1577,10 +1153,7 @@ class Game:
             screen.blit(continue_text, continue_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60)))
             
         elif self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            dim(screen, 128)
             
             if self.won:
                 game_over_text = big_font.render('YOU WON', True, RED)
@@ -1610,24 +1183,239 @@ class Game:
                 screen.blit(restart_text, restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 100)))
                 screen.blit(quit_text, quit_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 150)))
         
-        # Draw UI elements that should always be on top
-        if self.paused and not self.show_leaderboard and not self.show_options:
-            self.draw_pause_menu()
-        
-        if self.show_leaderboard:
-            self.draw_leaderboard()
-        
-        if self.show_options:
-            self.draw_options_menu()    
-        
         if self.title_screen:
             self.draw_title_screen()
-        
-        # Draw exit confirmation last (on top of everything)
-        if self.show_exit_confirmation:
-            exit_signal = self.draw_exit_confirmation()
-        
-        return exit_signal
+
+class Overlay(Scene):
+    """A menu or dialog drawn over a dimmed, frozen snapshot of the screen beneath it."""
+    opaque = False
+    dim = 200
+
+    def __init__(self, game):
+        self.game = game
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.stack.push(ExitDialog(self.game))
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.stack.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left mouse button only
+            return self.click(pygame.mouse.get_pos())
+        return None
+
+    def click(self, mouse_pos):
+        return None
+
+    def draw_buttons(self, surface, buttons):
+        mouse_pos = pygame.mouse.get_pos()
+        for button in buttons:
+            button.check_hover(mouse_pos)
+        for button in buttons:
+            button.draw(surface)
+
+
+class PauseMenu(Overlay):
+    def buttons(self):
+        game = self.game
+        return [game.resume_button, game.leaderboard_button, game.options_button,
+                game.restart_button, game.quit_button]
+
+    def click(self, mouse_pos):
+        game = self.game
+        if game.resume_button.rect.collidepoint(mouse_pos):
+            self.stack.pop()
+        elif game.leaderboard_button.rect.collidepoint(mouse_pos):
+            self.stack.push(LeaderboardView(game))
+        elif game.options_button.rect.collidepoint(mouse_pos):
+            self.stack.push(OptionsMenu(game))
+        elif game.restart_button.rect.collidepoint(mouse_pos):
+            game.restart_game(current_level_only=True)
+            self.stack.pop()
+        elif game.quit_button.rect.collidepoint(mouse_pos):
+            game.__init__()
+            game.title_screen = True
+            # Stop the BGM when returning to main menu
+            audio.stop("bgm")
+            self.stack.pop()
+
+    def draw(self, surface):
+        big_font = get_font(72)
+        title = big_font.render("GAME PAUSED", True, WHITE)
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
+
+        self.draw_buttons(surface, self.buttons())
+
+
+class OptionsMenu(Overlay):
+    def click(self, mouse_pos):
+        game = self.game
+        if game.mute_sounds_button.rect.collidepoint(mouse_pos):
+            game.mute_sounds = not game.mute_sounds_button.toggle()
+            audio.set_category_muted("sfx", game.mute_sounds)
+        elif game.mute_bgm_button.rect.collidepoint(mouse_pos):
+            game.mute_bgm = not game.mute_bgm_button.toggle()
+            audio.set_category_muted("music", game.mute_bgm)
+            if not game.mute_bgm and not audio.is_playing("bgm") and not game.title_screen:
+                audio.play("bgm", loops=-1)
+        elif game.fullscreen_button.rect.collidepoint(mouse_pos):
+            if game.toggle_fullscreen():
+                game.fullscreen_button.toggle()
+        elif game.smooth_scaling_button.rect.collidepoint(mouse_pos):
+            if game.toggle_scaling():
+                game.smooth_scaling_button.toggle()
+        elif game.reset_scores_button.rect.collidepoint(mouse_pos):
+            self.stack.push(ResetScoresDialog(game))
+        elif game.options_back_button.rect.collidepoint(mouse_pos):
+            self.stack.pop()
+
+    def draw(self, surface):
+        game = self.game
+        big_font = get_font(72)
+        title = big_font.render("OPTIONS", True, WHITE)
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200)))
+
+        self.draw_buttons(surface, [game.smooth_scaling_button, game.mute_sounds_button, game.mute_bgm_button,
+                                    game.fullscreen_button, game.reset_scores_button, game.options_back_button])
+
+
+class LeaderboardView(Overlay):
+    dim = 220
+
+    def click(self, mouse_pos):
+        if self.game.back_button.rect.collidepoint(mouse_pos):
+            self.stack.pop()
+
+    def draw(self, surface):
+        game = self.game
+        big_font = get_font(72)
+        title = big_font.render("LEADERBOARD", True, CYAN)
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 100)))
+
+        # Check if this is a new high score and show message if it is
+        new_high_score = game.game_over and is_new_high_score(game)
+        if new_high_score:
+            high_score_font = get_font(48)
+            high_score_text = high_score_font.render("NEW HIGH SCORE!", True, YELLOW)
+            surface.blit(high_score_text, high_score_text.get_rect(center=(SCREEN_WIDTH//2, 160)))
+
+        header_font = get_font(48)
+        rank_header = header_font.render("RANK", True, YELLOW)
+        score_header = header_font.render("SCORE", True, YELLOW)
+        level_header = header_font.render("LEVEL", True, YELLOW)
+        date_header = header_font.render("DATE", True, YELLOW)
+
+        header_y = 180
+        surface.blit(rank_header, (200, header_y))
+        surface.blit(score_header, (350, header_y))
+        surface.blit(level_header, (550, header_y))
+        surface.blit(date_header, (700, header_y))
+
+        pygame.draw.line(surface, WHITE, (150, header_y + 50), (SCREEN_WIDTH - 150, header_y + 50), 2)
+
+        score_font = get_font(36)
+        scores = game.leaderboard_manager.get_top_scores()
+
+        if not scores:
+            no_scores_text = score_font.render("No scores yet! Be the first to play!", True, WHITE)
+            surface.blit(no_scores_text, no_scores_text.get_rect(center=(SCREEN_WIDTH//2, 300)))
+        else:
+            for i, entry in enumerate(scores):
+                y_pos = 250 + i * 40
+                if new_high_score:
+                    y_pos += 30  # Adjust position if we showed the high score message
+
+                color = GREEN if (game.game_over and entry['score'] == game.score and
+                                entry['level'] == game.level) else WHITE
+
+                rank_text = score_font.render(f"{i + 1}.", True, color)
+                score_text = score_font.render(f"{entry['score']:,}", True, color)
+                level_text = score_font.render(f"{entry['level']}", True, color)
+                date_text = score_font.render(entry['date'][:10], True, color)
+
+                surface.blit(rank_text, (200, y_pos))
+                surface.blit(score_text, (350, y_pos))
+                surface.blit(level_text, (550, y_pos))
+                surface.blit(date_text, (700, y_pos))
+
+        self.draw_buttons(surface, [game.back_button])
+
+
+class ResetScoresDialog(Overlay):
+    dim = 220
+
+    def click(self, mouse_pos):
+        if self.game.yes_button.rect.collidepoint(mouse_pos):
+            self.game.leaderboard_manager.reset_scores()
+            self.stack.pop()
+        elif self.game.no_button.rect.collidepoint(mouse_pos):
+            self.stack.pop()
+
+    def draw(self, surface):
+        game = self.game
+        # Calculate required width based on text
+        confirm_font = get_font(48)
+        confirm_text = confirm_font.render("Are you sure you want to reset all scores?", True, WHITE)
+        text_width = confirm_text.get_width()
+
+        # Set dialog dimensions with padding
+        dialog_width = max(500, text_width + 100)  # Minimum 500, or text width + padding
+        dialog_height = 250
+        dialog_rect = pygame.Rect(SCREEN_WIDTH//2 - dialog_width//2,
+                                SCREEN_HEIGHT//2 - dialog_height//2,
+                                dialog_width, dialog_height)
+
+        # Draw dialog box
+        pygame.draw.rect(surface, DARK_GRAY, dialog_rect, border_radius=10)
+        pygame.draw.rect(surface, WHITE, dialog_rect, 2, border_radius=10)
+
+        # Render and position text (split into two lines if needed)
+        if text_width > SCREEN_WIDTH - 200:  # If text is too wide for screen
+            # Split into two lines
+            parts = "Are you sure you want to reset all scores?".split('reset')
+            line1 = confirm_font.render(parts[0] + "reset", True, WHITE)
+            line2 = confirm_font.render(parts[1] + "?", True, WHITE)
+
+            surface.blit(line1, line1.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50)))
+            surface.blit(line2, line2.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 10)))
+        else:
+            # Single line
+            surface.blit(confirm_text, confirm_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30)))
+
+        # Position buttons with new dialog width
+        button_spacing = 20
+        total_button_width = 120 * 2 + button_spacing
+        button_start_x = SCREEN_WIDTH//2 - total_button_width//2
+
+        game.yes_button.rect = pygame.Rect(button_start_x, SCREEN_HEIGHT//2 + 60, 120, 50)
+        game.no_button.rect = pygame.Rect(button_start_x + 120 + button_spacing, SCREEN_HEIGHT//2 + 60, 120, 50)
+
+        self.draw_buttons(surface, [game.yes_button, game.no_button])
+
+
+class ExitDialog(Overlay):
+    dim = 250
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return None  # Already asking
+        return super().handle_event(event)
+
+    def click(self, mouse_pos):
+        if self.game.yes_button.rect.collidepoint(mouse_pos):
+            audio.stop("bgm")
+            return "exit"
+        if self.game.no_button.rect.collidepoint(mouse_pos):
+            self.stack.pop()
+        return None
+
+    def draw(self, surface):
+        # Draw confirmation dialog
+        confirm_font = get_font(48)
+        confirm_text = confirm_font.render("Are you sure you want to exit?", True, WHITE)
+        surface.blit(confirm_text, confirm_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40)))
+
+        self.draw_buttons(surface, [self.game.yes_button, self.game.no_button])
+
 
 def star_wars_intro(screen, duration_seconds=11):
     # Star Wars intro crawl
@@ -1648,16 +1436,14 @@ def star_wars_intro(screen, duration_seconds=11):
     ]
     
     # Set up the crawl
-    pygame.mixer.music.load(resource_path("space_invader_title.wav"))  # You'll need this file
-    pygame.mixer.music.set_volume(0.5)
-    pygame.mixer.music.play()
+    audio.play("title")
     
     # Create a surface for the text with per-pixel alpha
     text_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT * 3), pygame.SRCALPHA)
     
     # Render the text
-    font_large = pygame.font.Font(None, 80)
-    font_small = pygame.font.Font(None, 48)
+    font_large = get_font(80)
+    font_small = get_font(48)
     y_pos = SCREEN_HEIGHT  # Start below the visible screen
     
     for i, line in enumerate(intro_text):
@@ -1683,8 +1469,8 @@ def star_wars_intro(screen, duration_seconds=11):
         speed = random.uniform(0.5, 2.0)
         stars.append((x, y, size, speed))
     
-    # Main crawl loop
-    clock = pygame.time.Clock()
+    # Main crawl loop; stars and text move per fixed step, whatever the frame rate
+    pacer = FramePacer(FPS, vsync=display.vsync_active)
     crawl_pos = 0
     running = True
     start_time = pygame.time.get_ticks()  # Get the start time in milliseconds
@@ -1696,7 +1482,7 @@ def star_wars_intro(screen, duration_seconds=11):
         # Exit if duration is reached
         if elapsed_seconds >= duration_seconds:
             running = False
-            pygame.mixer.music.stop()
+            audio.stop("title")
             return
         
         for event in pygame.event.get():
@@ -1707,25 +1493,29 @@ def star_wars_intro(screen, duration_seconds=11):
                 # Check for specific keys to skip
                 if (event.key == pygame.K_RETURN):  
                     running = False
-                    pygame.mixer.music.stop()
+                    audio.stop("title")
                     return
         
-        # Update star positions
-        new_stars = []
-        for x, y, size, speed in stars:
-            y -= speed
-            if y > -10:  # Keep stars slightly above top to smooth disappearance
-                new_stars.append((x, y, size, speed))
-        stars = new_stars
-        
-        # Add new stars at the bottom only if text is still visible
-        if crawl_pos < SCREEN_HEIGHT * 2 + y_pos:
-            while len(stars) < 200:
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(SCREEN_HEIGHT, SCREEN_HEIGHT + 10)
-                size = random.randint(1, 3)
-                speed = random.uniform(0.5, 2.0)
-                stars.append((x, y, size, speed))
+        for _ in range(pacer.steps()):
+            # Update star positions
+            new_stars = []
+            for x, y, size, speed in stars:
+                y -= speed
+                if y > -10:  # Keep stars slightly above top to smooth disappearance
+                    new_stars.append((x, y, size, speed))
+            stars = new_stars
+            
+            # Add new stars at the bottom only if text is still visible
+            if crawl_pos < SCREEN_HEIGHT * 2 + y_pos:
+                while len(stars) < 200:
+                    x = random.randint(0, SCREEN_WIDTH)
+                    y = random.randint(SCREEN_HEIGHT, SCREEN_HEIGHT + 10)
+                    size = random.randint(1, 3)
+                    speed = random.uniform(0.5, 2.0)
+                    stars.append((x, y, size, speed))
+            
+            # Update crawl position
+            crawl_pos += 2
         
         # Draw everything
         screen.fill(BLACK)
@@ -1738,36 +1528,21 @@ def star_wars_intro(screen, duration_seconds=11):
         screen.blit(text_surface, (0, -crawl_pos))
         
         pygame.display.flip()
-        clock.tick(60)
+        pacer.wait()
         
-        # Update crawl position
-        crawl_pos += 2
         if crawl_pos > SCREEN_HEIGHT * 2 + y_pos:
             running = False
-            pygame.mixer.music.stop()
+            audio.stop("title")
 
 def show_exit_credits():
     """Display exit credits sequence with scrolling credits and dedicated outro music"""
     # Stop any currently playing sounds
     pygame.mixer.stop()
     
-    # Load outro music (replace with your actual file path)
-    outro_music_path = resource_path("outro_music.wav")  # or .ogg
-    try:
-        outro_music = pygame.mixer.Sound(outro_music_path)
-        outro_music.set_volume(0.7)  # Adjust volume as needed
-        outro_music.play(loops=-1)  # Loop indefinitely
-    except:
-        outro_music = None
-    
-    # Initialize parameters
-    rolling_text_y = SCREEN_HEIGHT  # Start below screen
-    rolling_text_speed = 2  # Pixels per frame
-    total_duration = 14000  # 14 seconds total (can adjust as needed)
-    start_time = pygame.time.get_ticks()
+    # Stream the outro music in place of whatever was playing
+    audio.play("outro", loops=-1)  # Loop indefinitely
     
     # Define credits content
-    credit_font = pygame.font.Font(None, 32)
     credits = [
         "SPACE INVADERS",
         "",
@@ -1800,112 +1575,37 @@ def show_exit_credits():
         pygame.K_RETURN, pygame.K_ESCAPE
     }
         
-    # Main loop
-    running = True
-    while running:
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - start_time
-        
-        # Check if total duration has been reached
-        if elapsed >= total_duration:
-            if outro_music:
-                outro_music.stop()
-            return "quit"
-        
-        # Handle events (allow skipping only for specific keys)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                if outro_music:
-                    outro_music.stop()
-                return "quit"
-            elif event.type == pygame.KEYDOWN:
-                # Skip only if it's one of our allowed keys
-                if event.key in skip_keys:
-                    if outro_music:
-                        outro_music.stop()
-                    return "quit"
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Also allow skipping with mouse clicks
-                if outro_music:
-                    outro_music.stop()
-                return "quit"
-        
-        # Update credits scrolling
-        rolling_text_y -= rolling_text_speed
-        if rolling_text_y < -2000:  # End when credits scroll past
-            if outro_music:
-                outro_music.stop()
-            return "quit"
-        
-        # Draw everything
-        screen.fill(BLACK)
-        
-        # Draw scrolling credits
-        y_pos = rolling_text_y
-        for credit in credits:
-            if credit:
-                text = credit_font.render(credit, True, WHITE)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-                screen.blit(text, text_rect)
-            y_pos += 40
-        
-        pygame.display.flip()
-        clock.tick(FPS)
-    
-    # Clean up music if we exit early
-    if outro_music:
-        outro_music.stop()
+    run_credits(screen, credits, skip_keys, fps=FPS)
+    audio.stop("outro")
     return 'quit'
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-    pygame.display.set_caption('Space Invaders')
+    screen = create_app(fullscreen=True)
     
     # Show logos first
-    logo_screen = LogoScreen()
-    logo_done = False
-    while not logo_done:
-        result = logo_screen.update()
-        if result == "quit":
-            pygame.quit()
-            sys.exit()
-        elif result is True:  # Logos finished or skipped
-            logo_done = True
-        
-        logo_screen.draw(screen)
-        pygame.display.flip()
-        clock.tick(FPS)
+    logo_screen = LogoScreen(
+        [
+            resource_path("DD Lab1.png"),
+            (resource_path("logo1.png"), resource_path("logo2.jpg")),
+            resource_path("space_invaders.jpg")
+        ],
+        skip_keys={pygame.K_RETURN, pygame.K_ESCAPE}
+    )
+    if run_scene(logo_screen, screen, FPS) == "quit":
+        pygame.quit()
+        sys.exit()
     
     # Show Star Wars intro after logos
     star_wars_intro(screen)
     
-    game = Game()
-    running = True
-    
-    while running:
-        running = game.handle_events()
-        game.update()
-        
-        # Check for exit signal from draw method
-        exit_signal = game.draw(screen)
-        if exit_signal == "exit":
-            running = False
+    # Menus and dialogs are pushed on top of the game and run on their own
+    scenes = SceneStack(Game())
+    result = run_scene(scenes, screen, FPS, on_frame=audio.begin_frame)
+
+    # Confirmed exit, or the player has seen the victory screen
+    if result in ("exit", "credits"):
+        show_exit_credits()
 
-        pygame.display.flip()
-        clock.tick(FPS)
-        
-        # Check if we should show exit credits (only after game is won and player has seen the message)
-        if hasattr(game, 'exit_confirmed') and game.exit_confirmed:
-            show_exit_credits()
-            running = False
-        elif game.won and game.game_over:
-            # Check for key press to trigger credits
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_RETURN] or keys[pygame.K_SPACE]:
-                show_exit_credits()
-                running = False
-    
     pygame.quit()
     sys.exit()
 
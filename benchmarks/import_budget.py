@@ -0,0 +1,110 @@
+"""Check that importing a game module is cheap and has no side effects.
+
+Each game is imported in a fresh interpreter, after pygame itself, whose own
+import cost is not ours to budget but serves as the yardstick: the game's
+import may take at most --budget times as long as the bare `import pygame`
+timed in the same interpreter, so the check holds on fast and slow hosts
+alike. One cold run fills a throwaway bytecode cache (players only compile
+once either) and the best of --runs warm runs is compared, since a single
+wall-clock sample swings by tens of milliseconds. The import must not
+initialize the display or the mixer either.
+
+    python benchmarks/import_budget.py [--runs 5] [--budget 0.1]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GAMES = {
+    "brick_breaker": os.path.join(ROOT, "Brick-Breaker", "brick_breaker.py"),
+    "snake_rush": os.path.join(ROOT, "Snake-Rush", "snake_rush.py"),
+    "space_invaders": os.path.join(ROOT, "Space-Invaders", "space_invaders.py"),
+}
+
+PROBE = """
+import importlib.util, json, sys, time
+start = time.perf_counter()
+import pygame
+pygame_ms = (time.perf_counter() - start) * 1000
+
+name, path = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location(name, path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+elapsed_ms = (time.perf_counter() - start) * 1000
+
+print(json.dumps({
+    "pygame_ms": pygame_ms,
+    "import_ms": elapsed_ms,
+    "display": bool(pygame.display.get_init()),
+    "window": pygame.display.get_surface() is not None,
+    "mixer": pygame.mixer.get_init() is not None,
+}))
+"""
+
+
+def probe(name, path, env):
+    result = subprocess.run([sys.executable, "-c", PROBE, name, path],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(name, path, runs, cache):
+    """The fastest of runs warm imports; side effects count if any run had them."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPYCACHEPREFIX=cache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    samples = [probe(name, path, env) for _ in range(runs + 1)][1:]  # The first one compiles
+    for sample in samples:
+        if "error" in sample:
+            return sample
+    stats = {key: min(sample[key] for sample in samples) for key in ("pygame_ms", "import_ms")}
+    for side_effect in ("display", "window", "mixer"):
+        stats[side_effect] = any(sample[side_effect] for sample in samples)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.1,
+                        help="most a game's import may take, as a share of `import pygame` (default 0.1)")
+    args = parser.parse_args()
+
+    failed = False
+    # Bytecode goes to a throwaway cache rather than next to the sources
+    with tempfile.TemporaryDirectory() as cache:
+        for name, path in GAMES.items():
+            stats = measure(name, path, args.runs, cache)
+            problems = []
+            if "error" in stats:
+                problems.append(stats["error"])
+            else:
+                budget_ms = stats["pygame_ms"] * args.budget
+                if stats["import_ms"] > budget_ms:
+                    problems.append(f"over the {budget_ms:.1f} ms budget")
+                for side_effect in ("display", "window", "mixer"):
+                    if stats[side_effect]:
+                        problems.append(f"initialized the {side_effect}")
+
+            status = "FAIL" if problems else "ok"
+            timing = "-"
+            if "import_ms" in stats:
+                timing = (f"{stats['import_ms']:.1f} ms  "
+                          f"({stats['import_ms'] / stats['pygame_ms']:.0%} of pygame's {stats['pygame_ms']:.0f} ms)")
+            print(f"{status:4} {name:15} {timing}  {'; '.join(problems)}")
+            failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Time Brick Breaker's rollback and check that it stays in sync.
+
+Three checks of a two-player co-op game on level 8. In the first two
+both paddles chase the ball and the launch button is pressed now and then:
+
+  rollback  one game is stepped straight through while a second one, fed
+            the same inputs, rolls back --depth frames every frame and
+            re-simulates them. The second must match the first at every
+            frame, and the timed save + load + re-simulation must fit in
+            the budget (a quarter of a 60 Hz frame by default).
+  netplay   two RollbackSessions play each other over UDP on localhost
+            through LossyLink with --latency and --loss, on a simulated
+            60 Hz clock so the run takes no longer than the CPU needs. The
+            state of every frame both sides have confirmed must agree.
+  level     a rollback across the move to level 9. The replay must end
+            where the first run did without a single call into the mixer:
+            replayed frames have already been heard.
+
+The exit code is 1 when the budget is missed or any check fails.
+
+    python benchmarks/rollback.py [--frames 1200] [--budget-ms 4.0] [--latency 100] [--loss 0.05]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME = os.path.join(ROOT, "Brick-Breaker", "brick_breaker.py")
+
+
+def load_game():
+    sys.path.insert(0, ROOT)
+    spec = importlib.util.spec_from_file_location("brick_breaker", GAME)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.create_app(module.NETPLAY_SIZE)
+    return module
+
+
+def new_game(bb, seed):
+    game = bb.Game(players=2, seed=seed)
+    game.level = 8
+    game.setup_level(game.level)
+    game.lives = 10 ** 6
+    return game
+
+
+def player_input(bb, game, player, chooser):
+    """Steer toward the ball (player 2 a little off centre) and sometimes press launch."""
+    paddle = game.paddles[player]
+    target = game.ball.x - paddle.width / 2 + (0 if player == 0 else chooser.randint(-60, 60))
+    bits = bb.INPUT_LEFT if paddle.x > target + paddle.speed else 0
+    if paddle.x < target - paddle.speed:
+        bits = bb.INPUT_RIGHT
+    if chooser.random() < 0.1:
+        bits |= bb.INPUT_LAUNCH
+    return bits
+
+
+def fingerprint(state):
+    """The state with the shared brick field object left out, so two games compare."""
+    bricks = state[6]
+    return state[:6] + (bricks[1:],) + state[7:]
+
+
+class MixerSpy:
+    """Counts the calls that change playback, into pygame.mixer and the audio manager's channels."""
+
+    MIXER = ("stop", "pause", "unpause", "fadeout")
+    MUSIC = ("load", "play", "stop", "pause", "unpause", "fadeout", "queue", "set_volume")
+
+    def __init__(self, pygame, audio):
+        self.pygame = pygame
+        self.audio = audio
+        self.calls = []
+
+    def __enter__(self):
+        self.patched = [(self.pygame.mixer, name, getattr(self.pygame.mixer, name)) for name in self.MIXER]
+        self.patched += [(self.pygame.mixer.music, name, getattr(self.pygame.mixer.music, name))
+                         for name in self.MUSIC]
+        for module, name, func in self.patched:
+            setattr(module, name, self.counted(f"{module.__name__}.{name}", func))
+        # Channels are C objects that can't be patched, so each one is swapped for a counting stand-in
+        self.channels = self.audio.channels
+        self.audio.channels = {category: [CountingChannel(channel, self) for channel in channels]
+                               for category, channels in self.channels.items()}
+        return self
+
+    def __exit__(self, *exc):
+        for module, name, func in self.patched:
+            setattr(module, name, func)
+        self.audio.channels = self.channels
+
+    def counted(self, name, func):
+        def wrapper(*args, **kwargs):
+            self.calls.append(name)
+            return func(*args, **kwargs)
+        return wrapper
+
+
+class CountingChannel:
+    def __init__(self, channel, spy):
+        self.channel = channel
+        self.spy = spy
+
+    def __getattr__(self, name):
+        return self.spy.counted(f"Channel.{name}", getattr(self.channel, name))
+
+
+def run_rollback(bb, frames, depth):
+    chooser = random.Random(1)
+    reference, rolled = new_game(bb, 7), new_game(bb, 7)
+    history = []  # (state before frame, inputs) for the last depth frames of rolled
+    timings = []
+    desyncs = 0
+    for frame in range(frames):
+        inputs = (player_input(bb, reference, 0, chooser), player_input(bb, reference, 1, chooser))
+        reference.step(inputs)
+
+        history.append((rolled.save_state(), inputs))
+        rolled.step(inputs)
+        if len(history) > depth:
+            del history[0]
+        if len(history) == depth:
+            # Go back depth frames and run them again, as a late input would force
+            start = time.perf_counter()
+            rolled.load_state(history[0][0])
+            with bb.audio.silenced():
+                for i, (_, replayed) in enumerate(history):
+                    history[i] = (rolled.save_state(), replayed)
+                    rolled.step(replayed)
+            timings.append((time.perf_counter() - start) * 1000)
+        if fingerprint(rolled.save_state()) != fingerprint(reference.save_state()):
+            desyncs += 1
+
+    timings.sort()
+    return {
+        "mean_ms": sum(timings) / len(timings),
+        "p99_ms": timings[int(len(timings) * 0.99) - 1],
+        "max_ms": timings[-1],
+        "desyncs": desyncs,
+        "score": reference.score,
+    }
+
+
+def run_level_change(bb):
+    import pygame
+
+    reference, rolled = new_game(bb, 7), new_game(bb, 7)
+    for game in (reference, rolled):
+        game.level_complete = True  # As if the last brick had just broken
+    inputs = [(0, 0), (bb.INPUT_LAUNCH, 0), (0, 0), (0, bb.INPUT_LAUNCH)]
+
+    start = rolled.save_state()
+    for step in inputs:
+        reference.step(step)
+        rolled.step(step)
+    playing = rolled.bgm_playing
+    rolled.load_state(start)
+    with MixerSpy(pygame, bb.audio) as spy, bb.audio.silenced():
+        for step in inputs:
+            rolled.step(step)
+
+    return {
+        "level": rolled.level,
+        "mixer_calls": spy.calls,
+        "bgm_flag_changed": rolled.bgm_playing != playing,
+        "desynced": fingerprint(rolled.save_state()) != fingerprint(reference.save_state()),
+    }
+
+
+def run_netplay(bb, frames, latency_ms, loss):
+    from retro_arcade.netplay import LossyLink, RollbackSession, UdpLink
+
+    now = [0.0]
+    clock = lambda: now[0]
+    host_link = UdpLink(0, bind="127.0.0.1")
+    guest_link = UdpLink(0, peer=host_link.address, bind="127.0.0.1")
+    sessions = [
+        RollbackSession(LossyLink(host_link, latency_ms, latency_ms / 10, loss, seed=1, clock=clock), 0,
+                        seed=7, quiet=bb.audio.silenced, clock=clock),
+        RollbackSession(LossyLink(guest_link, latency_ms, latency_ms / 10, loss, seed=2, clock=clock), 1,
+                        quiet=bb.audio.silenced, clock=clock),
+    ]
+    choosers = [random.Random(3), random.Random(4)]
+    confirmed = [{}, {}]  # frame -> fingerprint of its state, once every earlier input is known
+    timings = []
+
+    steps = 0
+    while min(session.frame for session in sessions) < frames and steps < frames * 4:
+        steps += 1
+        now[0] += 1 / 60
+        for player, session in enumerate(sessions):
+            if session.game is None:
+                if session.connect():
+                    session.start(new_game(bb, session.seed))
+                continue
+            start = time.perf_counter()
+            session.advance(player_input(bb, session.game, player, choosers[player]))
+            timings.append((time.perf_counter() - start) * 1000)
+
+            # The snapshot of a frame is final once no input before it can change
+            final = min(session.confirmed, session.frame)
+            if final == session.frame:
+                frame, state = final, session.game.save_state()
+            else:
+                frame, state = session.snapshots[final % len(session.snapshots)]
+            if frame == final and final not in confirmed[player]:
+                confirmed[player][final] = fingerprint(state)
+
+    for session in sessions:
+        session.close()
+    common = confirmed[0].keys() & confirmed[1].keys()
+    timings.sort()
+    return {
+        "frames": min(session.frame for session in sessions),
+        "compared": len(common),
+        "desyncs": sum(confirmed[0][frame] != confirmed[1][frame] for frame in common),
+        "rollbacks": sum(session.rollbacks for session in sessions),
+        "resimulated": sum(session.resimulated for session in sessions),
+        "waits": sum(session.waits for session in sessions),
+        "p99_ms": timings[int(len(timings) * 0.99) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--depth", type=int, default=8, help="frames re-simulated per rollback")
+    parser.add_argument("--budget-ms", type=float, default=4.0)
+    parser.add_argument("--latency", type=float, default=100, metavar="MS", help="one-way, for the netplay run")
+    parser.add_argument("--loss", type=float, default=0.05)
+    args = parser.parse_args()
+
+    # Headless, with a throwaway HOME so the leaderboard stays out of the user's files
+    with tempfile.TemporaryDirectory() as home:
+        os.environ.update(SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                          PYGAME_HIDE_SUPPORT_PROMPT="1", HOME=home, USERPROFILE=home)
+        bb = load_game()
+        rollback = run_rollback(bb, args.frames, args.depth)
+        netplay = run_netplay(bb, args.frames, args.latency, args.loss)
+        level = run_level_change(bb)
+
+    failed = False
+    status = "ok"
+    if rollback["p99_ms"] > args.budget_ms or rollback["desyncs"]:
+        status, failed = "FAIL", True
+    print(f"{status:4} rollback  {args.depth} frames  mean {rollback['mean_ms']:.3f} ms  "
+          f"p99 {rollback['p99_ms']:.3f} ms  max {rollback['max_ms']:.3f} ms  "
+          f"{rollback['desyncs']} desyncs  score {rollback['score']}  (budget {args.budget_ms:.1f} ms)")
+
+    status = "ok"
+    if netplay["desyncs"] or netplay["frames"] < args.frames:
+        status, failed = "FAIL", True
+    average = netplay["resimulated"] / netplay["rollbacks"] if netplay["rollbacks"] else 0
+    print(f"{status:4} netplay   {args.latency:.0f} ms  {args.loss:.0%} loss  {netplay['frames']} frames  "
+          f"{netplay['compared']} compared  {netplay['desyncs']} desyncs  "
+          f"{netplay['rollbacks']} rollbacks of {average:.1f} frames  {netplay['waits']} waits  "
+          f"advance p99 {netplay['p99_ms']:.3f} ms")
+
+    status = "ok"
+    if level["level"] != 9 or level["mixer_calls"] or level["bgm_flag_changed"] or level["desynced"]:
+        status, failed = "FAIL", True
+    calls = ", ".join(level["mixer_calls"]) or "none"
+    print(f"{status:4} level     replayed 8 -> {level['level']}  mixer calls: {calls}  "
+          f"{'music flag flipped  ' if level['bgm_flag_changed'] else ''}"
+          f"{'desynced' if level['desynced'] else 'in sync'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Headless benchmark suite: drive each game through a scripted scenario.
+
+Every scenario in benchmarks/scenarios.py runs in its own interpreter with
+SDL's dummy video and audio drivers. After a warm-up the runner times
+game.update() and game.draw() (plus the display flip) separately and counts
+the surfaces, text renders and transforms allocated per frame. Results are
+printed as JSON; with --baseline they are compared against a stored run and
+the exit code is 1 when anything regressed by more than --tolerance.
+
+    python benchmarks/run.py [--frames 600] [--only NAME ...]
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json --update-baseline
+
+Timings depend on the machine; refresh the baseline when switching hosts.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# metric -> True when a bigger number is better
+METRICS = {
+    "update_fps": True,
+    "draw_fps": True,
+    "frame_fps": True,
+    "surfaces_per_frame": False,
+    "text_renders_per_frame": False,
+    "transforms_per_frame": False,
+    "peak_rss_mb": False,
+}
+
+
+class AllocationCounter:
+    """Wrap the pygame constructors a frame might call so we can count them."""
+
+    TRANSFORMS = ("scale", "smoothscale", "rotate", "rotozoom", "flip")
+
+    def __init__(self, pygame):
+        self.counts = {"surfaces": 0, "text_renders": 0, "transforms": 0}
+        counts = self.counts
+
+        class CountingSurface(pygame.Surface):
+            def __init__(self, *args, **kwargs):
+                counts["surfaces"] += 1
+                super().__init__(*args, **kwargs)
+
+        class CountingFont(pygame.font.Font):
+            def render(self, *args, **kwargs):
+                counts["text_renders"] += 1
+                return super().render(*args, **kwargs)
+
+        pygame.Surface = CountingSurface
+        pygame.font.Font = CountingFont
+        for name in self.TRANSFORMS:
+            setattr(pygame.transform, name, self._counted(getattr(pygame.transform, name)))
+
+    def _counted(self, func):
+        counts = self.counts
+
+        def wrapper(*args, **kwargs):
+            counts["transforms"] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    def reset(self):
+        for key in self.counts:
+            self.counts[key] = 0
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(name, frames, warmup):
+    """Child process: run one scenario and print its stats as JSON."""
+    import pygame
+    from benchmarks.scenarios import SCENARIOS
+
+    game_path, setup, step = SCENARIOS[name]
+    counter = AllocationCounter(pygame)
+    random.seed(0)
+
+    module_name = os.path.splitext(os.path.basename(game_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, game_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.create_app()
+    game = setup(module)
+
+    update_time = draw_time = 0.0
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            counter.reset()
+            update_time = draw_time = 0.0
+        pygame.event.pump()
+        step(module, game, frame)
+
+        start = time.perf_counter()
+        game.update()
+        middle = time.perf_counter()
+        game.draw(module.screen)
+        pygame.display.flip()
+        end = time.perf_counter()
+
+        update_time += middle - start
+        draw_time += end - middle
+
+    pygame.quit()
+    return {
+        "frames": frames,
+        "update_fps": frames / update_time if update_time else None,
+        "draw_fps": frames / draw_time if draw_time else None,
+        "frame_fps": frames / (update_time + draw_time),
+        "surfaces_per_frame": counter.counts["surfaces"] / frames,
+        "text_renders_per_frame": counter.counts["text_renders"] / frames,
+        "transforms_per_frame": counter.counts["transforms"] / frames,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure(name, frames, warmup):
+    # A throwaway HOME keeps leaderboards and settings out of the user's files
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                   PYGAME_HIDE_SUPPORT_PROMPT="1", HOME=home, USERPROFILE=home)
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", name,
+             "--frames", str(frames), "--warmup", str(warmup)],
+            capture_output=True, text=True, env=env, cwd=home)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines() or ["exited with code %d" % result.returncode]
+        return {"error": lines[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions against the baseline."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if "error" in stats:
+            regressions.append(f"{name}: {stats['error']}")
+            continue
+        for metric, higher_is_better in METRICS.items():
+            new, old = stats.get(metric), base.get(metric)
+            if new is None or old is None:
+                continue
+            if higher_is_better:
+                regressed = new < old * (1 - tolerance)
+            else:
+                # Allocation counts of zero must stay zero
+                regressed = new > old * (1 + tolerance) + (0.5 if metric.endswith("_per_frame") else 0)
+            if regressed:
+                regressions.append(f"{name}: {metric} {old:.1f} -> {new:.1f}")
+    return regressions
+
+
+def main():
+    from benchmarks.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), metavar="NAME")
+    parser.add_argument("--baseline", help="JSON file from an earlier run to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write this run to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown or growth (default 0.15)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, args.warmup)))
+        return 0
+
+    results = {name: measure(name, args.frames, args.warmup) for name in args.only or SCENARIOS}
+    print(json.dumps(results, indent=2))
+
+    failed = any("error" in stats for stats in results.values())
+    if args.baseline and args.update_baseline:
+        # Keep the entries of scenarios that were not part of this run or failed in it
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update((name, stats) for name, stats in results.items() if "error" not in stats)
+        for name, stats in results.items():
+            if "error" in stats:
+                print(f"FAILED {name}: {stats['error']} (baseline entry left as it was)", file=sys.stderr)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
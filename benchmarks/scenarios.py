@@ -0,0 +1,208 @@
+"""Scripted worst-case scenarios for the benchmark runner.
+
+Each scenario names the game script it drives and provides two hooks:
+
+    setup(module) -> game      called once after create_app()
+    step(module, game, frame)  scripted input, called before every update
+
+The runner times game.update() and game.draw() separately, so the hooks
+should only poke at state the way a player (or a stress test) would.
+"""
+from retro_arcade.replay import TurnLog
+
+BRICK_BREAKER = "Brick-Breaker/brick_breaker.py"
+SNAKE_RUSH = "Snake-Rush/snake_rush.py"
+SPACE_INVADERS = "Space-Invaders/space_invaders.py"
+
+
+# --- Brick Breaker: level 8 with brick respawns -----------------------------
+
+def setup_brick_breaker_level8(bb):
+    game = bb.Game(seed=0)  # The game rolls its own dice, apart from the runner's seeded random
+    game.level = 8
+    game.setup_level(game.level)
+    game.lives = 10 ** 6
+    game.ball.active = True
+    return game
+
+
+def step_brick_breaker_level8(bb, game, frame):
+    bb.audio.begin_frame()
+    if game.level_complete:
+        game.level_complete = False
+        game.setup_level(game.level)
+    game.ball.active = True
+    # Paddle follows the ball so the rally (and the respawns) keep going
+    target = int(game.ball.x - game.paddle.width / 2)
+    game.paddle.x = max(0, min(bb.SCREEN_WIDTH - game.paddle.width, target))
+
+
+# --- Brick Breaker: 500-ball multiball ---------------------------------------
+
+def setup_brick_breaker_multiball(bb):
+    game = setup_brick_breaker_level8(bb)
+    step_brick_breaker_multiball(bb, game, 0)
+    return game
+
+
+def step_brick_breaker_multiball(bb, game, frame):
+    step_brick_breaker_level8(bb, game, frame)
+    # Catch multiball power-ups until the batch is full again
+    while len(game.extra_balls) + 1 < bb.MULTIBALL_LIMIT:
+        game.apply_powerup(4)
+
+
+# --- Snake Rush: 2000-segment snake ------------------------------------------
+
+SNAKE_LENGTH = 2000  # Fits on the 64x36 logical grid
+
+
+def hamiltonian_cycle(width, height):
+    """Visit every cell once: serpentine rows over columns 1.., back up column 0."""
+    cycle = []
+    for y in range(height):
+        xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(height - 1, -1, -1))
+    return cycle
+
+
+def coil_snake(sr, game, cycle, length):
+    """Lay a snake of the given length along a cycle of cells, ready to follow it."""
+    game.title_screen = False
+    game.bench_next_cell = {cell: cycle[(i + 1) % len(cycle)] for i, cell in enumerate(cycle)}
+    game.bench_length = length
+    body = cycle[:length]
+    game.snake.place((x * sr.BLOCK_SIZE, y * sr.BLOCK_SIZE) for x, y in reversed(body))
+    game.world.follow(game.snake.get_head_position())
+    return game
+
+
+def step_along_cycle(sr, game, frame):
+    sr.audio.begin_frame()
+    # Keep the length fixed so eating food can't make the snake outgrow the cycle
+    game.snake.length = game.bench_length
+
+    head_x, head_y = game.snake.get_head_position()
+    x, y = head_x // sr.BLOCK_SIZE, head_y // sr.BLOCK_SIZE
+    next_x, next_y = game.bench_next_cell[(x, y)]
+    game.snake.next_direction = (next_x - x, next_y - y)
+
+
+def setup_snake_rush_2000(sr):
+    cycle = hamiltonian_cycle(sr.GRID_WIDTH, sr.GRID_HEIGHT)
+    return coil_snake(sr, sr.Game(), cycle, SNAKE_LENGTH)
+
+
+# --- Snake Rush: 2000-segment snake racing a 2000-segment ghost ---------------
+
+GHOST_TICKS = 100000  # Longer than any benchmark run, so the ghost never stops
+
+
+def setup_snake_rush_ghost(sr):
+    game = setup_snake_rush_2000(sr)
+    # A recorded run that follows the same cycle from the start cell, at full length from the first move
+    turns = TurnLog()
+    cell, heading = (sr.GRID_WIDTH // 2, sr.GRID_HEIGHT // 2), sr.DIRECTIONS.index((1, 0))
+    for _ in range(GHOST_TICKS):
+        next_cell = game.bench_next_cell[cell]
+        direction = sr.DIRECTIONS.index((next_cell[0] - cell[0], next_cell[1] - cell[1]))
+        turns.record((direction - heading) & 3)
+        cell, heading = next_cell, direction
+    game.ghost = sr.Ghost(game.world, {'ticks': turns.ticks, 'turns': turns.as_text(),
+                                       'growth': [[0, SNAKE_LENGTH]]})
+    return game
+
+
+# --- Snake Rush: 19000-segment snake in the large world ----------------------
+
+LARGE_SNAKE_LENGTH = 19000
+LARGE_PATCH = (400, 450, 200, 100)  # Cells (left, top, width, height) the snake coils through
+
+
+def setup_snake_rush_large_world(sr):
+    left, top, width, height = LARGE_PATCH
+    cycle = [(left + x, top + y) for x, y in hamiltonian_cycle(width, height)]
+    return coil_snake(sr, sr.Game(large_world=True), cycle, LARGE_SNAKE_LENGTH)
+
+
+# --- Snake Rush: autopilot demo in the large world ----------------------------
+
+def setup_snake_rush_autopilot(sr):
+    game = sr.Game(large_world=True)
+    game.start_demo()
+    return game
+
+
+def step_snake_rush_autopilot(sr, game, frame):
+    sr.audio.begin_frame()
+    # The demo ends when the autopilot crashes; start another straight away
+    if not game.demo:
+        game.start_demo()
+
+
+# --- Snake Rush: four-player party on one board -------------------------------
+
+PARTY_LENGTH = 500  # Per snake; each coils through its own quarter of the 64x36 grid
+
+
+def setup_snake_rush_party(sr):
+    game = sr.Game(players=4)
+    game.title_screen = False
+    game.bench_next_cell = {}
+    game.bench_length = PARTY_LENGTH
+    width, height = sr.GRID_WIDTH // 2, sr.GRID_HEIGHT // 2
+    for snake, (left, top) in zip(game.snakes, ((0, 0), (width, 0), (0, height), (width, height))):
+        cycle = [(left + x, top + y) for x, y in hamiltonian_cycle(width, height)]
+        game.bench_next_cell.update((cell, cycle[(i + 1) % len(cycle)]) for i, cell in enumerate(cycle))
+        snake.place((x * sr.BLOCK_SIZE, y * sr.BLOCK_SIZE) for x, y in reversed(cycle[:PARTY_LENGTH]))
+    return game
+
+
+def step_snake_rush_party(sr, game, frame):
+    sr.audio.begin_frame()
+    for snake in game.snakes:
+        snake.length = game.bench_length
+        head_x, head_y = snake.get_head_position()
+        x, y = head_x // sr.BLOCK_SIZE, head_y // sr.BLOCK_SIZE
+        next_x, next_y = game.bench_next_cell[(x, y)]
+        snake.next_direction = (next_x - x, next_y - y)
+
+
+# --- Space Invaders: level 10 firefight --------------------------------------
+
+def setup_space_invaders_level10(si):
+    game = si.Game()
+    game.title_screen = False
+    game.level = 10
+    game.create_invaders()
+    game.lives = 10 ** 6
+    return game
+
+
+def step_space_invaders_level10(si, game, frame):
+    si.audio.begin_frame()
+    # A fresh wave whenever this one is cleared or about to land
+    if game.level_complete or not game.invaders or \
+            max(invader.y for invader in game.invaders) > game.player.y - 120:
+        game.level_complete = False
+        game.create_invaders()
+    # Player fires every 4th frame, the invaders every frame
+    if frame % 4 == 0:
+        game.shoot_player_bullet()
+    game.invader_shoot_chance = 1.0
+    # Sweep the player across the screen
+    game.player.x = int((si.SCREEN_WIDTH - game.player.width) * (0.5 + 0.45 * ((frame % 240) / 120 - 1)))
+    game.player.rect.x = game.player.x
+
+
+SCENARIOS = {
+    "brick_breaker.level8_respawns": (BRICK_BREAKER, setup_brick_breaker_level8, step_brick_breaker_level8),
+    "brick_breaker.multiball_500": (BRICK_BREAKER, setup_brick_breaker_multiball, step_brick_breaker_multiball),
+    "snake_rush.snake_2000": (SNAKE_RUSH, setup_snake_rush_2000, step_along_cycle),
+    "snake_rush.ghost_2000": (SNAKE_RUSH, setup_snake_rush_ghost, step_along_cycle),
+    "snake_rush.large_world_19000": (SNAKE_RUSH, setup_snake_rush_large_world, step_along_cycle),
+    "snake_rush.autopilot_large_world": (SNAKE_RUSH, setup_snake_rush_autopilot, step_snake_rush_autopilot),
+    "snake_rush.party_4": (SNAKE_RUSH, setup_snake_rush_party, step_snake_rush_party),
+    "space_invaders.level10_firefight": (SPACE_INVADERS, setup_space_invaders_level10, step_space_invaders_level10),
+}
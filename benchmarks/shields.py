@@ -0,0 +1,104 @@
+"""Time the Space Invaders shields under sustained fire.
+
+Four shields take a five-bullet volley from the invaders and a five-bullet
+spread from the player every frame, all aimed at the shields, which is far
+more fire than level 10 ever produces. Only the shield work is timed:
+Game.update_shields() plus drawing the shields. Bullets are moved outside
+the timed section, and the shields are rebuilt once they are half shot
+away so every frame has something left to hit. The exit code is 1 when the
+mean frame goes over the budget.
+
+    python benchmarks/shields.py [--frames 3000] [--budget-ms 1.0]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME = os.path.join(ROOT, "Space-Invaders", "space_invaders.py")
+
+
+def load_game():
+    sys.path.insert(0, ROOT)
+    spec = importlib.util.spec_from_file_location("space_invaders", GAME)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.create_app()
+    return module
+
+
+def run(frames, warmup):
+    si = load_game()
+    random.seed(0)
+    game = si.Game()
+    game.title_screen = False
+    game.level = 10
+    game.create_invaders()
+    full = sum(shield.mask.count() for shield in game.shields)
+
+    timings = []
+    hits = 0
+    for frame in range(warmup + frames):
+        # Untimed: fire, move the bullets and restore worn-out shields
+        for _ in range(5):
+            shield = random.choice(game.shields)
+            x = random.randint(shield.rect.left, shield.rect.right - 4)
+            game.invader_bullets.append(si.Bullet(x, game.shield_area.top - 40, 6 + game.level, si.RED))
+        target = random.choice(game.shields)
+        game.player.x = target.rect.centerx - game.player.width // 2
+        game.shoot_player_bullet()
+        for bullets in (game.invader_bullets, game.player_bullets):
+            for bullet in bullets[:]:
+                bullet.update()
+                if not -20 < bullet.y < si.SCREEN_HEIGHT:
+                    bullets.remove(bullet)
+        if sum(shield.mask.count() for shield in game.shields) < full // 2:
+            game.create_shields()
+        in_flight = len(game.invader_bullets) + len(game.player_bullets)
+
+        start = time.perf_counter()
+        game.update_shields()
+        for shield in game.shields:
+            shield.draw(si.screen)
+        elapsed = time.perf_counter() - start
+
+        if frame >= warmup:
+            timings.append(elapsed * 1000)
+            hits += in_flight - len(game.invader_bullets) - len(game.player_bullets)
+
+    timings.sort()
+    return {
+        "frames": frames,
+        "mean_ms": sum(timings) / frames,
+        "p99_ms": timings[int(frames * 0.99) - 1],
+        "max_ms": timings[-1],
+        "hits_per_frame": hits / frames,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # Headless, with a throwaway HOME so the leaderboard stays out of the user's files
+    with tempfile.TemporaryDirectory() as home:
+        os.environ.update(SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                          PYGAME_HIDE_SUPPORT_PROMPT="1", HOME=home, USERPROFILE=home)
+        stats = run(args.frames, args.warmup)
+
+    status = "FAIL" if stats["mean_ms"] > args.budget_ms else "ok"
+    print(f"{status:4} shields  mean {stats['mean_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms  "
+          f"max {stats['max_ms']:.3f} ms  {stats['hits_per_frame']:.1f} hits/frame  "
+          f"(budget {args.budget_ms:.1f} ms)")
+    sys.exit(1 if status == "FAIL" else 0)
+
+
+if __name__ == "__main__":
+    main()
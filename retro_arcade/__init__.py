@@ -0,0 +1 @@
+# Shared runtime used by the Retro Arcade games.
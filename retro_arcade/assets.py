@@ -0,0 +1,32 @@
+import pygame
+
+_images = {}
+
+
+def load_image(path):
+    """Load an image once and share the surface between callers.
+
+    Once a window exists the image is converted to the display format, so
+    blitting it later never needs a per-frame pixel format conversion.
+    Raises pygame.error / FileNotFoundError like pygame.image.load.
+    """
+    converted = pygame.display.get_surface() is not None
+    image = _images.get((path, converted))
+    if image is None:
+        image = pygame.image.load(path)
+        if converted:
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        _images[(path, converted)] = image
+    return image
+
+
+def fit_image(image, max_width, max_height):
+    """Scale an image down (never up) to fit inside the given box."""
+    width, height = image.get_size()
+    scale = min(max_width / width, max_height / height)
+    if scale < 1:
+        image = pygame.transform.scale(image, (int(width * scale), int(height * scale)))
+    return image
@@ -0,0 +1,193 @@
+import contextlib
+
+import pygame
+
+from retro_arcade.music import MusicPlayer
+
+
+class AudioManager:
+    """Named sound banks played through reserved mixer channels.
+
+    Every sound belongs to a category ("sfx", "music", ...) and each category
+    owns a fixed slice of mixer channels, so a burst of explosions can never
+    starve the background loop of a channel. Volume and mute state live here
+    and are only pushed to the mixer when they actually change.
+
+    Long tracks registered with stream() are played through a MusicPlayer
+    instead of a channel and follow the "music" category's volume.
+    """
+
+    def __init__(self, categories=None):
+        if pygame.mixer.get_init() is None:
+            pygame.mixer.init()
+
+        # category name -> number of reserved channels
+        categories = categories or {"sfx": 8}
+        total = sum(categories.values())
+        # Keep SDL's default 8 channels free for one-off Sound.play() calls
+        if pygame.mixer.get_num_channels() < total + 8:
+            pygame.mixer.set_num_channels(total + 8)
+        pygame.mixer.set_reserved(total)
+
+        self.channels = {}
+        first = 0
+        for category, count in categories.items():
+            self.channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            first += count
+
+        self.sounds = {}  # name -> {"sound", "category", "volume", "min_interval"}
+        self.music = MusicPlayer()
+        # Streamed music has no channels but still gets its own volume and mute
+        self.category_volume = {category: 1.0 for category in [*categories, "music"]}
+        self.category_muted = {category: False for category in self.category_volume}
+        self.muted = False
+        self.frame = 0
+        self._silenced = 0  # Depth of silenced() blocks
+
+        self._applied_volume = {}  # name -> last volume pushed to the mixer
+        self._last_played_frame = {}
+        self._last_played_time = {}
+        self._channel_started = {}  # channel -> ticks when it started its current sound
+        self._playing_on = {}  # name -> channel that last played it
+
+    def load(self, name, path, category="sfx", volume=1.0, min_interval=0):
+        """Load a sound into the bank; missing or unreadable files stay silent."""
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Sound error ({name}): {e}")
+            return False
+        self.sounds[name] = {
+            "sound": sound,
+            "category": category,
+            "volume": volume,
+            "min_interval": min_interval,  # Rate limit in milliseconds
+        }
+        self._apply_volume(name)
+        return True
+
+    def stream(self, name, path, volume=1.0):
+        """Register a long track that is streamed from disk rather than decoded."""
+        return self.music.add(name, path, volume)
+
+    def begin_frame(self):
+        """Start a new frame; each sound plays at most once per frame."""
+        self.frame += 1
+        self.music.update()
+
+    @contextlib.contextmanager
+    def silenced(self):
+        """Ignore play() and stop() inside the block, e.g. while re-running frames already heard."""
+        self._silenced += 1
+        try:
+            yield
+        finally:
+            self._silenced -= 1
+
+    def is_silenced(self):
+        return self._silenced > 0
+
+    def play(self, name, loops=0, fade_ms=0):
+        if self._silenced:
+            return None
+        if name in self.music.tracks:
+            return self.music.play(name, loops=loops, fade_ms=fade_ms)
+        entry = self.sounds.get(name)
+        if entry is None:
+            return None
+        if loops == 0:
+            # Silent one-shots are dropped; loops keep running so unmuting resumes them
+            if self._effective_volume(name) == 0 or self._last_played_frame.get(name) == self.frame:
+                return None
+
+        now = pygame.time.get_ticks()
+        last_time = self._last_played_time.get(name)
+        if last_time is not None and now - last_time < entry["min_interval"]:
+            return None
+
+        channel = self._pick_channel(entry["category"])
+        channel.play(entry["sound"], loops=loops)
+        self._channel_started[channel] = now
+        self._playing_on[name] = channel
+        self._last_played_frame[name] = self.frame
+        self._last_played_time[name] = now
+        return channel
+
+    def _pick_channel(self, category):
+        pool = self.channels[category]
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        # Every channel is busy: steal the one that has been playing longest
+        return min(pool, key=lambda channel: self._channel_started.get(channel, 0))
+
+    def is_playing(self, name):
+        if name in self.music.tracks:
+            return self.music.is_playing(name)
+        channel = self._playing_on.get(name)
+        entry = self.sounds.get(name)
+        return bool(channel and entry and channel.get_busy() and channel.get_sound() == entry["sound"])
+
+    def stop(self, name, fade_ms=0):
+        if self._silenced:
+            return
+        if name in self.music.tracks:
+            self.music.stop(name, fade_ms=fade_ms)
+            return
+        if self.is_playing(name):
+            self._playing_on[name].stop()
+        self._playing_on.pop(name, None)
+
+    def stop_category(self, category):
+        if self._silenced:
+            return
+        if category == "music":
+            self.music.stop()
+        for channel in self.channels.get(category, []):
+            channel.stop()
+
+    def stop_all(self):
+        for category in self.category_volume:
+            self.stop_category(category)
+
+    def set_volume(self, category, volume):
+        volume = max(0.0, min(1.0, volume))
+        if self.category_volume[category] != volume:
+            self.category_volume[category] = volume
+            self._refresh(category)
+
+    def set_muted(self, muted):
+        if self.muted != muted:
+            self.muted = muted
+            self._refresh()
+
+    def set_category_muted(self, category, muted):
+        if self.category_muted[category] != muted:
+            self.category_muted[category] = muted
+            self._refresh(category)
+
+    def is_muted(self, category=None):
+        if category is None:
+            return self.muted
+        return self.muted or self.category_muted[category]
+
+    def _effective_volume(self, name):
+        entry = self.sounds[name]
+        category = entry["category"]
+        if self.muted or self.category_muted[category]:
+            return 0
+        return entry["volume"] * self.category_volume[category]
+
+    def _apply_volume(self, name):
+        volume = self._effective_volume(name)
+        if self._applied_volume.get(name) != volume:
+            self.sounds[name]["sound"].set_volume(volume)
+            self._applied_volume[name] = volume
+
+    def _refresh(self, category=None):
+        if category in (None, "music"):
+            muted = self.muted or self.category_muted["music"]
+            self.music.set_volume(0 if muted else self.category_volume["music"])
+        for name, entry in self.sounds.items():
+            if category is None or entry["category"] == category:
+                self._apply_volume(name)
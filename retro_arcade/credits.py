@@ -0,0 +1,94 @@
+import pygame
+
+from retro_arcade.fonts import get_font
+from retro_arcade.scene import Scene, run_scene
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+class CreditsRoll:
+    """Scrolling credits that are rasterised once into a single text strip."""
+
+    def __init__(self, lines, font, color=WHITE, background=BLACK, line_height=40, speed=2):
+        self.line_height = line_height
+        self.speed = speed  # Pixels per step
+        self.background = background
+        self.strip = self.render_strip(lines, font, color, background, line_height)
+        self.y = 0
+
+    @staticmethod
+    def render_strip(lines, font, color, background, line_height):
+        rendered = [font.render(line, True, color) if line else None for line in lines]
+        width = max([text.get_width() for text in rendered if text] or [1])
+        strip = pygame.Surface((width, max(1, len(lines) * line_height)))
+        strip.fill(background)
+        for i, text in enumerate(rendered):
+            if text:
+                strip.blit(text, text.get_rect(center=(width // 2, i * line_height + line_height // 2)))
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()
+        return strip
+
+    def start(self, viewport_height):
+        # First line is centred just below the bottom edge, like the old per-line loop
+        self.y = viewport_height - self.line_height // 2
+
+    def update(self):
+        self.y -= self.speed
+
+    @property
+    def finished(self):
+        return self.y + self.strip.get_height() < 0
+
+    def draw(self, surface):
+        surface_height = surface.get_height()
+        top = max(0, -self.y)
+        bottom = min(self.strip.get_height(), surface_height - self.y)
+        if bottom <= top:
+            return
+        visible = self.strip.subsurface((0, top, self.strip.get_width(), bottom - top))
+        surface.blit(visible, ((surface.get_width() - self.strip.get_width()) // 2, self.y + top))
+
+
+class CreditsScene(Scene):
+    """Rolls the credits; ends with "quit", "skipped" or "finished"."""
+
+    def __init__(self, lines, skip_keys, viewport_height, speed=2, total_duration=14000, font_size=32):
+        self.roll = CreditsRoll(lines, get_font(font_size), speed=speed)
+        self.roll.start(viewport_height)
+        self.skip_keys = skip_keys
+        self.total_duration = total_duration
+        self.start_time = pygame.time.get_ticks()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "quit"
+        elif event.type == pygame.KEYDOWN:
+            if event.key in self.skip_keys:
+                return "skipped"
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            return "skipped"
+        return None
+
+    def update(self):
+        if pygame.time.get_ticks() - self.start_time >= self.total_duration:
+            return "finished"
+        self.roll.update()
+        if self.roll.finished:
+            return "finished"
+        return None
+
+    def draw(self, surface):
+        surface.fill(self.roll.background)
+        self.roll.draw(surface)
+
+
+def run_credits(screen, lines, skip_keys, fps=60, speed=2, total_duration=14000, font_size=32):
+    """Roll the credits until they finish, time out or are skipped.
+
+    Returns "quit" if the window was closed, "skipped" on a skip key or click,
+    and "finished" otherwise.
+    """
+    scene = CreditsScene(lines, skip_keys, screen.get_height(), speed=speed, total_duration=total_duration, font_size=font_size)
+    return run_scene(scene, screen, fps)
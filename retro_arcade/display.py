@@ -0,0 +1,40 @@
+import os
+
+import pygame
+
+# Scaling filter -> SDL_RENDER_SCALE_QUALITY. "integer" keeps pixels square
+# (whole multiples when windowed), "bilinear" smooths to fill the display.
+SCALING = {"integer": "0", "bilinear": "1"}
+# Operators pick the filter for a cabinet with RETRO_ARCADE_SCALING
+DEFAULT_SCALING = os.environ.get("RETRO_ARCADE_SCALING", "integer")
+# RETRO_ARCADE_VSYNC=1 ties every flip to the display's refresh
+VSYNC = os.environ.get("RETRO_ARCADE_VSYNC") == "1"
+vsync_active = False  # Whether the current window really got vsync
+
+
+def open_window(size, fullscreen=False, scaling=None, vsync=None):
+    """Open (or reopen) the window with a fixed logical resolution.
+
+    pygame's SCALED mode hands the frame to SDL's renderer, which stretches
+    it to the window or display on the GPU. The game always draws at size,
+    so fill cost doesn't grow with the monitor, mouse positions arrive in
+    logical coordinates, and resizing the window needs no handling at all.
+    If vsync is requested but the driver can't provide it, the window opens
+    without it.
+    """
+    global vsync_active
+    scaling = scaling or DEFAULT_SCALING
+    if scaling not in SCALING:
+        raise ValueError(f"unknown scaling {scaling!r}, expected one of {sorted(SCALING)}")
+    # Read when the renderer's texture is created; the environment wins over pygame's default
+    os.environ["SDL_RENDER_SCALE_QUALITY"] = SCALING[scaling]
+    flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+    if VSYNC if vsync is None else vsync:
+        try:
+            surface = pygame.display.set_mode(size, flags, vsync=1)
+            vsync_active = True
+            return surface
+        except pygame.error as e:
+            print(f"VSync unavailable: {e}")
+    vsync_active = False
+    return pygame.display.set_mode(size, flags)
@@ -0,0 +1,12 @@
+import pygame
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Shared pygame.font.Font(name, size); building a Font reads the font file every time."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
@@ -0,0 +1,92 @@
+import re
+
+# Any byte other than zero, for finding the occupied cells of a chunk in C
+_OCCUPIED = re.compile(rb"[^\x00]")
+
+
+class ChunkedGrid:
+    """A sparse grid of small integers (0-255), stored as square chunks.
+
+    Cells default to 0. A chunk of chunk_size x chunk_size cells, one byte
+    each, is allocated when one of its cells is first set to a non-zero
+    value and freed again when its last one is cleared, so memory follows
+    the occupied area rather than the size of the grid. chunk_size must be
+    a power of two.
+    """
+
+    def __init__(self, width, height, chunk_size=16):
+        if chunk_size & (chunk_size - 1):
+            raise ValueError(f"chunk_size must be a power of two, not {chunk_size}")
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.shift = chunk_size.bit_length() - 1
+        self.mask = chunk_size - 1
+        self.cols = -(-width // chunk_size)
+        self.rows = -(-height // chunk_size)
+        self.chunks = {}  # chunk key -> bytearray of cells, row-major
+        self.counts = {}  # chunk key -> number of non-zero cells in it
+
+    def key(self, x, y):
+        """The key of the chunk holding cell (x, y)."""
+        return (y >> self.shift) * self.cols + (x >> self.shift)
+
+    def get(self, x, y):
+        chunk = self.chunks.get((y >> self.shift) * self.cols + (x >> self.shift))
+        if chunk is None:
+            return 0
+        return chunk[((y & self.mask) << self.shift) | (x & self.mask)]
+
+    def set(self, x, y, value):
+        key = (y >> self.shift) * self.cols + (x >> self.shift)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if not value:
+                return
+            chunk = self.chunks[key] = bytearray(self.chunk_size * self.chunk_size)
+            self.counts[key] = 0
+        index = ((y & self.mask) << self.shift) | (x & self.mask)
+        old = chunk[index]
+        chunk[index] = value
+        if not old and value:
+            self.counts[key] += 1
+        elif old and not value:
+            self.counts[key] -= 1
+            if not self.counts[key]:
+                del self.chunks[key]
+                del self.counts[key]
+
+    def clear(self):
+        self.chunks.clear()
+        self.counts.clear()
+
+    def chunk_keys(self, left, top, right, bottom):
+        """Keys of every chunk overlapping the cells left <= x < right, top <= y < bottom."""
+        left, top = max(left, 0) >> self.shift, max(top, 0) >> self.shift
+        right = (min(right, self.width) - 1) >> self.shift
+        bottom = (min(bottom, self.height) - 1) >> self.shift
+        for cy in range(top, bottom + 1):
+            row = cy * self.cols
+            for cx in range(left, right + 1):
+                yield row + cx
+
+    def cells_in(self, left, top, right, bottom):
+        """Yield (x, y, value) for the non-zero cells of the chunks overlapping a rectangle.
+
+        Whole chunks are reported, so a few cells just outside the
+        rectangle may come too; only live chunks are looked at.
+        """
+        size, shift, mask = self.chunk_size, self.shift, self.mask
+        for key in self.chunk_keys(left, top, right, bottom):
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                continue
+            base_x = (key % self.cols) * size
+            base_y = (key // self.cols) * size
+            for match in _OCCUPIED.finditer(chunk):
+                index = match.start()
+                yield base_x + (index & mask), base_y + (index >> shift), chunk[index]
+
+    def __len__(self):
+        """The number of live chunks."""
+        return len(self.chunks)
@@ -0,0 +1,90 @@
+import json
+import os
+
+
+class LeaderboardStore:
+    """Top scores kept in memory and persisted as a JSON list of entries.
+
+    Entries are dicts with at least a 'score'. Saving writes a temp file and
+    swaps it in with os.replace, so a crash mid-write can't truncate the
+    table; a corrupt file is moved aside to <file>.corrupt.
+    """
+
+    def __init__(self, path, limit=10, sort_key=None, unique=False, fallback_path=None, indent=None):
+        self.path = path
+        self.limit = limit
+        self.sort_key = sort_key or (lambda entry: -entry['score'])
+        self.unique = unique  # Drop exact duplicate entries
+        self.fallback_path = fallback_path  # Used when the primary file can't be written
+        self.indent = indent
+        self.scores = []
+        self.load_scores()
+
+    def load_scores(self):
+        try:
+            with open(self.path, 'r') as f:
+                scores = json.load(f)
+        except FileNotFoundError:
+            scores = []
+        except json.JSONDecodeError as e:
+            print(f"Error loading leaderboard: {e}")
+            self._move_aside()
+            scores = []
+        except OSError as e:
+            print(f"Error loading leaderboard: {e}")
+            scores = []
+        self.scores = self._ranked(scores if isinstance(scores, list) else [])
+        return self.scores
+
+    def _move_aside(self):
+        try:
+            os.replace(self.path, f"{self.path}.corrupt")
+        except OSError:
+            pass
+
+    def _ranked(self, scores):
+        if self.unique:
+            seen = set()
+            unique_scores = []
+            for entry in scores:
+                key = tuple(sorted(entry.items()))
+                if key not in seen:
+                    seen.add(key)
+                    unique_scores.append(entry)
+            scores = unique_scores
+        return sorted(scores, key=self.sort_key)[:self.limit]
+
+    def save_scores(self):
+        """Write the table; returns False if neither location could be written."""
+        for path in (self.path, self.fallback_path):
+            if path is None:
+                continue
+            try:
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'w') as f:
+                    json.dump(self.scores, f, indent=self.indent)
+                os.replace(temp_path, path)
+                return True
+            except OSError as e:
+                print(f"Error saving leaderboard: {e}")
+        return False
+
+    def add(self, entry):
+        self.scores.append(entry)
+        self.scores = self._ranked(self.scores)
+        return self.save_scores()
+
+    def get_top_scores(self, limit=10):
+        return self.scores[:limit]
+
+    def get_high_score(self):
+        return self.scores[0]['score'] if self.scores else 0
+
+    def is_high_score(self, score):
+        if not self.scores:
+            return True
+        return len(self.scores) < self.limit or score > min(entry['score'] for entry in self.scores)
+
+    def reset_scores(self):
+        self.scores = []
+        return self.save_scores()
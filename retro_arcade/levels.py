@@ -0,0 +1,249 @@
+"""Brick level packs: a JSON source compiled into a memory-mapped cache.
+
+The source is meant to be written by hand (or by a tool):
+
+    {
+      "palette": [[255, 0, 0], [255, 165, 0]],
+      "bricks": {"R": {"color": 0, "points": 10},
+                 "O": {"color": 1, "points": 20, "hits": 2}},
+      "defaults": {"brick_size": [80, 25], "gap": [10, 10], "top": 50},
+      "levels": [
+        {"gap": [10, 5], "rows": ["RRRRRRRR", "O.O..O.O"]}
+      ]
+    }
+
+Every row of a level is a string of brick keys, "." (or a space) for an
+empty cell; a level may override any of the defaults. The first load
+validates the whole pack and compiles it into a flat binary file: a
+header, the palette, an offset table and one record per level holding the
+grid as ready-made active/hits/colour/points arrays. Later runs map that
+file and read a level straight out of it, so loading one costs the same
+for a pack of ten levels or ten thousand. The cache is rebuilt whenever
+the source's size or modification time changes.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"RALV"
+VERSION = 1
+EMPTY = ". "  # Cells without a brick
+
+# magic, version, palette size, level count, source size, source mtime (ns)
+HEADER = struct.Struct("<4sHHIQQ")
+# offset of a level record from the start of the file
+OFFSET = struct.Struct("<I")
+# cols, rows, brick width, brick height, column gap, row gap, top
+LEVEL = struct.Struct("<HHHHHHH")
+
+
+class LevelFormatError(ValueError):
+    """The level pack source (or its cache) is malformed."""
+
+
+class Level:
+    """One compiled level: its grid geometry and per-cell brick arrays.
+
+    Cells are row-major; `active`, `hits` and `colors` hold one byte per
+    cell and `points` one unsigned int.
+    """
+
+    def __init__(self, cols, rows, brick_width, brick_height, col_gap, row_gap, top,
+                 active, hits, colors, points):
+        self.cols = cols
+        self.rows = rows
+        self.brick_width = brick_width
+        self.brick_height = brick_height
+        self.col_gap = col_gap
+        self.row_gap = row_gap
+        self.top = top
+        self.active = active
+        self.hits = hits
+        self.colors = colors
+        self.points = points
+
+    @property
+    def width(self):
+        return self.cols * self.brick_width + (self.cols - 1) * self.col_gap
+
+
+def _pair(value, name, where, minimum):
+    if (not isinstance(value, list) or len(value) != 2
+            or not all(isinstance(v, int) and minimum <= v <= 0xFFFF for v in value)):
+        raise LevelFormatError(f"{where}: '{name}' must be two integers between {minimum} and 65535")
+    return value
+
+
+def _number(value, name, where, minimum, maximum):
+    if not isinstance(value, int) or not minimum <= value <= maximum:
+        raise LevelFormatError(f"{where}: '{name}' must be an integer between {minimum} and {maximum}")
+    return value
+
+
+def _compile_level(where, spec, defaults, bricks, tables):
+    if not isinstance(spec, dict):
+        raise LevelFormatError(f"{where}: expected an object")
+    settings = dict(defaults, **spec)
+    brick_width, brick_height = _pair(settings.get("brick_size"), "brick_size", where, 1)
+    col_gap, row_gap = _pair(settings.get("gap", [0, 0]), "gap", where, 0)
+    top = _number(settings.get("top", 0), "top", where, 0, 0xFFFF)
+
+    rows = settings.get("rows")
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, str) for row in rows):
+        raise LevelFormatError(f"{where}: 'rows' must be a non-empty list of strings")
+    cols = len(rows[0])
+    if not cols or any(len(row) != cols for row in rows):
+        raise LevelFormatError(f"{where}: every row must have the same, non-zero length")
+    if len(rows) > 0xFFFF or cols > 0xFFFF:
+        raise LevelFormatError(f"{where}: at most 65535 rows and columns")
+
+    cells = "".join(rows)
+    unknown = set(cells).difference(bricks, EMPTY)
+    if unknown:
+        y = next(y for y, row in enumerate(rows) if unknown.intersection(row))
+        raise LevelFormatError(f"{where}: row {y} uses unknown brick '{min(unknown.intersection(rows[y]))}'")
+
+    # Every key maps to a single code point below 256, so each array is one translate away
+    active, hits, colors, points = tables
+    points = array("I", map(points.__getitem__, cells))
+    if sys.byteorder != "little":
+        points.byteswap()
+    return b"".join((LEVEL.pack(cols, len(rows), brick_width, brick_height, col_gap, row_gap, top),
+                     cells.translate(active).encode("latin-1"),
+                     cells.translate(hits).encode("latin-1"),
+                     cells.translate(colors).encode("latin-1"),
+                     points.tobytes()))
+
+
+def compile_pack(source, stamp=(0, 0)):
+    """Validate a parsed pack and return its compiled bytes.
+
+    `stamp` is the (size, mtime_ns) of the source file, recorded so a stale
+    cache can be recognised. Raises LevelFormatError on the first problem.
+    """
+    if not isinstance(source, dict):
+        raise LevelFormatError("the pack must be a JSON object")
+
+    palette = source.get("palette")
+    if (not isinstance(palette, list) or not 0 < len(palette) <= 256
+            or not all(isinstance(color, list) and len(color) == 3
+                       and all(isinstance(c, int) and 0 <= c <= 255 for c in color) for color in palette)):
+        raise LevelFormatError("'palette' must list 1-256 [r, g, b] colours")
+
+    bricks = {}
+    for key, brick in (source.get("bricks") or {}).items():
+        where = f"brick '{key}'"
+        if len(key) != 1 or key in EMPTY or not isinstance(brick, dict):
+            raise LevelFormatError(f"{where}: keys are single characters other than '.' and ' '")
+        bricks[key] = (_number(brick.get("hits", 1), "hits", where, 1, 255),
+                       _number(brick.get("color"), "color", where, 0, len(palette) - 1),
+                       _number(brick.get("points", 0), "points", where, 0, 0xFFFFFFFF))
+
+    empty = dict.fromkeys(map(ord, EMPTY), "\0")
+    tables = ({**empty, **{ord(key): "\1" for key in bricks}},
+              {**empty, **{ord(key): chr(hits) for key, (hits, color, points) in bricks.items()}},
+              {**empty, **{ord(key): chr(color) for key, (hits, color, points) in bricks.items()}},
+              {**dict.fromkeys(EMPTY, 0), **{key: points for key, (hits, color, points) in bricks.items()}})
+
+    defaults = source.get("defaults", {})
+    levels = source.get("levels")
+    if not isinstance(defaults, dict):
+        raise LevelFormatError("'defaults' must be an object")
+    if not isinstance(levels, list) or not levels:
+        raise LevelFormatError("'levels' must be a non-empty list")
+    records = [_compile_level(f"level {number}", spec, defaults, bricks, tables)
+               for number, spec in enumerate(levels, 1)]
+
+    size, mtime = stamp
+    parts = [HEADER.pack(MAGIC, VERSION, len(palette), len(records), size, mtime),
+             bytes(c for color in palette for c in color)]
+    offset = HEADER.size + 3 * len(palette) + OFFSET.size * len(records)
+    for record in records:
+        parts.append(OFFSET.pack(offset))
+        offset += len(record)
+    parts.extend(records)
+    return b"".join(parts)
+
+
+class LevelPack:
+    """A compiled level pack; pack[i] is level i + 1 as a Level.
+
+    The compiled form lives at `cache` (rebuilt from `source` when missing
+    or stale) and is memory-mapped, so only the levels actually played are
+    ever paged in. If the cache can't be written the pack is compiled into
+    memory instead.
+    """
+
+    def __init__(self, source, cache):
+        self.source = source
+        self.cache = cache
+        stat = os.stat(source)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        self.data = self._map(stamp) or self._compile(stamp)
+
+        magic, version, colors, self.count, size, mtime = HEADER.unpack_from(self.data)
+        raw = self.data[HEADER.size:HEADER.size + 3 * colors]
+        self.palette = [tuple(raw[i:i + 3]) for i in range(0, len(raw), 3)]
+        self.table = HEADER.size + len(raw)
+
+    def _map(self, stamp):
+        """Map the cache if it was compiled from this exact source, else None."""
+        try:
+            with open(self.cache, "rb") as f:
+                header = f.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    return None
+                magic, version, colors, count, size, mtime = HEADER.unpack(header)
+                if (magic, version, (size, mtime)) != (MAGIC, VERSION, stamp):
+                    return None
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def _compile(self, stamp):
+        try:
+            with open(self.source, "r", encoding="utf-8") as f:
+                source = json.load(f)
+        except json.JSONDecodeError as e:
+            raise LevelFormatError(f"{self.source}: {e}") from e
+        data = compile_pack(source, stamp)
+
+        # Same write-then-swap as the leaderboards, so a crash can't leave half a cache
+        temp_path = f"{self.cache}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.cache)
+        except OSError as e:
+            print(f"Error writing level cache: {e}")
+            return data
+        return self._map(stamp) or data
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError("level index out of range")
+        data = self.data
+        offset, = OFFSET.unpack_from(data, self.table + OFFSET.size * index)
+        cols, rows, brick_width, brick_height, col_gap, row_gap, top = LEVEL.unpack_from(data, offset)
+
+        cells = cols * rows
+        start = offset + LEVEL.size
+        active = data[start:start + cells]
+        hits = data[start + cells:start + 2 * cells]
+        colors = data[start + 2 * cells:start + 3 * cells]
+        points = array("I")
+        points.frombytes(data[start + 3 * cells:start + 7 * cells])
+        if sys.byteorder != "little":
+            points.byteswap()
+        return Level(cols, rows, brick_width, brick_height, col_gap, row_gap, top,
+                     active, hits, colors, points)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
@@ -0,0 +1,111 @@
+import pygame
+
+from retro_arcade.assets import fit_image, load_image
+from retro_arcade.fonts import get_font
+from retro_arcade.scene import Scene
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+class LogoScreen(Scene):
+    """Fades through the studio logos before the title screen.
+
+    logo_paths holds single image paths and (left, right) pairs shown side by
+    side. Each set is composed once onto an opaque surface, so a fade only
+    changes that surface's alpha instead of building a new per-pixel-alpha
+    copy every frame. Any click, or a key in skip_keys (any key when None),
+    skips the sequence.
+    """
+
+    def __init__(self, logo_paths, skip_keys=None, logo_duration=4000, fade_duration=1000):
+        self.logo_duration = logo_duration  # Per logo set, fades included
+        self.fade_duration = fade_duration
+        self.skip_keys = skip_keys
+        self.screen_size = pygame.display.get_surface().get_size()
+        self.logos = self.load_logos(logo_paths)
+        self.current_logo = 0
+        self.start_time = pygame.time.get_ticks()
+        self.fade_state = "in"  # "in", "hold", or "out"
+        self.next_logo_time = self.start_time + self.fade_duration
+
+    def load_logos(self, logo_paths):
+        width, height = self.screen_size
+        logos = []
+        for item in logo_paths:
+            try:
+                if isinstance(item, str):
+                    images = [fit_image(load_image(item), width * 0.9, height * 0.8)]
+                else:
+                    # Each half of a pair fits half the screen
+                    images = [fit_image(load_image(path), width * 0.45, height * 0.8) for path in item]
+                logos.append(self.compose(images))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error loading logo: {e}")
+
+        # If no logos loaded, create text-based ones
+        if not logos:
+            text = get_font(72).render("Desk Devil Labs", True, WHITE)
+            for i in range(3):
+                surf = pygame.Surface((400, 200))
+                surf.blit(text, text.get_rect(center=(200, 100)))
+                pygame.draw.rect(surf, WHITE, (0, 0, 400, 200), 2)
+                logos.append(surf)
+        return logos
+
+    @staticmethod
+    def compose(images, gap=20):
+        total_width = sum(image.get_width() for image in images) + gap * (len(images) - 1)
+        max_height = max(image.get_height() for image in images)
+        composite = pygame.Surface((total_width, max_height))
+        composite.fill(BLACK)
+        x_offset = 0
+        for image in images:
+            composite.blit(image, (x_offset, (max_height - image.get_height()) // 2))
+            x_offset += image.get_width() + gap
+        return composite.convert()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "quit"
+        elif event.type == pygame.KEYDOWN:
+            if self.skip_keys is None or event.key in self.skip_keys:
+                return True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            return True
+        return None
+
+    def update(self):
+        current_time = pygame.time.get_ticks()
+        if self.fade_state == "in" and current_time >= self.next_logo_time:
+            self.fade_state = "hold"
+            self.next_logo_time = current_time + (self.logo_duration - 2 * self.fade_duration)
+        elif self.fade_state == "hold" and current_time >= self.next_logo_time:
+            self.fade_state = "out"
+            self.next_logo_time = current_time + self.fade_duration
+        elif self.fade_state == "out" and current_time >= self.next_logo_time:
+            self.current_logo += 1
+            if self.current_logo >= len(self.logos):
+                return True
+            self.start_time = current_time
+            self.fade_state = "in"
+            self.next_logo_time = current_time + self.fade_duration
+        return None
+
+    def draw(self, surface):
+        surface.fill(BLACK)
+        if self.current_logo >= len(self.logos):
+            return
+
+        current_time = pygame.time.get_ticks()
+        if self.fade_state == "in":
+            alpha = min(255, int(255 * ((current_time - self.start_time) / self.fade_duration)))
+        elif self.fade_state == "out":
+            alpha = max(0, 255 - int(255 * ((current_time - (self.next_logo_time - self.fade_duration)) / self.fade_duration)))
+        else:  # hold
+            alpha = 255
+
+        logo = self.logos[self.current_logo]
+        # Squared to keep the curve of the old multiply-then-blend fade
+        logo.set_alpha(alpha * alpha // 255)
+        surface.blit(logo, logo.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2)))
@@ -0,0 +1,113 @@
+import os
+
+import pygame
+
+
+def _preferred_source(path):
+    """Use a compressed .ogg next to the file when one ships with the game."""
+    ogg_path = os.path.splitext(path)[0] + ".ogg"
+    if os.path.exists(ogg_path):
+        return ogg_path
+    if os.path.exists(path):
+        return path
+    return None
+
+
+class MusicPlayer:
+    """Background tracks streamed from disk through pygame.mixer.music.
+
+    A mixer Sound decodes the whole file into RAM; the music stream only keeps
+    the decoder's buffer resident. There is a single stream, so a crossfade is
+    a fade-out of the current track followed by a fade-in of the next one.
+    """
+
+    def __init__(self):
+        if pygame.mixer.get_init() is None:
+            pygame.mixer.init()
+
+        self.tracks = {}  # name -> {"path", "volume"}
+        self.queue = []  # (name, loops) started one after another
+        self.pending = None  # (name, loops, fade_ms) waiting for a fade-out to finish
+        self.current = None
+        self.volume = 1.0  # Category volume set by the owning AudioManager
+
+    def add(self, name, path, volume=1.0):
+        source = _preferred_source(path)
+        if source is None:
+            print(f"Music error ({name}): {path} not found")
+            return False
+        self.tracks[name] = {"path": source, "volume": volume}
+        return True
+
+    def play(self, name, loops=-1, fade_ms=0):
+        """Switch to a track, fading the current one out first when fade_ms is set."""
+        if name not in self.tracks:
+            return False
+        self.queue.clear()
+        if fade_ms and pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+            self.pending = (name, loops, fade_ms)
+            return True
+        self.pending = None
+        return self._start(name, loops, fade_ms)
+
+    def enqueue(self, name, loops=0):
+        """Play a track once the current one (and anything queued before it) ends."""
+        if name not in self.tracks:
+            return False
+        if self.pending is None and not pygame.mixer.music.get_busy():
+            return self._start(name, loops)
+        self.queue.append((name, loops))
+        return True
+
+    def update(self):
+        """Advance pending crossfades and the queue; call once per frame."""
+        if pygame.mixer.music.get_busy():
+            return
+        if self.pending:
+            name, loops, fade_ms = self.pending
+            self.pending = None
+            self._start(name, loops, fade_ms)
+        elif self.queue:
+            name, loops = self.queue.pop(0)
+            self._start(name, loops)
+        else:
+            self.current = None
+
+    def is_playing(self, name):
+        if self.pending and self.pending[0] == name:
+            return True
+        return self.current == name and pygame.mixer.music.get_busy()
+
+    def stop(self, name=None, fade_ms=0):
+        """Stop the stream, or only the given track if it is the one playing."""
+        if name is not None and not self.is_playing(name):
+            return
+        self.queue.clear()
+        self.pending = None
+        self.current = None
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def set_volume(self, volume):
+        if self.volume != volume:
+            self.volume = volume
+            self._apply_volume()
+
+    def _apply_volume(self):
+        if self.current is not None:
+            pygame.mixer.music.set_volume(self.tracks[self.current]["volume"] * self.volume)
+
+    def _start(self, name, loops, fade_ms=0):
+        try:
+            pygame.mixer.music.load(self.tracks[name]["path"])
+        except pygame.error as e:
+            print(f"Music error ({name}): {e}")
+            self.current = None
+            return False
+        self.current = name
+        self._apply_volume()
+        pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+        return True
@@ -0,0 +1,297 @@
+"""Two-player rollback netplay over UDP.
+
+Both peers run the same deterministic game and send each other nothing but
+their inputs. Neither waits for the other's input before running a frame:
+it guesses (the last input it heard) and keeps a snapshot of every recent
+frame. When the real input turns up and differs from the guess, the game is
+put back to that frame and re-simulated up to the present, so a round trip
+of several frames shows up as a short correction rather than input lag.
+
+The game handed to RollbackSession.start() provides:
+
+    save_state() -> state   a snapshot of everything step() reads or writes
+    load_state(state)       put a snapshot back
+    step(inputs)            run one frame; inputs[i] is player i's input byte
+"""
+import contextlib
+import heapq
+import random
+import socket
+import struct
+import time
+
+MAGIC = b"RAnp"
+HELLO = 1
+INPUTS = 2
+
+# magic, kind, seed
+HELLO_PACKET = struct.Struct("<4sBI")
+# magic, kind, sender's frame, last of our frames it has, its frame advantage, first input's frame
+INPUTS_HEADER = struct.Struct("<4sBiihi")
+MAX_INPUTS = 64  # Inputs carried by one packet
+
+
+class UdpLink:
+    """A non-blocking UDP socket that talks to one peer.
+
+    The joining side is given the host's address; the host learns its peer
+    from the first datagram that arrives.
+    """
+
+    def __init__(self, port=0, peer=None, bind="0.0.0.0"):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((bind, port))
+        self.sock.setblocking(False)
+        self.peer = peer
+
+    @property
+    def address(self):
+        return self.sock.getsockname()
+
+    def send(self, data):
+        if self.peer is None:
+            return
+        try:
+            self.sock.sendto(data, self.peer)
+        except OSError as e:
+            print(f"Netplay send failed: {e}")
+
+    def receive(self):
+        """Every datagram from the peer that is waiting, oldest first."""
+        packets = []
+        while True:
+            try:
+                data, address = self.sock.recvfrom(2048)
+            except BlockingIOError:
+                return packets
+            except ConnectionResetError:
+                continue  # Windows reports an earlier send to a closed port here
+            if self.peer is None:
+                self.peer = address
+            if address == self.peer:
+                packets.append(data)
+
+    def close(self):
+        self.sock.close()
+
+
+class LossyLink:
+    """Wraps a link to delay, jitter and drop what it sends, for testing locally.
+
+    Each datagram is held for latency_ms plus up to jitter_ms, or dropped
+    with probability loss. Held datagrams go out during later send() and
+    receive() calls, which a session makes every frame. clock returns
+    seconds; a test can pass its own to run faster than real time.
+    """
+
+    def __init__(self, link, latency_ms=0, jitter_ms=0, loss=0.0, seed=None, clock=time.perf_counter):
+        self.link = link
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.loss = loss
+        self.random = random.Random(seed)
+        self.clock = clock
+        self.held = []  # Heap of (due, sequence, datagram)
+        self.sequence = 0
+        self.dropped = 0
+
+    def send(self, data):
+        if self.random.random() < self.loss:
+            self.dropped += 1
+        else:
+            due = self.clock() + self.latency + self.random.uniform(0, self.jitter)
+            heapq.heappush(self.held, (due, self.sequence, data))
+            self.sequence += 1
+        self.flush()
+
+    def flush(self):
+        now = self.clock()
+        while self.held and self.held[0][0] <= now:
+            self.link.send(heapq.heappop(self.held)[2])
+
+    def receive(self):
+        self.flush()
+        return self.link.receive()
+
+    def close(self):
+        self.link.close()
+
+
+class RollbackSession:
+    """One side of a two-player game kept in step by rollback.
+
+    player is 0 on the host and 1 on the side that joins. Our input for a
+    frame is scheduled input_delay frames ahead, which gives it that long
+    to reach the peer before anything needs correcting. Every packet
+    repeats all the inputs the peer hasn't acknowledged, so a lost packet
+    only costs the wait for the next one.
+
+    A peer never runs more than max_rollback frames past the last frame it
+    has both inputs for; that bounds the work of a rollback and the
+    snapshots kept for it. The side that is ahead of the other also idles a
+    frame now and then, so neither ends up doing all the correcting.
+    quiet is a context manager the re-simulation runs inside, e.g. to
+    silence the sounds of frames that have already been heard.
+    """
+
+    def __init__(self, link, player, seed=None, input_delay=2, max_rollback=8, quiet=None,
+                 clock=time.perf_counter):
+        self.link = link
+        self.player = player
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.quiet = quiet or contextlib.nullcontext
+        self.clock = clock
+        # The host picks the seed and hands it over with its hello
+        if player == 0 and seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed if player == 0 else None
+        self.joined = False
+        self.last_heard = clock()
+
+        self.game = None
+        self.frame = 0  # Next frame to simulate
+        # Neither side has input for the first input_delay frames, so both use none
+        self.local = dict.fromkeys(range(input_delay), 0)
+        self.remote = dict.fromkeys(range(input_delay), 0)
+        self.queued = input_delay - 1  # Last frame we have our own input for
+        self.confirmed = input_delay  # First frame whose remote input hasn't arrived
+        self.acked = input_delay - 1  # Last of our inputs the peer has
+        self.guesses = {}  # frame -> remote input guessed for a frame already simulated
+        self.rollback_from = None  # Earliest frame simulated with a wrong guess
+        self.snapshots = [(None, None)] * (max_rollback + 2)  # frame % size -> (frame, state)
+        self.pruned_local = self.pruned_remote = 0
+
+        self.remote_frame = 0
+        self.remote_advantage = 0
+        self.frames_since_wait = 0
+
+        # Counters for the status line and benchmarks
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.waits = 0
+
+    def connect(self):
+        """Run one step of the handshake; True once both sides are in and seed is set."""
+        if self.player == 1 and not self.joined:
+            self.link.send(HELLO_PACKET.pack(MAGIC, HELLO, 0))
+        self.poll()
+        return self.joined
+
+    def start(self, game):
+        """Begin simulating game, built by both sides from the shared seed."""
+        self.game = game
+
+    def silence(self):
+        """Seconds since anything arrived from the peer."""
+        return self.clock() - self.last_heard
+
+    def advance(self, local_input):
+        """Run the next frame with this side's input; False if it had to wait instead."""
+        self.poll()
+        if self.rollback_from is not None:
+            self.rollback()
+        if self.must_wait():
+            self.waits += 1
+            self.frames_since_wait = 0
+            self.send()
+            return False
+
+        self.queued = self.frame + self.input_delay
+        self.local[self.queued] = local_input
+        self.send()
+        self.run(self.frame)
+        self.frame += 1
+        self.frames_since_wait += 1
+        self.prune()
+        return True
+
+    def must_wait(self):
+        # Running further ahead would outgrow the snapshots a rollback needs
+        if self.frame - self.confirmed >= self.max_rollback:
+            return True
+        # GGPO's time sync: the side ahead by a frame or more idles, at most once every 10 frames
+        advantage = self.frame - self.remote_frame
+        return self.frames_since_wait >= 10 and (advantage - self.remote_advantage) / 2 >= 1
+
+    def run(self, frame):
+        """Snapshot the game at frame, then simulate it with the best inputs known."""
+        self.snapshots[frame % len(self.snapshots)] = (frame, self.game.save_state())
+        remote = self.remote.get(frame)
+        if remote is None:
+            remote = self.remote[self.confirmed - 1]
+            self.guesses[frame] = remote
+        local = self.local[frame]
+        self.game.step((local, remote) if self.player == 0 else (remote, local))
+
+    def rollback(self):
+        start, self.rollback_from = self.rollback_from, None
+        saved, state = self.snapshots[start % len(self.snapshots)]
+        if saved != start:
+            raise RuntimeError(f"no snapshot of frame {start} to roll back to")
+        self.game.load_state(state)
+        with self.quiet():
+            for frame in range(start, self.frame):
+                self.run(frame)
+        self.rollbacks += 1
+        self.resimulated += self.frame - start
+
+    def send(self):
+        start = self.acked + 1
+        end = min(self.queued, start + MAX_INPUTS - 1)
+        inputs = bytes(self.local[frame] for frame in range(start, end + 1))
+        advantage = max(-32768, min(32767, self.frame - self.remote_frame))
+        self.link.send(INPUTS_HEADER.pack(MAGIC, INPUTS, self.frame, self.confirmed - 1, advantage, start)
+                       + inputs)
+
+    def poll(self):
+        for data in self.link.receive():
+            if len(data) < 5 or data[:4] != MAGIC:
+                continue
+            self.last_heard = self.clock()
+            kind = data[4]
+            if kind == HELLO and len(data) == HELLO_PACKET.size:
+                self.hello(HELLO_PACKET.unpack(data)[2])
+            elif kind == INPUTS and len(data) >= INPUTS_HEADER.size:
+                self.receive_inputs(data)
+
+    def hello(self, seed):
+        if self.player == 0:
+            # Answered every time: the joining side keeps asking until an answer gets through
+            self.link.send(HELLO_PACKET.pack(MAGIC, HELLO, self.seed))
+            self.joined = True
+        elif not self.joined:
+            self.seed = seed
+            self.joined = True
+
+    def receive_inputs(self, data):
+        _, _, frame, acked, advantage, start = INPUTS_HEADER.unpack_from(data)
+        if frame >= self.remote_frame:  # Packets may arrive out of order
+            self.remote_frame = frame
+            self.remote_advantage = advantage
+        self.acked = max(self.acked, acked)
+        for frame, value in enumerate(data[INPUTS_HEADER.size:], start):
+            if frame < self.confirmed or frame in self.remote:
+                continue
+            self.remote[frame] = value
+            guess = self.guesses.pop(frame, None)
+            if guess is not None and guess != value:
+                if self.rollback_from is None or frame < self.rollback_from:
+                    self.rollback_from = frame
+        while self.confirmed in self.remote:
+            self.confirmed += 1
+
+    def prune(self):
+        # Inputs from before the oldest snapshot can't be needed again;
+        # ours are also kept until the peer has them
+        horizon = min(self.frame, self.confirmed) - len(self.snapshots)
+        while self.pruned_remote < min(horizon, self.confirmed - 1):
+            self.remote.pop(self.pruned_remote, None)
+            self.guesses.pop(self.pruned_remote, None)
+            self.pruned_remote += 1
+        while self.pruned_local < min(horizon, self.acked + 1):
+            self.local.pop(self.pruned_local, None)
+            self.pruned_local += 1
+
+    def close(self):
+        self.link.close()
@@ -0,0 +1,27 @@
+import pygame
+
+_layers = {}  # (size, alpha) -> black surface with that surface alpha
+
+
+def dim_layer(size, alpha):
+    """A full-screen black layer at the given alpha, built once per resolution.
+
+    Surface alpha on an opaque surface blends like a per-pixel SRCALPHA fill
+    but without the extra channel, and nothing is allocated per frame.
+    """
+    key = (tuple(size), alpha)
+    layer = _layers.get(key)
+    if layer is None:
+        # Only the current resolution is worth keeping around
+        for old_key in [k for k in _layers if k[0] != key[0]]:
+            del _layers[old_key]
+        layer = pygame.Surface(size)
+        layer.fill((0, 0, 0))
+        layer.set_alpha(alpha)
+        _layers[key] = layer
+    return layer
+
+
+def dim(surface, alpha):
+    """Darken everything on surface, like a translucent black overlay."""
+    surface.blit(dim_layer(surface.get_size(), alpha), (0, 0))
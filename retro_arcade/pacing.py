@@ -0,0 +1,83 @@
+import os
+import time
+
+import pygame
+
+# Render cap used when the display's refresh rate can't be queried
+DEFAULT_MAX_FPS = int(os.environ.get("RETRO_ARCADE_MAX_FPS", "0")) or None
+
+
+def refresh_rate(default=60):
+    """The current display's refresh rate in Hz, or default if pygame can't tell."""
+    query = getattr(pygame.display, "get_current_refresh_rate", None)
+    try:
+        rate = query() if query is not None else 0
+    except pygame.error:
+        rate = 0
+    return rate or default
+
+
+class FramePacer:
+    """Runs the simulation on a fixed step and paces the frames drawn around it.
+
+    Game logic advances in whole steps of 1000 / step_hz milliseconds, so
+    speeds and timers mean the same thing on every machine. Each frame,
+    steps() reports how many steps of real time have gone by: two or three
+    on a cabinet that can only draw 30 FPS, none on some frames of a 144Hz
+    display. After a stall it runs at most max_steps and drops the rest
+    instead of spiralling.
+
+    wait() holds each frame to max_fps: it sleeps while there is time to
+    spare, then spins for the last spin_ms, which time.sleep() can
+    overshoot. With vsync the flip already blocks, so it doesn't wait.
+
+    step_hz may be a callable for games whose speed is their tick rate.
+    """
+
+    def __init__(self, step_hz=60, max_fps=None, vsync=False, max_steps=5, spin_ms=2):
+        self.step_hz = step_hz
+        self.max_fps = max_fps or DEFAULT_MAX_FPS or refresh_rate()
+        self.vsync = vsync
+        self.max_steps = max_steps
+        self.spin = spin_ms / 1000
+        self.accumulator = self.step_ms  # The first frame runs one step
+        self.last_time = None
+        self.next_frame = None
+        self.dropped_ms = 0  # Simulation time given up to the catch-up limit
+
+    @property
+    def step_ms(self):
+        step_hz = self.step_hz() if callable(self.step_hz) else self.step_hz
+        return 1000 / step_hz
+
+    def steps(self):
+        """How many fixed steps to simulate this frame."""
+        now = time.perf_counter()
+        if self.last_time is not None:
+            self.accumulator += (now - self.last_time) * 1000
+        self.last_time = now
+
+        step_ms = self.step_ms
+        steps = int(self.accumulator // step_ms)
+        self.accumulator -= steps * step_ms
+        if steps > self.max_steps:
+            self.dropped_ms += (steps - self.max_steps) * step_ms
+            steps = self.max_steps
+        return steps
+
+    def wait(self):
+        """Hold the frame until the next one is due under max_fps."""
+        if self.vsync:
+            return
+        period = 1 / self.max_fps
+        now = time.perf_counter()
+        if self.next_frame is None or now - self.next_frame > period:
+            # First frame, or we fell a whole frame behind: don't rush to catch up
+            self.next_frame = now
+        self.next_frame += period
+
+        remaining = self.next_frame - now
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < self.next_frame:
+            pass
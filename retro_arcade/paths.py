@@ -0,0 +1,23 @@
+import os
+import platform
+import sys
+
+
+def data_path(base_file, filename):
+    """Bundled read-only data: PyInstaller's unpack dir when frozen, else next to base_file."""
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.abspath(base_file))
+    return os.path.join(base_path, filename)
+
+
+def writable_path(app_name, filename):
+    """Per-user save location: %APPDATA%/<app_name> on Windows, ~/.<app_name> elsewhere."""
+    if platform.system() == "Windows":
+        save_dir = os.path.join(os.getenv('APPDATA'), app_name)
+    else:  # Linux/Mac
+        save_dir = os.path.join(os.path.expanduser("~"), '.' + app_name.lower())
+
+    os.makedirs(save_dir, exist_ok=True)
+    return os.path.join(save_dir, filename)
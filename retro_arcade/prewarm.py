@@ -0,0 +1,20 @@
+import sys
+
+
+def wait_for_launch():
+    """Park a pre-warmed game until the launcher activates it.
+
+    The launcher can start a game with --prewarm so pygame is imported and the
+    sounds are loaded before the player picks it. Call this after that work and
+    before the window is created: it reports "ready" on stdout and blocks until
+    the launcher writes "go". Without --prewarm it returns immediately.
+    """
+    if "--prewarm" not in sys.argv[1:]:
+        return
+    if sys.stdin is None or sys.stdout is None:
+        return  # No pipe to the launcher, just start normally
+
+    print("ready", flush=True)
+    if sys.stdin.readline().strip() != "go":
+        # The launcher went away without starting us
+        sys.exit(0)
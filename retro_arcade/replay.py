@@ -0,0 +1,48 @@
+import base64
+from itertools import chain, islice
+
+# byte -> its four 2-bit turns, lowest bits first
+_UNPACK = [tuple((byte >> shift) & 3 for shift in (0, 2, 4, 6)) for byte in range(256)]
+
+
+class TurnLog:
+    """A run's moves as one 2-bit turn per tick, packed four to a byte.
+
+    A turn is the change of heading since the tick before, in clockwise
+    quarter turns: 0 straight on, 1 right, 3 left. Recording it instead of
+    the direction itself keeps a whole run at a quarter of a byte a tick,
+    and as_text() makes it a base64 string small enough to keep in a
+    leaderboard entry next to the score.
+    """
+
+    def __init__(self, data=b"", ticks=0):
+        self.data = bytearray(data)
+        self.ticks = ticks
+
+    def record(self, turn):
+        shift = (self.ticks & 3) << 1
+        if shift:
+            self.data[-1] |= turn << shift
+        else:
+            self.data.append(turn)
+        self.ticks += 1
+
+    def turns(self):
+        """An iterator over the turns in order.
+
+        Bytes are unpacked one at a time through a lookup table as the
+        iterator is consumed, so a replay can be read a tick at a time
+        alongside the game without ever being expanded in memory.
+        """
+        return islice(chain.from_iterable(map(_UNPACK.__getitem__, self.data)), self.ticks)
+
+    def as_text(self):
+        return base64.b64encode(self.data).decode("ascii")
+
+    @classmethod
+    def from_text(cls, text, ticks):
+        """The log saved by as_text(); raises ValueError if it's malformed."""
+        data = base64.b64decode(text, validate=True)
+        if not 0 <= ticks <= len(data) * 4:
+            raise ValueError(f"{ticks} ticks don't fit in {len(data)} bytes")
+        return cls(data, ticks)
@@ -0,0 +1,138 @@
+import pygame
+
+from retro_arcade import display
+from retro_arcade.overlays import dim
+from retro_arcade.pacing import FramePacer
+
+
+class Scene:
+    """One screen of a game: logos, menus, credits, gameplay.
+
+    handle_event() and update() return None to keep the scene running, or any
+    other value to end it; run_scene() hands that value back to the caller.
+
+    A scene that is not opaque (pause menus, dialogs) only draws on top of
+    whatever was on screen; on a SceneStack that is a frozen snapshot of the
+    scenes underneath, darkened once by the scene's dim alpha.
+    """
+
+    opaque = True
+    dim = 0  # 0-255: how much to darken the frozen background
+    stack = None  # Set by SceneStack.push()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return "quit"
+        return None
+
+    def update(self):
+        return None
+
+    def draw(self, surface):
+        pass
+
+
+def run_scene(scene, screen, fps=60, on_frame=None, pacer=None):
+    """Run a scene until it returns a result.
+
+    fps is the simulation rate: update() runs fps times per second of real
+    time however fast frames are drawn (see FramePacer). It may be a
+    callable for games whose speed is their tick rate. Each frame polls the
+    event queue once, runs the updates that are due, draws and flips.
+    on_frame is called at the start of every frame (e.g. audio.begin_frame).
+    """
+    if pacer is None:
+        pacer = FramePacer(fps, vsync=display.vsync_active)
+    while True:
+        if on_frame is not None:
+            on_frame()
+
+        for event in pygame.event.get():
+            result = scene.handle_event(event)
+            if result is not None:
+                return result
+
+        for _ in range(pacer.steps()):
+            result = scene.update()
+            if result is not None:
+                return result
+
+        scene.draw(screen)
+        pygame.display.flip()
+        pacer.wait()
+
+
+class SceneStack:
+    """Scenes layered on top of each other; only the top one runs.
+
+    Events, update() and draw() go to the top scene alone, so a covered game
+    stops simulating while a menu is open. When a non-opaque scene is pushed
+    the screen underneath is rendered and dimmed once and kept as its
+    background; each frame of the overlay is then a single blit plus the
+    overlay itself.
+
+    The stack is itself a Scene, so run_scene(stack, ...) drives it.
+    """
+
+    def __init__(self, scene=None):
+        self.scenes = []
+        self.backgrounds = []  # Frozen surface under each scene, or None
+        if scene is not None:
+            self.push(scene)
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene):
+        background = None
+        if not scene.opaque and self.scenes:
+            background = self._snapshot(len(self.scenes), scene)
+        scene.stack = self
+        self.scenes.append(scene)
+        self.backgrounds.append(background)
+        return scene
+
+    def pop(self):
+        """Remove the top scene; the one below resumes where it left off."""
+        self.backgrounds.pop()
+        scene = self.scenes.pop()
+        scene.stack = None
+        return scene
+
+    def pop_to(self, scene):
+        """Pop everything above scene."""
+        while self.scenes and self.top is not scene:
+            self.pop()
+
+    def replace(self, scene):
+        self.pop()
+        return self.push(scene)
+
+    def handle_event(self, event):
+        return self.top.handle_event(event)
+
+    def update(self):
+        return self.top.update()
+
+    def draw(self, surface):
+        self._draw_layer(surface, len(self.scenes) - 1)
+
+    def _draw_layer(self, surface, index):
+        background = self.backgrounds[index]
+        if background is not None:
+            if background.get_size() != surface.get_size():
+                # The window was resized or went fullscreen underneath us
+                background = self.backgrounds[index] = self._snapshot(index, self.scenes[index])
+            surface.blit(background, (0, 0))
+        self.scenes[index].draw(surface)
+
+    def _snapshot(self, index, scene):
+        """Render the scenes below index once, dimmed for scene."""
+        surface = pygame.display.get_surface()
+        if index > 0:
+            self._draw_layer(surface, index - 1)
+        background = surface.copy()
+        if scene.dim:
+            dim(background, scene.dim)
+        return background
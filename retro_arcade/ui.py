@@ -0,0 +1,60 @@
+import pygame
+
+from retro_arcade.fonts import get_font
+
+WHITE = (255, 255, 255)
+
+
+class Button:
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.is_hovered = False
+        self.font = get_font(36)
+        # The label is only re-rendered when its text or colour changes
+        self._label = None
+        self._label_key = None
+
+    def label_text(self):
+        return self.text
+
+    def render_label(self):
+        key = (self.label_text(), self.text_color)
+        if key != self._label_key:
+            self._label = self.font.render(key[0], True, self.text_color)
+            self._label_key = key
+        return self._label
+
+    def draw(self, surface):
+        color = self.hover_color if self.is_hovered else self.color
+        pygame.draw.rect(surface, color, self.rect, border_radius=5)
+        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=5)
+
+        text_surf = self.render_label()
+        surface.blit(text_surf, text_surf.get_rect(center=self.rect.center))
+
+    def check_hover(self, pos):
+        self.is_hovered = self.rect.collidepoint(pos)
+        return self.is_hovered
+
+    def is_clicked(self, pos, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            return self.rect.collidepoint(pos)
+        return False
+
+
+class ToggleButton(Button):
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color=WHITE, is_on=False):
+        super().__init__(x, y, width, height, text, color, hover_color, text_color)
+        self.is_on = is_on
+
+    def label_text(self):
+        status = "ON" if self.is_on else "OFF"
+        return f"{self.text}: {status}"
+
+    def toggle(self):
+        self.is_on = not self.is_on
+        return self.is_on